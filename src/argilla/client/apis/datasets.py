@@ -180,6 +180,7 @@ class Datasets(AbstractApi):
         sort: Optional[List[Tuple[str, str]]] = None,
         id_from: Optional[str] = None,
         batch_size: int = 250,
+        highlight: bool = False,
         **query,
     ) -> Iterable[dict]:
         """
@@ -197,6 +198,8 @@ class Datasets(AbstractApi):
                 can be used to load using batches.
             batch_size: If provided, load `batch_size` samples per request. A lower batch
                 size may help avoid timeouts.
+            highlight: If True, the `search_keywords` matching the query text are computed
+                for each record. Defaults to False, since it slows down the scan.
 
         Returns:
             An iterable of raw object containing per-record info
@@ -213,6 +216,8 @@ class Datasets(AbstractApi):
             "fields": list(projection) if projection else ["id"],
             "query": query,
         }
+        if highlight:
+            request["highlight"] = True
 
         if sort is not None:
             try:
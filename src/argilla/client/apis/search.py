@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import dataclasses
+from datetime import datetime
 from typing import List, Optional
 
 from argilla.client.apis import AbstractApi
@@ -36,6 +37,13 @@ class SearchResults:
     records: List[Record]
 
 
+@dataclasses.dataclass
+class RecordsWatermark:
+    total: int
+
+    last_updated: Optional[datetime] = None
+
+
 class Search(AbstractApi):
     _API_URL_PATTERN = "/api/datasets/{name}/{task}:search"
 
@@ -59,14 +67,7 @@ class Search(AbstractApi):
             An instance of ``SearchResults`` class containing the search results
         """
 
-        if task == TaskType.text_classification:
-            record_class = TextClassificationRecord
-        elif task == TaskType.token_classification:
-            record_class = TokenClassificationRecord
-        elif task == TaskType.text2text:
-            record_class = Text2TextRecord
-        else:
-            raise ValueError(f"Task {task} not supported")
+        record_class = self._record_class(task)
 
         url = self._API_URL_PATTERN.format(name=name, task=task)
         if size:
@@ -82,3 +83,43 @@ class Search(AbstractApi):
             total=response["total"],
             records=[record_class.parse_obj(r).to_client() for r in response["records"]],
         )
+
+    def records_watermark(self, name: str, task: TaskType, **query) -> RecordsWatermark:
+        """
+        Counts the records matching a query, and finds the most recent ``last_updated`` among them, as stamped
+        by the server
+
+        Args:
+            name: The dataset name
+            task: The dataset task type
+            query: The search query
+
+        Returns:
+            An instance of ``RecordsWatermark`` class with the total and the most recent ``last_updated``
+        """
+        record_class = self._record_class(task)
+        url = self._API_URL_PATTERN.format(name=name, task=task) + "?limit=1"
+
+        response = self.http_client.post(
+            path=url,
+            json={
+                "query": self._parse_query(query=query),
+                "sort": [{"id": "last_updated", "order": "desc"}],
+            },
+        )
+
+        records = response["records"]
+        return RecordsWatermark(
+            total=response["total"],
+            last_updated=record_class.parse_obj(records[0]).last_updated if records else None,
+        )
+
+    @staticmethod
+    def _record_class(task: TaskType):
+        if task == TaskType.text_classification:
+            return TextClassificationRecord
+        elif task == TaskType.token_classification:
+            return TokenClassificationRecord
+        elif task == TaskType.text2text:
+            return Text2TextRecord
+        raise ValueError(f"Task {task} not supported")
@@ -781,6 +781,8 @@ class Argilla:
             sort=sort,
             id_from=id_from,
             batch_size=batch_size,
+            # Search keywords are only found for query texts
+            highlight=bool(query),
             # Query
             query_text=query,
             ids=ids,
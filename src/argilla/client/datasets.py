@@ -31,6 +31,7 @@ from argilla.client.models import (
 )
 from argilla.client.sdk.datasets.models import TaskType
 from argilla.utils.dependency import require_dependencies, requires_dependencies
+from argilla.utils.spacy_utils import docbin_from_examples
 from argilla.utils.span_utils import SpanUtils
 
 if TYPE_CHECKING:
@@ -338,6 +339,7 @@ class DatasetBase:
         train_size: Optional[float] = 1,
         test_size: Optional[float] = None,
         seed: Optional[int] = None,
+        n_process: int = 1,
     ) -> Union[
         "datasets.Dataset",
         "spacy.tokens.DocBin",
@@ -361,6 +363,7 @@ class DatasetBase:
             test_size: The size of the test set. If float, should be between 0.0 and 1.0 and represent the
                 proportion of the dataset to include in the test split.
             seed: Random state.
+            n_process: The number of processes used to build the spaCy DocBin. (Only for spacy framework) Default: 1
 
         Returns:
             A datasets Dataset with a *ner_tags* or a *label* column and and several *inputs* columns.
@@ -474,8 +477,12 @@ class DatasetBase:
                     random_state=seed,
                 )
                 if framework in [Framework.SPACY, Framework.SPACY_TRANSFORMERS]:
-                    train_docbin = self._prepare_for_training_with_spacy(nlp=lang, records=records_train)
-                    test_docbin = self._prepare_for_training_with_spacy(nlp=lang, records=records_test)
+                    train_docbin = self._prepare_for_training_with_spacy(
+                        nlp=lang, records=records_train, n_process=n_process
+                    )
+                    test_docbin = self._prepare_for_training_with_spacy(
+                        nlp=lang, records=records_test, n_process=n_process
+                    )
                     return train_docbin, test_docbin
                 elif framework is Framework.SPARK_NLP:
                     train_df = self._prepare_for_training_with_spark_nlp(records_train)
@@ -487,7 +494,9 @@ class DatasetBase:
                     return train_jsonl, test_jsonl
             else:
                 if framework in [Framework.SPACY, Framework.SPACY_TRANSFORMERS]:
-                    return self._prepare_for_training_with_spacy(nlp=lang, records=shuffled_records)
+                    return self._prepare_for_training_with_spacy(
+                        nlp=lang, records=shuffled_records, n_process=n_process
+                    )
                 elif framework is Framework.SPARK_NLP:
                     return self._prepare_for_training_with_spark_nlp(records=shuffled_records)
                 elif framework is Framework.OPENAI:
@@ -837,14 +846,12 @@ class DatasetForTextClassification(DatasetBase):
         return ds
 
     @requires_dependencies("spacy")
-    def _prepare_for_training_with_spacy(self, nlp: "spacy.Language", records: List[Record]) -> "spacy.tokens.DocBin":
-        from spacy.tokens import DocBin
-
-        db = DocBin(store_user_data=True)
+    def _prepare_for_training_with_spacy(
+        self, nlp: "spacy.Language", records: List[Record], n_process: int = 1
+    ) -> "spacy.tokens.DocBin":
         all_labels = self._verify_all_labels()
 
-        # Creating the DocBin object as in https://spacy.io/usage/training#training-data
-
+        examples = []
         for record in records:
             if record.annotation is None:
                 continue
@@ -855,8 +862,6 @@ class DatasetForTextClassification(DatasetBase):
                 text = record.inputs["text"]
             else:
                 text = ", ".join(f"{key}: {value}" for key, value in record.inputs.items())
-            doc = nlp.make_doc(text)
-            doc.user_data["id"] = record.id
 
             cats = dict.fromkeys(all_labels, 0)
 
@@ -866,10 +871,9 @@ class DatasetForTextClassification(DatasetBase):
             else:
                 cats[record.annotation] = 1
 
-            doc.cats = cats
-            db.add(doc)
+            examples.append((text, {"user_data": {"id": record.id}, "cats": cats}))
 
-        return db
+        return docbin_from_examples(nlp, examples, n_process=n_process)
 
     def _prepare_for_training_with_spark_nlp(self, records: List[Record]) -> "pandas.DataFrame":
         if records[0].multi_label:
@@ -1134,37 +1138,15 @@ class DatasetForTokenClassification(DatasetBase):
         return ds
 
     @requires_dependencies("spacy")
-    def _prepare_for_training_with_spacy(self, nlp: "spacy.Language", records: List[Record]) -> "spacy.tokens.DocBin":
-        from spacy.tokens import DocBin
-
-        db = DocBin(store_user_data=True)
-
-        # Creating the DocBin object as in https://spacy.io/usage/training#training-data
-        for record in records:
-            if record.annotation is None:
-                continue
-
-            doc = nlp.make_doc(record.text)
-            doc.user_data["id"] = record.id
-            entities = []
-
-            for anno in record.annotation:
-                span = doc.char_span(anno[1], anno[2], label=anno[0])
-                # There is a misalignment between record tokenization and spaCy tokenization
-                if span is None:
-                    # TODO(@dcfidalgo): Do we want to warn and continue or should we stop the training set generation?
-                    raise ValueError(
-                        "The following annotation does not align with the tokens"
-                        " produced by the provided spacy language model:"
-                        f" {(anno[0], record.text[anno[1]:anno[2]])}, {list(doc)}"
-                    )
-                else:
-                    entities.append(span)
-
-            doc.ents = entities
-            db.add(doc)
-
-        return db
+    def _prepare_for_training_with_spacy(
+        self, nlp: "spacy.Language", records: List[Record], n_process: int = 1
+    ) -> "spacy.tokens.DocBin":
+        examples = [
+            (record.text, {"user_data": {"id": record.id}, "ents": record.annotation})
+            for record in records
+            if record.annotation is not None
+        ]
+        return docbin_from_examples(nlp, examples, n_process=n_process)
 
     def _prepare_for_training_with_spark_nlp(self, records: List[Record]) -> "pandas.DataFrame":
         for record in records:
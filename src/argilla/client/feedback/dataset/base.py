@@ -170,7 +170,9 @@ class FeedbackDatasetBase(ABC, Generic[R], metaclass=ABCMeta):
                 `datasets`.
 
         Returns:
-            The `FeedbackDataset.records` formatted as a `datasets.Dataset` object.
+            The `FeedbackDataset.records` formatted as a `datasets.Dataset` object, memory-mapped from an Arrow
+            file under the `argilla` directory of the `datasets` cache, which is removed once the returned
+            `datasets.Dataset` is garbage collected.
 
         Raises:
             ValueError: if the provided format is not supported.
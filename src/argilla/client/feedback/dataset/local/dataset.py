@@ -437,6 +437,8 @@ class FeedbackDataset(
         test_size: Optional[float] = None,
         seed: Optional[int] = None,
         lang: Optional[str] = None,
+        n_process: int = 1,
+        num_proc: Optional[int] = None,
     ) -> Any:
         """
         Prepares the dataset for training for a specific training framework and NLP task by splitting the dataset into train and test sets.
@@ -450,6 +452,9 @@ class FeedbackDataset(
             test_size: the size of the test set. If `None`, the whole dataset will be used for testing.
             seed: the seed to use for splitting the dataset into train and test sets.
             lang: the spaCy language to use for training. If `None`, the language of the dataset will be used.
+            n_process: the number of processes used to tokenize the texts with the spaCy `lang`. Defaults to 1.
+            num_proc: the number of processes used to apply the `formatting_func` of the `task`, if any, with
+                `datasets.Dataset.map`. If `None`, it is applied in the current process. Defaults to `None`.
         """
         if isinstance(framework, str):
             framework = Framework(framework)
@@ -499,7 +504,15 @@ class FeedbackDataset(
         ):
             raise ValueError(f"Training data {type(task)} is not supported yet")
 
-        return task.prepare_for_training(framework=framework, dataset=self, train_size=train_size, seed=seed, lang=lang)
+        return task.prepare_for_training(
+            framework=framework,
+            dataset=self,
+            train_size=train_size,
+            seed=seed,
+            lang=lang,
+            n_process=n_process,
+            num_proc=num_proc,
+        )
 
     def update_records(self, records: Union["FeedbackRecord", List["FeedbackRecord"]]) -> None:
         warnings.warn(
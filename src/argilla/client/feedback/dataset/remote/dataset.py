@@ -999,6 +999,8 @@ class RemoteFeedbackDataset(FeedbackDatasetBase[RemoteFeedbackRecord], MetricsMi
         test_size: Optional[float] = None,
         seed: Optional[int] = None,
         lang: Optional[str] = None,
+        n_process: int = 1,
+        num_proc: Optional[int] = None,
     ) -> Any:
         """
         Prepares the dataset for training for a specific training framework and NLP task by splitting the dataset into train and test sets.
@@ -1012,6 +1014,9 @@ class RemoteFeedbackDataset(FeedbackDatasetBase[RemoteFeedbackRecord], MetricsMi
             test_size: the size of the test set. If `None`, the whole dataset will be used for testing.
             seed: the seed to use for splitting the dataset into train and test sets.
             lang: the spaCy language to use for training. If `None`, the language of the dataset will be used.
+            n_process: the number of processes used to tokenize the texts with the spaCy `lang`. Defaults to 1.
+            num_proc: the number of processes used to apply the `formatting_func` of the `task`, if any, with
+                `datasets.Dataset.map`. If `None`, it is applied in the current process. Defaults to `None`.
         """
         warnings.warn(
             (
@@ -1029,6 +1034,8 @@ class RemoteFeedbackDataset(FeedbackDatasetBase[RemoteFeedbackRecord], MetricsMi
             test_size=test_size,
             seed=seed,
             lang=lang,
+            n_process=n_process,
+            num_proc=num_proc,
         )
 
     def push_to_argilla(
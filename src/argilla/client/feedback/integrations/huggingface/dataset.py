@@ -14,12 +14,14 @@
 
 import json
 import logging
+import os
 import tempfile
 import warnings
-from typing import TYPE_CHECKING, Any, Optional, Type, Union
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Type, Union
 
 from packaging.version import parse as parse_version
-from tqdm import trange
+from tqdm import tqdm
 
 from argilla.client.feedback.constants import FIELD_TYPE_TO_PYTHON_TYPE
 from argilla.client.feedback.schemas.enums import QuestionTypes
@@ -28,7 +30,7 @@ from argilla.client.feedback.schemas.remote.records import RemoteFeedbackRecord
 from argilla.utils.dependency import requires_dependencies
 
 if TYPE_CHECKING:
-    from datasets import Dataset
+    from datasets import Dataset, Features
 
     from argilla.client.feedback.dataset.local.dataset import FeedbackDataset
     from argilla.client.feedback.dataset.remote.dataset import RemoteFeedbackDataset
@@ -36,12 +38,29 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _remove_file(path: str) -> None:
+    """Removes a file, unless it's already gone or can't be removed, e.g. while memory-mapped on Windows."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class HuggingFaceDatasetMixin:
     @staticmethod
     @requires_dependencies("datasets")
     def _huggingface_format(dataset: Union["FeedbackDataset", "RemoteFeedbackDataset"]) -> "Dataset":
         """Formats either a `FeedbackDataset` or a `RemoteFeedbackDataset` as a `datasets.Dataset` object.
 
+        The records are written in batches to an Arrow file, which the `datasets.Dataset` is memory-mapped
+        from, so that the memory used doesn't grow with the number of records. The records of a
+        `RemoteFeedbackDataset` are fetched from Argilla in batches while being written. Each call writes
+        its own `argilla-*.arrow` file under the `argilla` directory of the `datasets` cache, i.e.
+        `HF_DATASETS_CACHE`, which is removed once the returned `datasets.Dataset` is garbage collected or
+        the interpreter exits. Datasets derived from it, e.g. with `select`, keep the records memory-mapped
+        after that, but re-open the file when pickled, e.g. by `map` with `num_proc`, so the returned
+        `datasets.Dataset` should be kept referenced meanwhile, or saved with `save_to_disk`.
+
         Args:
             dataset: The `FeedbackDataset` or `RemoteFeedbackDataset` to format as `datasets.Dataset`.
 
@@ -54,9 +73,48 @@ class HuggingFaceDatasetMixin:
             >>> dataset = FeedbackDataset(...) or RemoteFeedbackDataset(...)
             >>> huggingface_dataset = HuggingFaceDatasetMixin._huggingface_format(dataset)
         """
-        from datasets import Dataset, Features, Sequence, Value
+        from datasets import Dataset, DatasetInfo
+        from datasets import config as datasets_config
+        from datasets.arrow_writer import ArrowWriter
+
+        features = HuggingFaceDatasetMixin._huggingface_features(dataset)
+
+        cache_dir = os.path.join(str(datasets_config.HF_DATASETS_CACHE), "argilla")
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, prefix="argilla-", suffix=".arrow", delete=False) as f:
+            cache_file = f.name
+
+        try:
+            writer = ArrowWriter(features=features, path=cache_file)
+            try:
+                for example in HuggingFaceDatasetMixin._huggingface_examples(dataset):
+                    writer.write(features.encode_example(example))
+                writer.finalize()
+            finally:
+                writer.close()
+            # the features are passed explicitly, since their `id`s are not kept in the Arrow schema
+            hf_dataset = Dataset.from_file(cache_file, info=DatasetInfo(features=features))
+        except BaseException:
+            _remove_file(cache_file)
+            raise
+
+        weakref.finalize(hf_dataset, _remove_file, cache_file)
+        return hf_dataset
 
-        hf_dataset, hf_features = {}, {}
+    @staticmethod
+    @requires_dependencies("datasets")
+    def _huggingface_features(dataset: Union["FeedbackDataset", "RemoteFeedbackDataset"]) -> "Features":
+        """Builds the `datasets.Features` for the fields, questions, suggestions, metadata and vectors of a dataset.
+
+        Args:
+            dataset: The `FeedbackDataset` or `RemoteFeedbackDataset` to build the features for.
+
+        Returns:
+            The `datasets.Features` of the dataset formatted with `_huggingface_format`.
+        """
+        from datasets import Features, Sequence, Value
+
+        hf_features = {}
 
         for field in dataset.fields:
             if field.type not in FIELD_TYPE_TO_PYTHON_TYPE.keys():
@@ -65,8 +123,6 @@ class HuggingFaceDatasetMixin:
                     f" only the following types are supported: {list(FIELD_TYPE_TO_PYTHON_TYPE.keys())}"
                 )
             hf_features[field.name] = Value(dtype="string", id="field")
-            if field.name not in hf_dataset:
-                hf_dataset[field.name] = []
 
         for question in dataset.questions:
             if question.type in [QuestionTypes.text, QuestionTypes.label_selection]:
@@ -91,41 +147,49 @@ class HuggingFaceDatasetMixin:
                     "status": Value(dtype="string", id="question"),
                 }
             ]
-            if question.name not in hf_dataset:
-                hf_dataset[question.name] = []
 
             value.id = "suggestion"
             hf_features[f"{question.name}-suggestion"] = value
-            if f"{question.name}-suggestion" not in hf_dataset:
-                hf_dataset[f"{question.name}-suggestion"] = []
 
             hf_features[f"{question.name}-suggestion-metadata"] = {
                 "type": Value(dtype="string", id="suggestion-metadata"),
                 "score": Value(dtype="float32", id="suggestion-metadata"),
                 "agent": Value(dtype="string", id="suggestion-metadata"),
             }
-            if f"{question.name}-suggestion-metadata" not in hf_dataset:
-                hf_dataset[f"{question.name}-suggestion-metadata"] = []
 
         hf_features["external_id"] = Value(dtype="string", id="external_id")
-        hf_dataset["external_id"] = []
 
         hf_features["metadata"] = Value(dtype="string", id="metadata")
-        hf_dataset["metadata"] = []
 
         vectors_settings = dataset.vectors_settings
         if vectors_settings:
             hf_features["vectors"] = {}
             for vector_settings in vectors_settings:
                 hf_features["vectors"].update({vector_settings.name: Sequence(Value(dtype="float32"), id="vectors")})
-            hf_dataset["vectors"] = []
+
+        return Features(hf_features)
+
+    @staticmethod
+    def _huggingface_examples(
+        dataset: Union["FeedbackDataset", "RemoteFeedbackDataset"],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields the records of a dataset, one by one, as examples matching the `_huggingface_features`.
+
+        Args:
+            dataset: The `FeedbackDataset` or `RemoteFeedbackDataset` to format.
+
+        Yields:
+            A dict per record with the fields, responses, suggestions, metadata and vectors.
+        """
+        vectors_settings = dataset.vectors_settings
 
         for record in dataset.records:
+            example = {}
             for field in dataset.fields:
-                hf_dataset[field.name].append(record.fields.get(field.name, None))
+                example[field.name] = record.fields.get(field.name, None)
             for question in dataset.questions:
                 if not record.responses:
-                    hf_dataset[question.name].append([])
+                    example[question.name] = []
                 else:
                     responses = []
                     for response in record.responses:
@@ -142,7 +206,7 @@ class HuggingFaceDatasetMixin:
                             value = response.values[question.name].value
                         formatted_response["value"] = value
                         responses.append(formatted_response)
-                    hf_dataset[question.name].append(responses)
+                    example[question.name] = responses
 
                 suggestion_value, suggestion_metadata = None, {"type": None, "score": None, "agent": None}
                 if record.suggestions:
@@ -155,19 +219,19 @@ class HuggingFaceDatasetMixin:
                                 "agent": suggestion.agent,
                             }
                             break
-                hf_dataset[f"{question.name}-suggestion"].append(suggestion_value)
-                hf_dataset[f"{question.name}-suggestion-metadata"].append(suggestion_metadata)
+                example[f"{question.name}-suggestion"] = suggestion_value
+                example[f"{question.name}-suggestion-metadata"] = suggestion_metadata
 
-            hf_dataset["metadata"].append(json.dumps(record.metadata) if record.metadata else {})
-            hf_dataset["external_id"].append(record.external_id or None)
+            example["metadata"] = json.dumps(record.metadata) if record.metadata else {}
+            example["external_id"] = record.external_id or None
 
             if vectors_settings:
                 vectors = {}
                 for vector_settings in vectors_settings:
                     vectors.update({vector_settings.name: record.vectors.get(vector_settings.name, None)})
-                hf_dataset["vectors"].append(vectors)
+                example["vectors"] = vectors
 
-        return Dataset.from_dict(hf_dataset, features=Features(hf_features))
+            yield example
 
     @requires_dependencies(["huggingface_hub", "datasets"])
     def push_to_huggingface(
@@ -187,7 +251,8 @@ class HuggingFaceDatasetMixin:
             generate_card: whether to generate a dataset card for the `FeedbackDataset` in the Hugging Face Hub. Defaults
                 to `True`.
             *args: the args to pass to `datasets.Dataset.push_to_hub`.
-            **kwargs: the kwargs to pass to `datasets.Dataset.push_to_hub`.
+            **kwargs: the kwargs to pass to `datasets.Dataset.push_to_hub`, e.g. `max_shard_size` to
+                control the size of the Parquet shards uploaded to the Hugging Face Hub.
         """
         import huggingface_hub
         from huggingface_hub import HfApi
@@ -267,13 +332,21 @@ class HuggingFaceDatasetMixin:
     @classmethod
     @requires_dependencies(["huggingface_hub", "datasets"])
     def from_huggingface(
-        cls: Type["FeedbackDataset"], repo_id: str, show_progress: bool = True, *args: Any, **kwargs: Any
+        cls: Type["FeedbackDataset"],
+        repo_id: str,
+        show_progress: bool = True,
+        *args: Any,
+        batch_size: int = 1000,
+        **kwargs: Any,
     ) -> "FeedbackDataset":
         """Loads a `FeedbackDataset` from the Hugging Face Hub.
 
         Args:
             repo_id: the ID of the Hugging Face Hub repo to load the `FeedbackDataset` from.
+            show_progress: whether to show a progress bar while parsing the records. Defaults to `True`.
             *args: the args to pass to `datasets.Dataset.load_from_hub`.
+            batch_size: the number of rows read at once from the `datasets.Dataset` and parsed into records
+                before adding them to the `FeedbackDataset`. Defaults to 1000.
             **kwargs: the kwargs to pass to `datasets.Dataset.load_from_hub`.
 
         Returns:
@@ -363,101 +436,112 @@ class HuggingFaceDatasetMixin:
                 )
             hfds = hfds[list(hfds.keys())[0]]
 
-        records = []
-        for index in trange(0, len(hfds), desc="Parsing records", disable=not show_progress):
-            responses = {}
-            suggestions = []
-            user_without_id = False
-            for question in dataset.questions:
-                if hfds[index][question.name] is not None and len(hfds[index][question.name]) > 0:
-                    if (
-                        len(
-                            [None for response in hfds[index][question.name] if response["user_id"] is None]
-                            if isinstance(hfds[index][question.name], list)
-                            else [None for user_id in hfds[index][question.name]["user_id"] if user_id is None]
-                        )
-                        > 1
+        with tqdm(total=len(hfds), desc="Parsing records", disable=not show_progress) as progress_bar:
+            for start in range(0, len(hfds), batch_size):
+                # read each column of the batch at once, instead of materializing each row per column accessed
+                batch = hfds[start : start + batch_size]
+                columns = list(batch.keys())
+                rows = [dict(zip(columns, values)) for values in zip(*batch.values())]
+                dataset.add_records([cls._huggingface_row_to_record(dataset, row) for row in rows])
+                progress_bar.update(len(rows))
+        del hfds
+
+        return dataset
+
+    @staticmethod
+    def _huggingface_row_to_record(dataset: "FeedbackDataset", row: Dict[str, Any]) -> FeedbackRecord:
+        """Parses a row of a `datasets.Dataset` formatted with `_huggingface_format` into a `FeedbackRecord`.
+
+        Args:
+            dataset: the `FeedbackDataset` the record belongs to.
+            row: the row with the fields, responses, suggestions, metadata and vectors of the record.
+
+        Returns:
+            The `FeedbackRecord` for the row.
+        """
+        responses = {}
+        suggestions = []
+        user_without_id = False
+        for question in dataset.questions:
+            if row[question.name] is not None and len(row[question.name]) > 0:
+                if (
+                    len(
+                        [None for response in row[question.name] if response["user_id"] is None]
+                        if isinstance(row[question.name], list)
+                        else [None for user_id in row[question.name]["user_id"] if user_id is None]
+                    )
+                    > 1
+                ):
+                    warnings.warn(
+                        "Found more than one user without ID in the dataset, so just the"
+                        " responses for the first user without ID will be used, the rest"
+                        " will be discarded."
+                    )
+
+                # Here for backwards compatibility
+                original_responses = []
+                if isinstance(row[question.name], list):
+                    original_responses = row[question.name]
+                else:
+                    for user_id, value, status in zip(
+                        row[question.name]["user_id"],
+                        row[question.name]["value"],
+                        row[question.name]["status"],
                     ):
-                        warnings.warn(
-                            "Found more than one user without ID in the dataset, so just the"
-                            " responses for the first user without ID will be used, the rest"
-                            " will be discarded."
-                        )
-
-                    # Here for backwards compatibility
-                    original_responses = []
-                    if isinstance(hfds[index][question.name], list):
-                        original_responses = hfds[index][question.name]
-                    else:
-                        for user_id, value, status in zip(
-                            hfds[index][question.name]["user_id"],
-                            hfds[index][question.name]["value"],
-                            hfds[index][question.name]["status"],
-                        ):
-                            original_responses.append({"user_id": user_id, "value": value, "status": status})
-
-                    user_without_id_response = False
-                    for response in original_responses:
-                        if user_without_id_response:
-                            continue
-                        user_id = response["user_id"]
-                        status = response["status"]
-                        if user_id is None:
-                            if not user_without_id:
-                                user_without_id = True
-                                responses["user_without_id"] = {
-                                    "user_id": user_id,
-                                    "status": status,
-                                    "values": {},
-                                }
-                                user_without_id_response = True
-                        if user_id is not None and user_id not in responses:
-                            responses[user_id] = {
+                        original_responses.append({"user_id": user_id, "value": value, "status": status})
+
+                user_without_id_response = False
+                for response in original_responses:
+                    if user_without_id_response:
+                        continue
+                    user_id = response["user_id"]
+                    status = response["status"]
+                    if user_id is None:
+                        if not user_without_id:
+                            user_without_id = True
+                            responses["user_without_id"] = {
                                 "user_id": user_id,
                                 "status": status,
                                 "values": {},
                             }
-                        value = response["value"]
-                        if value is not None:
-                            if question.type == QuestionTypes.ranking:
-                                value = [{"rank": r, "value": v} for r, v in zip(value["rank"], value["value"])]
-                            responses[user_id or "user_without_id"]["values"].update({question.name: {"value": value}})
-
-                # First if-condition is here for backwards compatibility
-                if (
-                    f"{question.name}-suggestion" in hfds[index]
-                    and hfds[index][f"{question.name}-suggestion"] is not None
-                ):
-                    suggestion = {
-                        "question_name": question.name,
-                        "value": hfds[index][f"{question.name}-suggestion"],
-                    }
-                    if hfds[index][f"{question.name}-suggestion-metadata"] is not None:
-                        suggestion.update(hfds[index][f"{question.name}-suggestion-metadata"])
-                    suggestions.append(suggestion)
-
-            metadata = None
-            if "metadata" in hfds[index] and hfds[index]["metadata"] is not None:
-                metadata = json.loads(hfds[index]["metadata"])
-
-            vectors = {}
-            if "vectors" in hfds[index] and hfds[index]["vectors"]:
-                for vector_settings in dataset.vectors_settings:
-                    if hfds[index]["vectors"].get(vector_settings.name, None) is not None:
-                        vectors.update({vector_settings.name: hfds[index]["vectors"][vector_settings.name]})
-
-            records.append(
-                FeedbackRecord(
-                    fields={field.name: hfds[index][field.name] for field in dataset.fields},
-                    metadata=metadata or {},
-                    responses=list(responses.values()) or [],
-                    suggestions=[suggestion for suggestion in suggestions if suggestion["value"] is not None] or [],
-                    vectors=vectors or {},
-                    external_id=hfds[index]["external_id"],
-                )
-            )
-        del hfds
-
-        dataset.add_records(records)
-
-        return dataset
+                            user_without_id_response = True
+                    if user_id is not None and user_id not in responses:
+                        responses[user_id] = {
+                            "user_id": user_id,
+                            "status": status,
+                            "values": {},
+                        }
+                    value = response["value"]
+                    if value is not None:
+                        if question.type == QuestionTypes.ranking:
+                            value = [{"rank": r, "value": v} for r, v in zip(value["rank"], value["value"])]
+                        responses[user_id or "user_without_id"]["values"].update({question.name: {"value": value}})
+
+            # First if-condition is here for backwards compatibility
+            if f"{question.name}-suggestion" in row and row[f"{question.name}-suggestion"] is not None:
+                suggestion = {
+                    "question_name": question.name,
+                    "value": row[f"{question.name}-suggestion"],
+                }
+                if row[f"{question.name}-suggestion-metadata"] is not None:
+                    suggestion.update(row[f"{question.name}-suggestion-metadata"])
+                suggestions.append(suggestion)
+
+        metadata = None
+        if "metadata" in row and row["metadata"] is not None:
+            metadata = json.loads(row["metadata"])
+
+        vectors = {}
+        if "vectors" in row and row["vectors"]:
+            for vector_settings in dataset.vectors_settings:
+                if row["vectors"].get(vector_settings.name, None) is not None:
+                    vectors.update({vector_settings.name: row["vectors"][vector_settings.name]})
+
+        return FeedbackRecord(
+            fields={field.name: row[field.name] for field in dataset.fields},
+            metadata=metadata or {},
+            responses=list(responses.values()) or [],
+            suggestions=[suggestion for suggestion in suggestions if suggestion["value"] is not None] or [],
+            vectors=vectors or {},
+            external_id=row["external_id"],
+        )
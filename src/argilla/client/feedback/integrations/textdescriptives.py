@@ -13,8 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import logging
+import multiprocessing
 import re
-from typing import List, Optional, Union
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -31,10 +35,56 @@ from argilla.client.feedback.schemas.records import FeedbackRecord
 from argilla.client.feedback.schemas.remote.records import RemoteFeedbackRecord
 from argilla.utils.dependency import require_dependencies
 
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+    from spacy.language import Language
+
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
 
 
+@lru_cache(maxsize=1)
+def _load_pipeline(model: str, metrics: Optional[Tuple[str, ...]]) -> "Language":
+    """Loads the spaCy pipeline with the TextDescriptives components just once per process, as
+    `textdescriptives.extract_metrics` does on every call."""
+    import textdescriptives as td
+    from textdescriptives.utils import _create_spacy_pipeline, _remove_textdescriptives_extensions
+
+    metrics = list(metrics) if metrics is not None else td.get_valid_metrics()
+    # Remove previously set metrics to avoid conflicts, as `textdescriptives.extract_metrics` does
+    _remove_textdescriptives_extensions()
+    # If language is english, the default spacy model is used (to avoid warning message)
+    nlp = _create_spacy_pipeline(
+        spacy_model="en_core_web_sm" if model == "en" else None,
+        lang=None if model == "en" else model,
+        metrics=metrics,
+        spacy_model_size="lg",
+    )
+    if "all" in metrics:
+        nlp.add_pipe("textdescriptives/all")
+    else:
+        for component in metrics:
+            nlp.add_pipe(f"textdescriptives/{component}")
+    return nlp
+
+
+def _extract_metrics(texts: List[str], model: str, metrics: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Extracts the text descriptives metrics of a chunk of texts, as a list of dicts without the texts, so that
+    it can run in a worker process, and only the metrics are sent back."""
+    import textdescriptives as td
+
+    nlp = _load_pipeline(model, tuple(metrics) if metrics is not None else None)
+    return td.extract_dict(nlp.pipe(texts), include_text=False)
+
+
+def _chunks(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yields the records in lists of `size` records, fetching them lazily."""
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
 class TextDescriptivesExtractor:
     """This class extracts a number of basic text descriptives from FeedbackDataset
     records using the TextDescriptives library and adds them as record metadata."""
@@ -46,6 +96,8 @@ class TextDescriptivesExtractor:
         fields: Optional[List[str]] = None,
         visible_for_annotators: bool = True,
         show_progress: bool = True,
+        batch_size: int = 1000,
+        n_process: int = 1,
     ):
         """
         Initialize a new TextDescriptivesExtractor object.
@@ -58,6 +110,8 @@ class TextDescriptivesExtractor:
             fields (Optional[List[str]]): A list of field names to extract metrics from. If None, all fields will be used.
             visible_for_annotators (bool): Whether the extracted metrics should be visible to annotators.
             show_progress (bool): Whether to show a progress bar when extracting metrics.
+            batch_size (int): The number of texts whose metrics are extracted at once.
+            n_process (int): The number of processes extracting the metrics of the batches of texts in parallel.
 
         Examples:
         >>> import argilla as rg
@@ -73,6 +127,8 @@ class TextDescriptivesExtractor:
         self.fields = fields
         self.visible_for_annotators = visible_for_annotators
         self.show_progress = show_progress
+        self.batch_size = batch_size
+        self.n_process = n_process
         self.__basic_metrics = [
             "n_tokens",
             "n_unique_tokens",
@@ -82,11 +138,22 @@ class TextDescriptivesExtractor:
             "flesch_reading_ease",
         ]
 
+    @contextmanager
+    def _pool(self) -> Iterator[Optional["Pool"]]:
+        """Yields a process pool if `n_process` > 1, to be reused for all the chunks of records, so that each
+        worker process loads the spaCy pipeline just once. Otherwise, yields None."""
+        if self.n_process > 1:
+            with multiprocessing.Pool(self.n_process) as pool:
+                yield pool
+        else:
+            yield None
+
     def _extract_metrics_for_single_field(
         self,
         records: List[Union[FeedbackRecord, RemoteFeedbackRecord]],
         field: str,
         basic_metrics: Optional[List[str]] = None,
+        pool: Optional["Pool"] = None,
     ) -> Optional[pd.DataFrame]:
         """
         Extract text descriptives metrics for a single field from a list of feedback records
@@ -96,23 +163,31 @@ class TextDescriptivesExtractor:
             records (List[Union[FeedbackRecord, RemoteFeedbackRecord]]): A list of FeedbackDataset or RemoteFeedbackDataset records.
             field (str): The name of the field to extract metrics for.
             basic_metrics (Optional[List[str]]): A list of basic metrics to extract. If None, all metrics will be extracted.
+            pool (Optional[Pool]): A process pool to extract the metrics of the batches of texts with. If None, one
+                is created if `n_process` > 1.
 
         Returns:
-            Optional[pd.DataFrame]: A dataframe containing the text descriptives metrics for the field, or None if the field is empty.
+            Optional[pd.DataFrame]: A dataframe containing the text descriptives metrics for the field, indexed by the
+                position of the records with a non-empty field, or None if the field is empty.
         """
-        import textdescriptives as td
-
         # If the field is empty, skip it
-        field_text = [record.fields[field] for record in records if record.fields[field]]
+        field_idxs = [idx for idx, record in enumerate(records) if record.fields.get(field)]
+        field_text = [records[idx].fields[field] for idx in field_idxs]
         if not field_text:
             return None
-        # If language is english, the default spacy model is used (to avoid warning message)
-        if self.model == "en":
-            field_metrics = td.extract_metrics(text=field_text, spacy_model="en_core_web_sm", metrics=self.metrics)
+        # Extract the metrics in batches, in parallel if `n_process` > 1, and build the dataframe out of all
+        # the rows at once, so that the column dtypes are the same as if all the texts were processed together
+        batches = [field_text[start : start + self.batch_size] for start in range(0, len(field_text), self.batch_size)]
+        extract_metrics = partial(_extract_metrics, model=self.model, metrics=self.metrics)
+        if pool is not None:
+            field_metrics = pd.DataFrame([row for rows in pool.imap(extract_metrics, batches) for row in rows])
+        elif self.n_process > 1 and len(batches) > 1:
+            with multiprocessing.Pool(min(self.n_process, len(batches))) as pool:
+                field_metrics = pd.DataFrame([row for rows in pool.imap(extract_metrics, batches) for row in rows])
         else:
-            field_metrics = td.extract_metrics(text=field_text, lang=self.model, metrics=self.metrics)
-        # Drop text column
-        field_metrics = field_metrics.drop("text", axis=1)
+            field_metrics = pd.DataFrame([row for batch in batches for row in extract_metrics(batch)])
+        # Keep the position of the records the metrics belong to, as records with an empty field are skipped
+        field_metrics.index = field_idxs
         # If basic metrics is None, use all basic metrics
         if basic_metrics is None and self.metrics is None:
             basic_metrics = self.__basic_metrics
@@ -128,7 +203,10 @@ class TextDescriptivesExtractor:
         return field_metrics
 
     def _extract_metrics_for_all_fields(
-        self, records: List[Union[FeedbackRecord, RemoteFeedbackRecord]], fields: List[str] = None
+        self,
+        records: List[Union[FeedbackRecord, RemoteFeedbackRecord]],
+        fields: List[str] = None,
+        pool: Optional["Pool"] = None,
     ) -> pd.DataFrame:
         """
         Extract text descriptives metrics for all named fields from a list of feedback records
@@ -136,26 +214,36 @@ class TextDescriptivesExtractor:
         Args:
             records (List[Union[FeedbackRecord, RemoteFeedbackRecord]]): A list of FeedbackDataset or RemoteFeedbackDataset records.
             fields (List[str]): A list of fields to extract metrics for. If None, extract metrics for all fields.
+            pool (Optional[Pool]): A process pool to extract the metrics with. If None, one is created if
+                `n_process` > 1.
         Returns:
-            pd.DataFrame: A dataframe containing the text descriptives metrics for each record and field.
+            pd.DataFrame: A dataframe containing the text descriptives metrics for each record and field, with a row
+                per record in the same order, filled with NaNs for the empty fields.
         """
         # If fields is None, use all fields
         if self.fields:
             fields = self.fields
-        else:
+        elif not fields:
             fields = list({key for record in records for key in record.fields.keys()})
         # Extract all metrics for each field
         field_metrics = {
-            field: self._extract_metrics_for_single_field(records=records, field=field) for field in fields
+            field: self._extract_metrics_for_single_field(records=records, field=field, pool=pool) for field in fields
         }
         field_metrics = {field: metrics for field, metrics in field_metrics.items() if metrics is not None}
+        # If all the fields are empty, return a dataframe without columns
+        if not field_metrics:
+            return pd.DataFrame(index=range(len(records)))
         # If there is only one field, return the metrics for that field directly
         if len(field_metrics) == 1:
-            return list(field_metrics.values())[0]
+            final_metrics = list(field_metrics.values())[0]
         else:
-            # If there are multiple fields, combine metrics for each field into a single dataframe
+            # If there are multiple fields, combine metrics for each field into a single dataframe, aligning the
+            # rows of each field by the position of their record
             final_metrics = pd.concat(field_metrics, axis=1, keys=field_metrics.keys())
             final_metrics.columns = final_metrics.columns.droplevel(0)
+        # Add a row for the records whose fields are all empty
+        if len(final_metrics) < len(records):
+            final_metrics = final_metrics.reindex(range(len(records)))
         return final_metrics
 
     def _cast_to_python_types(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -311,12 +399,14 @@ class TextDescriptivesExtractor:
         >>> updated_dataset = tde.update_dataset(dataset)
 
         """
-        if isinstance(dataset, (FeedbackDataset, RemoteFeedbackDataset)):
-            records = dataset.records
-        else:
+        if isinstance(dataset, RemoteFeedbackDataset):
+            self._update_remote_dataset(dataset)
+            return dataset
+        elif not isinstance(dataset, FeedbackDataset):
             raise ValueError(
                 f"Provided object is of `type={type(dataset)}` while only `type=FeedbackDataset` or `type=RemoteFeedbackDataset` are allowed."
             )
+        records = dataset.records
         # Extract text descriptives metrics from records
         extracted_metrics = self._extract_metrics_for_all_fields(records)
         # Cast integer and boolean columns to Python native types
@@ -328,16 +418,62 @@ class TextDescriptivesExtractor:
         # Add each metadata property iteratively to the dataset
         [dataset.add_metadata_property(prop) for prop in metadata_properties]
         # Add the metrics to the metadata
-        if isinstance(dataset, FeedbackDataset):
-            with Progress() as progress_bar:
-                task = progress_bar.add_task(
-                    "Adding text descriptives to metadata...", total=len(records), visible=self.show_progress
-                )
-                for record, metrics in zip(records, extracted_metrics.to_dict("records")):
-                    filtered_metrics = {key: value for key, value in metrics.items() if not pd.isna(value)}
-                    record.metadata.update(filtered_metrics)
-                    progress_bar.update(task, advance=1)
-        elif isinstance(dataset, RemoteFeedbackDataset):
-            modified_records = self._add_text_descriptives_to_metadata(records, extracted_metrics)
-            dataset = dataset.update_records(modified_records)
+        with Progress() as progress_bar:
+            task = progress_bar.add_task(
+                "Adding text descriptives to metadata...", total=len(records), visible=self.show_progress
+            )
+            for record, metrics in zip(records, extracted_metrics.to_dict("records")):
+                filtered_metrics = {key: value for key, value in metrics.items() if not pd.isna(value)}
+                record.metadata.update(filtered_metrics)
+                progress_bar.update(task, advance=1)
         return dataset
+
+    def _update_remote_dataset(self, dataset: RemoteFeedbackDataset) -> None:
+        """
+        Extract text descriptives metrics from the records of a RemoteFeedbackDataset and add them as metadata,
+        without keeping the records in memory.
+
+        The records are fetched page by page twice: first to extract the metrics, as the whole metrics table is
+        needed to create the metadata properties (e.g. the values of the terms ones) before any record is updated,
+        and then to add the metrics to their metadata, updating them in Argilla chunk by chunk.
+
+        Args:
+            dataset (RemoteFeedbackDataset): A RemoteFeedbackDataset.
+        """
+        fields = self.fields or [field.name for field in dataset.fields]
+        chunks_metrics = []
+        with self._pool() as pool:
+            for records in _chunks(dataset.records, self.batch_size * self.n_process):
+                chunk_metrics = self._extract_metrics_for_all_fields(records, fields=fields, pool=pool)
+                # Index the metrics by record id, without the records whose fields are all empty
+                chunk_metrics.index = [record.id for record in records]
+                chunks_metrics.append(chunk_metrics.dropna(how="all"))
+        # Build the metrics table out of all the chunks, so that the column dtypes are the same for all the records
+        extracted_metrics = pd.concat(chunks_metrics) if chunks_metrics else pd.DataFrame()
+        if extracted_metrics.shape[1] == 0:
+            _LOGGER.warning(
+                "No text descriptives metrics were extracted. This could be because the metrics contained NaNs."
+            )
+            return
+        # Cast integer and boolean columns to Python native types
+        extracted_metrics = self._cast_to_python_types(extracted_metrics)
+        # Clean column names
+        extracted_metrics.columns = [self._clean_column_name(col) for col in extracted_metrics.columns]
+        # Create metadata properties based on dataframe columns and data types
+        for prop in self._create_metadata_properties(extracted_metrics):
+            dataset.add_metadata_property(prop)
+        metrics_by_record_id = dict(zip(extracted_metrics.index, extracted_metrics.to_dict("records")))
+        # Add the metrics to the metadata, and update the records chunk by chunk
+        with Progress() as progress_bar:
+            task = progress_bar.add_task(
+                "Adding text descriptives to metadata...", total=len(metrics_by_record_id), visible=self.show_progress
+            )
+            for records in _chunks(dataset.records, self.batch_size):
+                records = [record for record in records if record.id in metrics_by_record_id]
+                if not records:
+                    continue
+                for record in records:
+                    metrics = metrics_by_record_id[record.id]
+                    record.metadata.update({key: value for key, value in metrics.items() if not pd.isna(value)})
+                dataset.update_records(records, show_progress=False)
+                progress_bar.update(task, advance=len(records))
@@ -14,8 +14,9 @@
 
 """This module contains metrics to gather information related to inter-Annotator agreement. """
 
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from nltk.metrics.agreement import AnnotationTask as NLTKAnnotationTask
 from nltk.metrics.distance import binary_distance, interval_distance, masi_distance
 
@@ -90,21 +91,21 @@ def prepare_dataset_for_annotation_task(
     if max_records:
         dataset = dataset.pull(max_records=max_records)
 
-    hf_dataset = dataset.format_as("datasets")
-
     formatted_responses: FormattedResponses = []
 
-    for row in hf_dataset:
-        responses_ = row[question_name]
-        question_text = row["text"]
-        for response in responses_:
-            user_id = response["user_id"]
+    for record in dataset.records:
+        question_text = record.fields["text"]
+        for response in record.responses or []:
+            if question_name not in response.values:
+                continue
+
+            user_id = response.user_id
             if user_id is None:
                 raise ValueError(
                     "Please push your dataset to argilla to have the user_id necessary for this computation."
                 )
 
-            value = response["value"]
+            value = response.values[question_name].value
             if value is None:
                 continue
             # To avoid errors with the MASI distance function
@@ -112,11 +113,11 @@ def prepare_dataset_for_annotation_task(
                 if len(value) == 0:
                     continue
             if question_type == RankingQuestion:
-                value = tuple(value["rank"])
+                value = tuple(ranking_value.rank for ranking_value in value)
             elif question_type == MultiLabelQuestion:
                 value = frozenset(value)
 
-            formatted_responses.append((user_id, question_text, value))
+            formatted_responses.append((str(user_id), question_text, value))
 
     return formatted_responses
 
@@ -163,6 +164,211 @@ QUESTION_TO_DISTANCE = {
 }
 
 
+ALPHA_DISTANCES = ("nominal", "ordinal", "interval", "masi", "kendall_tau")
+
+# Distance functions with a vectorized counterpart in `krippendorff_alpha`
+_DISTANCE_FUNCTION_TO_ALPHA_DISTANCE = {
+    binary_distance: "nominal",
+    masi_distance: "masi",
+    interval_distance: "interval",
+    kendall_tau_dist: "kendall_tau",
+}
+
+# Maximum number of value pairs whose distance is computed at once
+_DISTANCES_CHUNK_SIZE = 2**20
+
+
+def _encode(values: Iterable[Hashable]) -> Tuple[np.ndarray, List[Hashable]]:
+    """Encodes hashable values as integers, in order of first appearance.
+
+    Args:
+        values: The values to encode.
+
+    Returns:
+        codes, unique_values: The code of each value, and the unique values indexed by their code.
+    """
+    codes: Dict[Hashable, int] = {}
+    encoded = np.fromiter((codes.setdefault(value, len(codes)) for value in values), dtype=np.int64)
+    return encoded, list(codes)
+
+
+def _distance_between_codes(
+    distance: Union[str, Callable], values: List[Hashable], value_totals: np.ndarray
+) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """Builds a function computing, element-wise, the distance between two arrays of encoded values.
+
+    Args:
+        distance: One of `ALPHA_DISTANCES`, or a custom distance function between two values.
+        values: The unique values indexed by their code.
+        value_totals: The number of pairable occurrences of each value, required by the ordinal distance.
+
+    Returns:
+        A function taking two arrays of value codes and returning an array with their distances.
+    """
+    if distance == "nominal":
+        return lambda a, b: (a != b).astype(np.float64)
+
+    if distance == "interval":
+        numbers = np.asarray(values, dtype=np.float64)
+        return lambda a, b: (numbers[a] - numbers[b]) ** 2
+
+    if distance == "ordinal":
+        order = np.argsort(np.asarray(values))
+        positions = np.empty_like(order)
+        positions[order] = np.arange(len(order))
+        sorted_totals = value_totals[order]
+        cumulative_totals = np.cumsum(sorted_totals)
+
+        def ordinal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            low, high = np.minimum(positions[a], positions[b]), np.maximum(positions[a], positions[b])
+            between = cumulative_totals[high] - cumulative_totals[low]
+            return (between + (sorted_totals[low] - sorted_totals[high]) / 2) ** 2
+
+        return ordinal
+
+    if distance == "masi":
+        label_codes: Dict[Hashable, int] = {}
+        memberships = [[label_codes.setdefault(label, len(label_codes)) for label in value] for value in values]
+        labels = np.zeros((len(values), len(label_codes)), dtype=np.int32)
+        for idx, value_labels in enumerate(memberships):
+            labels[idx, value_labels] = 1
+        sizes = labels.sum(axis=1)
+
+        def masi(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            intersection = np.einsum("ij,ij->i", labels[a], labels[b])
+            union = sizes[a] + sizes[b] - intersection
+            monotonicity = np.select(
+                [
+                    (sizes[a] == sizes[b]) & (sizes[a] == intersection),
+                    intersection == np.minimum(sizes[a], sizes[b]),
+                    intersection > 0,
+                ],
+                [1, 2 / 3, 1 / 3],
+                default=0,
+            )
+            return 1 - intersection / union * monotonicity
+
+        return masi
+
+    if distance == "kendall_tau" and len({len(value) for value in values}) == 1:
+        ranks = np.asarray(values, dtype=np.float64)
+        i, j = np.triu_indices(ranks.shape[1], k=1)
+        # order of every pair of ranked elements: 1, -1, or 0 if tied
+        signs = np.sign(ranks[:, i] - ranks[:, j])
+        untied = np.count_nonzero(signs, axis=1)
+
+        def kendall_tau(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+            # Kendall's tau-b, as computed by `scipy.stats.kendalltau`
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tau = np.einsum("ij,ij->i", signs[a], signs[b]) / np.sqrt(untied[a] * untied[b])
+            return 0.5 * (1 - tau)
+
+        return kendall_tau
+
+    distance_function = kendall_tau_dist if distance == "kendall_tau" else distance
+    # Fallback for custom distance functions: computed once per pair of unique values
+    distances = np.array([[distance_function(x, y) for y in values] for x in values], dtype=np.float64)
+    return lambda a, b: distances[a, b]
+
+
+def _weighted_distances_sum(
+    distance_between_codes: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    a: np.ndarray,
+    b: np.ndarray,
+    weights: np.ndarray,
+) -> float:
+    total = 0.0
+    for start in range(0, len(a), _DISTANCES_CHUNK_SIZE):
+        end = start + _DISTANCES_CHUNK_SIZE
+        total += float(np.dot(weights[start:end], distance_between_codes(a[start:end], b[start:end])))
+    return total
+
+
+def krippendorff_alpha(formatted_responses: "FormattedResponses", distance: Union[str, Callable] = "nominal") -> float:
+    """Computes Krippendorff's alpha from the coincidences of the values given to each item.
+
+    The responses are encoded as integer arrays, and the observed and expected disagreements
+    are computed with NumPy over the (item, value) coincidences, instead of looping over every
+    pair of annotations. The result matches `nltk.metrics.agreement.AnnotationTask.alpha`.
+
+    Args:
+        formatted_responses: The responses formatted as a list of tuples of (user_id, item, value).
+        distance: The distance between values: one of "nominal", "ordinal", "interval", "masi"
+            or "kendall_tau", or a function taking two values and returning their distance.
+            The distance functions from `QUESTION_TO_DISTANCE` are mapped to their vectorized
+            counterparts. Defaults to "nominal".
+
+    Returns:
+        alpha: The Krippendorff's alpha coefficient.
+
+    Raises:
+        ValueError: If the distance is not supported, or if there is not enough data to compute alpha.
+
+    Examples:
+        >>> from argilla.client.feedback.metrics.agreement_metrics import krippendorff_alpha
+        >>> responses = [("a", 1, "pos"), ("b", 1, "pos"), ("a", 2, "neg"), ("b", 2, "pos")]
+        >>> krippendorff_alpha(responses, distance="nominal")
+        0.0
+    """
+    if callable(distance):
+        distance = _DISTANCE_FUNCTION_TO_ALPHA_DISTANCE.get(distance, distance)
+    elif distance not in ALPHA_DISTANCES:
+        raise ValueError(f"Distance '{distance}' is not supported, the supported distances are: {ALPHA_DISTANCES}.")
+
+    if len(formatted_responses) == 0:
+        raise ValueError("Cannot calculate alpha, no data present!")
+
+    coders, items, values = zip(*formatted_responses)
+    item_codes, unique_items = _encode(items)
+    value_codes, unique_values = _encode(values)
+
+    if len(unique_values) == 1:
+        return 1.0
+    if len(unique_items) == 1 and len(set(coders)) == 1:
+        raise ValueError("Cannot calculate alpha, only one coder and item present!")
+
+    # Number of times each value has been given to each item, sorted by item
+    num_values = len(unique_values)
+    pairs, pair_counts = np.unique(item_codes * num_values + value_codes, return_counts=True)
+    pair_items, pair_values = np.divmod(pairs, num_values)
+
+    # Only the items with at least two values are pairable
+    item_totals = np.bincount(item_codes, minlength=len(unique_items))
+    pairable = item_totals[pair_items] >= 2
+    pair_items, pair_values, pair_counts = pair_items[pairable], pair_values[pairable], pair_counts[pairable]
+
+    value_totals = np.bincount(pair_values, weights=pair_counts, minlength=num_values)
+    total = value_totals.sum()
+    if total == 0:
+        raise ValueError("Cannot calculate alpha, no item has more than one value!")
+    if np.count_nonzero(value_totals) == 1:
+        return 1.0
+
+    distance_between_codes = _distance_between_codes(distance, unique_values, value_totals)
+
+    # Observed disagreement: every combination of the values given to the same item,
+    # weighted by their coincidences
+    _, group_starts, group_sizes = np.unique(pair_items, return_index=True, return_counts=True)
+    sizes = np.repeat(group_sizes, group_sizes)
+    left = np.repeat(np.arange(len(pair_items)), sizes)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    right = np.repeat(np.repeat(group_starts, group_sizes), sizes) + offsets
+    weights = pair_counts[left] * pair_counts[right] / (item_totals[pair_items[left]] - 1)
+    observed = _weighted_distances_sum(distance_between_codes, pair_values[left], pair_values[right], weights) / total
+
+    # Expected disagreement: every combination of the pairable values, weighted by their totals
+    present = np.flatnonzero(value_totals)
+    rows_per_chunk = max(1, _DISTANCES_CHUNK_SIZE // len(present))
+    expected = 0.0
+    for start in range(0, len(present), rows_per_chunk):
+        rows = present[start : start + rows_per_chunk]
+        a, b = np.repeat(rows, len(present)), np.tile(present, len(rows))
+        expected += _weighted_distances_sum(distance_between_codes, a, b, value_totals[a] * value_totals[b])
+    expected /= total * (total - 1)
+
+    return float(1.0 - observed / expected)
+
+
 class AgreementMetric(MetricBase):
     """Main class to compute agreement metrics.
 
@@ -304,7 +510,7 @@ class NLTKAnnotationTaskMetric(NLTKAnnotationTask, AnnotationTaskMetricBase):
         super().__init__(data=annotated_dataset, distance=distance_function)
 
 
-class KrippendorfAlpha(NLTKAnnotationTaskMetric):
+class KrippendorfAlpha(AnnotationTaskMetricBase):
     """Krippendorf's alpha agreement metric.
 
     Is a statistical measure of the inter-annotator agreement achieved when coding a set
@@ -319,12 +525,12 @@ class KrippendorfAlpha(NLTKAnnotationTaskMetric):
         - Take a look at this metric definition:
         https://en.wikipedia.org/wiki/Krippendorff%27s_alpha
 
-        - We use the implementation from nltk:
+        - We use a vectorized implementation, see `krippendorff_alpha`, whose results match the ones from nltk:
         https://www.nltk.org/api/nltk.metrics.agreement.html#nltk.metrics.agreement.AnnotationTask.alpha
     """
 
     def _compute(self, dataset) -> float:
-        return self.alpha()
+        return krippendorff_alpha(dataset, distance=self._distance_function)
 
 
 METRICS_PER_QUESTION = {
@@ -113,6 +113,7 @@ class AnnotatorMetric(MetricBase):
 
         Args:
             metric_names: name or list of names for the metrics to compute. i.e. `accuracy`
+            show_progress: whether to show a progress bar while reading the records. Defaults to True.
 
         Raises:
             ValueError: If the metric name is not supported for the given question.
@@ -131,6 +132,7 @@ class AnnotatorMetric(MetricBase):
             filter_by=self._filter_by,
             sort_by=self._sort_by,
             max_records=self._max_records,
+            show_progress=show_progress,
         )
         metrics = defaultdict(list)
         for user_id, resp_and_suggest in responses_and_suggestions_per_user.items():
@@ -12,8 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import numpy as np
 from tqdm import tqdm
@@ -30,6 +30,138 @@ if TYPE_CHECKING:
     from argilla.client.feedback.schemas.records import SortBy
 
 
+@dataclass
+class QuestionResponsesAndSuggestions:
+    """Columnar view of the responses and suggestions given to a single question of a dataset.
+
+    The values are encoded as integers, so that every response is represented by three
+    integers: the user, the record and the value.
+
+    Args:
+        user_ids: The ids of the users that responded the question, indexed by their code.
+        values: The values of the responses and suggestions, indexed by their code.
+        user_codes: The user of each response.
+        record_idxs: The index of the record of each response.
+        response_codes: The value of each response.
+        suggestion_codes: The suggestion of each record, or -1 if the record has no suggestion.
+    """
+
+    user_ids: List[str]
+    values: List[Hashable]
+    user_codes: np.ndarray
+    record_idxs: np.ndarray
+    response_codes: np.ndarray
+    suggestion_codes: np.ndarray
+
+    def per_user(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Groups the responses by user, each along with the suggestion of the same record.
+
+        Returns:
+            A dict with the user ids as keys, and a dict with the `responses` and `suggestions` as values.
+        """
+        values = self.values + [None]  # the code -1 maps to None
+        suggestion_codes = self.suggestion_codes[self.record_idxs]
+
+        per_user = {}
+        for user_code, user_id in enumerate(self.user_ids):
+            mask = self.user_codes == user_code
+            per_user[user_id] = {
+                "responses": [values[code] for code in self.response_codes[mask].tolist()],
+                "suggestions": [values[code] for code in suggestion_codes[mask].tolist()],
+            }
+        return per_user
+
+
+def _hashable_value(value: Any, is_ranking_question: bool) -> Hashable:
+    if is_ranking_question:
+        value = [item["rank"] if isinstance(item, dict) else item.rank for item in value]
+    if isinstance(value, list):
+        # To make it hashable
+        value = tuple(value)
+    return value
+
+
+def extract_responses_and_suggestions(
+    dataset: Union["FeedbackDataset", "RemoteFeedbackDataset"],
+    question_name: str,
+    show_progress: bool = True,
+) -> QuestionResponsesAndSuggestions:
+    """Extracts the responses and the suggestions for a single question from the records of a dataset.
+
+    Only the values for the given question are read, so that the memory used depends on the
+    number of responses, and not on the size of the records. For a `RemoteFeedbackDataset`, the
+    records are streamed from Argilla in batches, and only with their responses and suggestions.
+
+    Args:
+        dataset: FeedbackDataset or RemoteFeedbackDataset.
+        question_name: The name of the question to extract the responses and suggestions for.
+        show_progress: Whether to show a progress bar while reading the records. Defaults to True.
+
+    Raises:
+        NotImplementedError:
+            When no user_id is given. We need that information to compute the metrics.
+
+    Returns:
+        The responses and suggestions, as a `QuestionResponsesAndSuggestions`.
+    """
+    question_type = type(dataset.question_by_name(question_name))
+    is_ranking_question = (question_type == RankingQuestion) or (question_type == RemoteRankingQuestion)
+
+    user_codes: Dict[str, int] = {}
+    value_codes: Dict[Hashable, int] = {}
+    users, record_idxs, responses, suggestions = [], [], [], []
+
+    for record_idx, record in enumerate(
+        tqdm(
+            dataset.records,
+            desc="Extracting responses and suggestions per user",
+            total=len(dataset),
+            disable=not show_progress,
+        )
+    ):
+        suggestion = next(
+            (suggestion.value for suggestion in record.suggestions or [] if suggestion.question_name == question_name),
+            None,
+        )
+        if suggestion is None:
+            suggestions.append(-1)
+        else:
+            suggestion = _hashable_value(suggestion, is_ranking_question)
+            suggestions.append(value_codes.setdefault(suggestion, len(value_codes)))
+
+        for response in record.responses or []:
+            if question_name not in response.values:
+                continue
+
+            user_id = response.user_id
+            if user_id is None:
+                raise NotImplementedError(
+                    "In order to use this functionality the records need to be assigned to a user."
+                )
+
+            value = response.values[question_name].value
+            if value is None:
+                continue
+            # To avoid errors with the MASI distance function
+            if isinstance(value, list):
+                if len(value) == 0:
+                    continue
+
+            value = _hashable_value(value, is_ranking_question)
+            users.append(user_codes.setdefault(str(user_id), len(user_codes)))
+            record_idxs.append(record_idx)
+            responses.append(value_codes.setdefault(value, len(value_codes)))
+
+    return QuestionResponsesAndSuggestions(
+        user_ids=list(user_codes),
+        values=list(value_codes),
+        user_codes=np.array(users, dtype=np.int32),
+        record_idxs=np.array(record_idxs, dtype=np.int64),
+        response_codes=np.array(responses, dtype=np.int32),
+        suggestion_codes=np.array(suggestions, dtype=np.int32),
+    )
+
+
 def get_responses_and_suggestions_per_user(
     dataset: Union["FeedbackDataset", "RemoteFeedbackDataset"],
     question_name: str,
@@ -37,7 +169,7 @@ def get_responses_and_suggestions_per_user(
     sort_by: Optional[List["SortBy"]] = None,
     max_records: Optional[int] = None,
     show_progress: bool = True,
-) -> Tuple[Dict[int, "Responses"], "Suggestions"]:
+) -> Dict[str, Dict[str, Union["Responses", "Suggestions"]]]:
     """Extract the responses per user and the suggestions from a FeedbackDataset.
 
     Helper function for the metrics module where we want to compare the responses
@@ -52,14 +184,15 @@ def get_responses_and_suggestions_per_user(
         sort_by: A list of `SortBy` objects to sort your dataset by.
             Defaults to None (no filter is applied).
         max_records: The maximum number of records to use for training. Defaults to None.
+        show_progress: Whether to show a progress bar while reading the records. Defaults to True.
 
     Raises:
         NotImplementedError:
             When no user_id is given. We need that information to compute the metrics.
 
     Returns:
-        Tuple containing the responses per user as a dict, with keys the user id and values the responses,
-        and the suggestions.
+        Dict with the responses per user, with keys the user id and values a dict with the
+        responses and the suggestions.
     """
     if filter_by:
         dataset = dataset.filter_by(**filter_by)
@@ -68,52 +201,7 @@ def get_responses_and_suggestions_per_user(
     if max_records:
         dataset = dataset.pull(max_records=max_records)
 
-    hf_dataset = dataset.format_as("datasets")
-    question_type = type(dataset.question_by_name(question_name))
-    is_ranking_question = (question_type == RankingQuestion) or (question_type == RemoteRankingQuestion)
-
-    responses_and_suggestions_per_user = defaultdict(lambda: defaultdict(list))
-
-    for responses_, suggestion in tqdm(
-        zip(hf_dataset[question_name], hf_dataset[f"{question_name}-suggestion"]),
-        desc="Extracting responses and suggestions per user",
-        total=len(hf_dataset),
-        disable=not show_progress,
-    ):
-        if is_ranking_question:
-            suggestion = suggestion["rank"]
-
-        if isinstance(suggestion, list):
-            # To make it hashable
-            suggestion = tuple(suggestion)
-
-        for response in responses_:
-            user_id = response["user_id"]
-            if user_id is None:
-                raise NotImplementedError(
-                    "In order to use this functionality the records need to be assigned to a user."
-                )
-
-            if is_ranking_question:
-                value = response["value"]["rank"]
-            else:
-                value = response["value"]
-
-            if value is None:
-                continue
-            # To avoid errors with the MASI distance function
-            if isinstance(value, list):
-                if len(value) == 0:
-                    continue
-
-            if isinstance(value, list):
-                # To make it hashable
-                value = tuple(value)
-
-            responses_and_suggestions_per_user[user_id]["responses"].append(value)
-            responses_and_suggestions_per_user[user_id]["suggestions"].append(suggestion)
-
-    return responses_and_suggestions_per_user
+    return extract_responses_and_suggestions(dataset, question_name, show_progress=show_progress).per_user()
 
 
 def get_unified_responses_and_suggestions(
@@ -14,12 +14,16 @@
 
 import inspect
 import logging
+import math
+import pickle
 import textwrap
 import typing
+import uuid
 import warnings
 from abc import ABC
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from argilla._constants import OPENAI_SEPARATOR, OPENAI_WHITESPACE
 from argilla.client.feedback.schemas import (
@@ -55,6 +59,7 @@ from argilla.client.feedback.unification import (
 from argilla.client.models import Framework
 from argilla.pydantic_v1 import BaseModel
 from argilla.utils.dependency import require_dependencies, requires_dependencies
+from argilla.utils.spacy_utils import docbin_from_examples
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +70,93 @@ if TYPE_CHECKING:
     from sentence_transformers import InputExample
 
 
+def _iter_rows(hf_dataset: "datasets.Dataset", batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Yields the rows of a `datasets.Dataset`, reading its columns in batches of `batch_size` rows."""
+    for start in range(0, len(hf_dataset), batch_size):
+        batch = hf_dataset[start : start + batch_size]
+        columns = list(batch.keys())
+        for values in zip(*batch.values()):
+            yield dict(zip(columns, values))
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, BaseModel):
+        return (type(value), _hashable(value.dict()))
+    return value
+
+
+def _train_test_split_indices(
+    n_samples: int, train_size: float, seed: Optional[int] = None, stratify: Optional[List[Any]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits the indices of `n_samples` samples into train and test indices.
+
+    The split only depends on the arguments, so it's the same for every framework, and without `stratify`
+    it's the same split as the one from `sklearn.model_selection.train_test_split`.
+
+    Args:
+        n_samples: the number of samples to split.
+        train_size: the proportion of the samples in the train split, between 0 and 1.
+        seed: the seed of the random generator.
+        stratify: a label per sample, to keep the same proportion of samples per label in both splits.
+            Multi-label labels are stratified by their combination of labels.
+
+    Returns:
+        The train and test indices, as two integer arrays.
+
+    Raises:
+        ValueError: if either the train or the test split would be empty.
+    """
+    n_train = int(math.floor(train_size * n_samples))
+    n_test = n_samples - n_train
+    if n_train == 0 or n_test == 0:
+        raise ValueError(
+            f"With {n_samples} samples and `train_size={train_size}`, the train or the test split would be empty."
+        )
+
+    rng = np.random.RandomState(seed)
+    if stratify is None:
+        permutation = rng.permutation(n_samples)
+        return permutation[n_test:], permutation[:n_test]
+
+    codes = {}
+    keys = [frozenset(label) if isinstance(label, (list, tuple, set)) else _hashable(label) for label in stratify]
+    class_idxs = np.array([codes.setdefault(key, len(codes)) for key in keys])
+    counts = np.bincount(class_idxs)
+    # each class gets its share of the test split, rounded down, and the test samples left are handed out
+    # to the classes with the largest remainders
+    class_n_test_exact = counts * n_test / n_samples
+    class_n_test = np.floor(class_n_test_exact).astype(int)
+    largest_remainders = np.argsort(class_n_test - class_n_test_exact, kind="stable")
+    class_n_test[largest_remainders[: n_test - class_n_test.sum()]] += 1
+
+    train_idxs, test_idxs = [], []
+    class_boundaries = np.cumsum(counts)[:-1]
+    for class_samples, class_n in zip(np.split(np.argsort(class_idxs, kind="stable"), class_boundaries), class_n_test):
+        class_samples = rng.permutation(class_samples)
+        test_idxs.append(class_samples[:class_n])
+        train_idxs.append(class_samples[class_n:])
+    return rng.permutation(np.concatenate(train_idxs)), rng.permutation(np.concatenate(test_idxs))
+
+
+def _train_test_split_dataset(
+    ds: "datasets.Dataset", train_size: float, seed: Optional[int] = None, stratify: Optional[List[Any]] = None
+) -> "datasets.DatasetDict":
+    """Splits a `datasets.Dataset` into train and test splits with `_train_test_split_indices`, selecting the
+    rows of each split through an indices mapping instead of copying them."""
+    import datasets
+
+    train_idxs, test_idxs = _train_test_split_indices(len(ds), train_size, seed=seed, stratify=stratify)
+    return datasets.DatasetDict({"train": ds.select(train_idxs), "test": ds.select(test_idxs)})
+
+
 class TrainingData(ABC):
     formatting_func: Optional[BaseModel] = None
     defaults: Optional[BaseModel] = None
@@ -99,10 +191,23 @@ class TrainingData(ABC):
         if framework not in self.supported_frameworks:
             raise NotImplementedError(f"Framework {framework} is not supported for this {self.__class__}.")
 
-    def _execute_formatting_func(self, dataset: "FeedbackDataset") -> Any:
+    def _execute_formatting_func(
+        self, dataset: "FeedbackDataset", batch_size: int = 1000, num_proc: Optional[int] = None
+    ) -> Any:
         """
         Execute the formatting function on the dataset and return the output.
         """
+        return list(self._iter_formatting_func(dataset, batch_size=batch_size, num_proc=num_proc))
+
+    def _iter_formatting_func(
+        self, dataset: "FeedbackDataset", batch_size: int = 1000, num_proc: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Execute the formatting function lazily on the dataset, reading it in batches of `batch_size` rows,
+        and yield the validated outputs one by one. If `num_proc` is larger than 1, the batches are formatted
+        in `num_proc` processes with `datasets.Dataset.map`, which serializes the formatting function with `dill`,
+        so lambdas and closures can be used too.
+        """
 
         def test_none_sample(sample: Any) -> list:
             """
@@ -133,16 +238,44 @@ class TrainingData(ABC):
                     f"formatting_func must return {self._formatting_func_return_types.__annotations__['format']}, not {type(sample)}"
                 )
 
-        formatted_output = []
-        for sample in dataset.format_as("datasets"):
+        def format_sample(sample: Dict[str, Any]) -> list:
             formatted_sample = self.formatting_func(sample)
             formatted_sample = test_none_sample(formatted_sample)
             if not formatted_sample:
-                continue
-            formatted_output += test_output_formatting_func(formatted_sample)
-        return formatted_output
+                return []
+            return test_output_formatting_func(formatted_sample)
+
+        hf_dataset = dataset.format_as("datasets")
+        if num_proc is None or num_proc <= 1:
+            for sample in _iter_rows(hf_dataset, batch_size=batch_size):
+                yield from format_sample(sample)
+            return
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, Any]]:
+        import datasets
+
+        def format_batch(batch: Dict[str, List[Any]]) -> Dict[str, List[bytes]]:
+            columns = list(batch.keys())
+            outputs = [
+                output for values in zip(*batch.values()) for output in format_sample(dict(zip(columns, values)))
+            ]
+            # The outputs are pickled, as Arrow would turn tuples into lists and can't store values of mixed types
+            return {"outputs": [pickle.dumps(outputs)]}
+
+        formatted_dataset = hf_dataset.map(
+            format_batch,
+            batched=True,
+            batch_size=batch_size,
+            num_proc=num_proc,
+            remove_columns=hf_dataset.column_names,
+            features=datasets.Features({"outputs": datasets.Value("binary")}),
+            keep_in_memory=True,
+            # The formatting function is not hashed, as the formatted dataset is not cached
+            new_fingerprint=uuid.uuid4().hex,
+        )
+        for outputs in formatted_dataset["outputs"]:
+            yield from pickle.loads(outputs)
+
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, Any]]:
         formatted_data = []
         explode_columns = set()
         for record in dataset.records:
@@ -186,16 +319,14 @@ class TrainingData(ABC):
             formatted_data.append(data)
         df = pd.DataFrame(formatted_data)
         if explode_columns:
-            df = df.explode(list(explode_columns))
-        # In cases of MultiLabel datasets the label column contains a list,
-        # which is unhashable, so for those cases we transform the rows in the
-        # dataframe to tuples to drop duplicates and reconstruct the original
-        # dataframe format.
-        if df.applymap(lambda x: isinstance(x, list)).any().any():
-            df = pd.DataFrame(df.apply(tuple, 1).drop_duplicates().to_list(), columns=df.columns)
+            df = df.explode(list(explode_columns)).dropna(how="any")
+            # In cases of MultiLabel or Ranking datasets the label column contains
+            # lists or pydantic models, which are unhashable, so for those cases we
+            # find the duplicated rows over hashable keys of the exploded columns.
+            keys = df.assign(**{column: df[column].map(_hashable) for column in explode_columns})
+            df = df[~keys.duplicated()]
         else:
-            df = df.drop_duplicates()
-        df = df.dropna(how="any")
+            df = df.drop_duplicates().dropna(how="any")
         records = df.to_dict(orient="records")
 
         # Validate record format
@@ -225,9 +356,16 @@ class TrainingData(ABC):
         """Overwritten by subclasses"""
 
     def prepare_for_training(
-        self, framework: Framework, dataset: "FeedbackDataset", train_size: float, seed: int, lang: str
+        self,
+        framework: Framework,
+        dataset: "FeedbackDataset",
+        train_size: float,
+        seed: int,
+        lang: str,
+        n_process: int = 1,
+        num_proc: Optional[int] = None,
     ) -> Any:
-        data = self._format_data(dataset)
+        data = self._format_data(dataset, num_proc=num_proc)
         if framework in [
             Framework.TRANSFORMERS,
             Framework.SETFIT,
@@ -249,7 +387,9 @@ class TrainingData(ABC):
                     lang = spacy.blank(lang)
                 else:
                     lang = spacy.load(lang)
-            return self._prepare_for_training_with_spacy(data=data, train_size=train_size, seed=seed, lang=lang)
+            return self._prepare_for_training_with_spacy(
+                data=data, train_size=train_size, seed=seed, lang=lang, n_process=n_process
+            )
         elif framework is Framework.SPARK_NLP:
             return self._prepare_for_training_with_spark_nlp(data=data, train_size=train_size, seed=seed)
         elif framework is Framework.OPENAI:
@@ -270,7 +410,7 @@ class TrainingData(ABC):
         raise ValueError(f"{self.__class__.__name__} does not support the {framework} framework.")
 
     def _prepare_for_training_with_spacy(
-        self, data: List[dict], train_size, seed: int, lang: str
+        self, data: List[dict], train_size, seed: int, lang: str, n_process: int = 1
     ) -> Union["spacy.token.DocBin", Tuple["spacy.token.DocBin", "spacy.token.DocBin"]]:
         raise ValueError(f"{self.__class__.__name__} does not support the spaCy framework.")
 
@@ -777,9 +917,9 @@ class TrainingTaskForTextClassification(BaseModel, TrainingData):
     def text(self) -> Optional[TextField]:
         return self.defaults.text
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, Any]]:
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, Any]]:
         if self.formatting_func is not None:
-            output = self._execute_formatting_func(dataset)
+            output = self._execute_formatting_func(dataset, num_proc=num_proc)
 
             data = []
             _all_labels = set()
@@ -809,18 +949,12 @@ class TrainingTaskForTextClassification(BaseModel, TrainingData):
     def compute_unified_responses(self, responses: List[FeedbackRecord]):
         self.defaults.label.strategy.compute_unified_responses(responses=responses, field=self.defaults.label.question)
 
-    @requires_dependencies("scikit-learn")
     def _train_test_split(self, data: List[dict], train_size: float, seed: int) -> Tuple[List[dict], List[dict]]:
-        from sklearn.model_selection import train_test_split
-
-        # TODO: Stratify by label
         # TODO: provide label overview
-        return train_test_split(
-            data,
-            train_size=train_size,
-            shuffle=True,
-            random_state=seed,
+        train_idxs, test_idxs = _train_test_split_indices(
+            len(data), train_size, seed=seed, stratify=[entry["label"] for entry in data]
         )
+        return [data[idx] for idx in train_idxs], [data[idx] for idx in test_idxs]
 
     @requires_dependencies("datasets>1.17.0")
     def _prepare_for_training_with_transformers(
@@ -866,24 +1000,19 @@ class TrainingTaskForTextClassification(BaseModel, TrainingData):
                 features=datasets.Features(feature_dict),
             )
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed, stratify=datasets_dict["label"])
 
         return ds
 
     @requires_dependencies("spacy")
     def _prepare_for_training_with_spacy(
-        self, data: List[dict], train_size: float, seed: int, lang: str
+        self, data: List[dict], train_size: float, seed: int, lang: str, n_process: int = 1
     ) -> Union["spacy.token.DocBin", Tuple["spacy.token.DocBin", "spacy.token.DocBin"]]:
-        from spacy.tokens import DocBin
-
         all_labels = self.__all_labels__
 
         def _prepare(data):
-            db = DocBin(store_user_data=True)
-            # Creating the DocBin object as in https://spacy.io/usage/training#training-data
+            examples = []
             for entry in data:
-                doc = lang.make_doc(entry["text"])
-
                 cats = dict.fromkeys(all_labels, 0)
                 if isinstance(entry["label"], list):
                     for label in entry["label"]:
@@ -891,9 +1020,8 @@ class TrainingTaskForTextClassification(BaseModel, TrainingData):
                 else:
                     cats[entry["label"]] = 1
 
-                doc.cats = cats
-                db.add(doc)
-            return db
+                examples.append((entry["text"], {"cats": cats}))
+            return docbin_from_examples(lang, examples, n_process=n_process)
 
         if train_size != 1:
             train_data, test_data = self._train_test_split(data, train_size, seed)
@@ -986,8 +1114,8 @@ class TrainingTaskForSFT(BaseModel, TrainingData):
     _formatting_func_return_types = SFTReturnTypes
     _supported_frameworks_names = ["trl"]
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
-        formatted_output = self._execute_formatting_func(dataset)
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
+        formatted_output = self._execute_formatting_func(dataset, num_proc=num_proc)
         return [{"text": text} for text in formatted_output]
 
     @requires_dependencies("datasets>1.17.0")
@@ -1008,7 +1136,7 @@ class TrainingTaskForSFT(BaseModel, TrainingData):
 
         ds = datasets.Dataset.from_dict(datasets_dict, features=datasets.Features(feature_dict))
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed)
 
         return ds
 
@@ -1042,8 +1170,8 @@ class TrainingTaskForRM(BaseModel, TrainingData):
     _formatting_func_return_types = RMReturnTypes
     _supported_frameworks_names = ["trl"]
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
-        output = self._execute_formatting_func(dataset)
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
+        output = self._execute_formatting_func(dataset, num_proc=num_proc)
         return [{"chosen": chosen, "rejected": rejected} for chosen, rejected in output]
 
     @requires_dependencies("datasets>1.17.0")
@@ -1064,7 +1192,7 @@ class TrainingTaskForRM(BaseModel, TrainingData):
 
         ds = datasets.Dataset.from_dict(datasets_dict, features=datasets.Features(feature_dict))
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed)
 
         return ds
 
@@ -1086,8 +1214,8 @@ class TrainingTaskForPPO(BaseModel, TrainingData):
     _formatting_func_return_types = PPOReturnTypes
     _supported_frameworks_names = ["trl"]
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
-        output = self._execute_formatting_func(dataset)
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
+        output = self._execute_formatting_func(dataset, num_proc=num_proc)
         return [{"query": text} for text in output]
 
     @requires_dependencies("datasets>1.17.0")
@@ -1109,7 +1237,7 @@ class TrainingTaskForPPO(BaseModel, TrainingData):
         ds = datasets.Dataset.from_dict(datasets_dict, features=datasets.Features(feature_dict))
 
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed)
 
         return ds
 
@@ -1141,8 +1269,8 @@ class TrainingTaskForDPO(BaseModel, TrainingData):
     _formatting_func_return_types = DPOReturnTypes
     _supported_frameworks_names = ["trl"]
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
-        output = self._execute_formatting_func(dataset)
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
+        output = self._execute_formatting_func(dataset, num_proc=num_proc)
         return [{"prompt": prompt, "chosen": chosen, "rejected": rejected} for prompt, chosen, rejected in output]
 
     @requires_dependencies("datasets>1.17.0")
@@ -1165,7 +1293,7 @@ class TrainingTaskForDPO(BaseModel, TrainingData):
 
         ds = datasets.Dataset.from_dict(datasets_dict, features=datasets.Features(feature_dict))
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed)
 
         return ds
 
@@ -1222,9 +1350,9 @@ class TrainingTaskForQuestionAnswering(BaseModel, TrainingData):
     def answer(self) -> TextQuestion:
         return self.defaults.answer
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
         if self.formatting_func is not None:
-            output = self._execute_formatting_func(dataset)
+            output = self._execute_formatting_func(dataset, num_proc=num_proc)
             return [
                 {"question": question, "context": context, "answer": answer} for question, context, answer in output
             ]
@@ -1272,7 +1400,7 @@ class TrainingTaskForQuestionAnswering(BaseModel, TrainingData):
         ds = datasets.Dataset.from_dict(datasets_dict, features=datasets.Features(feature_dict))
 
         if train_size != 1:
-            ds = ds.train_test_split(train_size=train_size, test_size=1 - train_size, seed=seed)
+            ds = _train_test_split_dataset(ds, train_size, seed=seed)
 
         return ds
 
@@ -1303,8 +1431,8 @@ class TrainingTaskForChatCompletion(BaseModel, TrainingData):
     _formatting_func_return_types = ChatCompletionReturnTypes
     _supported_frameworks_names = ["openai"]
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, str]]:
-        output = self._execute_formatting_func(dataset)
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, str]]:
+        output = self._execute_formatting_func(dataset, num_proc=num_proc)
         return [{"chat": chat, "turn": turn, "role": role, "content": content} for chat, turn, role, content in output]
 
     @requires_dependencies("openai>=0.27.10")
@@ -1346,9 +1474,7 @@ class TrainingTaskForChatCompletion(BaseModel, TrainingData):
         ds = ds.sort(column_names=["chat", "turn"])
 
         if train_size != 1:
-            ds = ds.train_test_split(
-                train_size=train_size, test_size=1 - train_size, seed=seed, stratify_by_column="chat"
-            )
+            ds = _train_test_split_dataset(ds, train_size, seed=seed, stratify=ds["chat"])
             return _dict_to_format(ds["train"]), _dict_to_format(ds["test"])
         else:
             return _dict_to_format(ds)
@@ -1407,9 +1533,9 @@ class TrainingTaskForSentenceSimilarity(BaseModel, TrainingData):
     def texts(self) -> Optional[List[str]]:
         return self.defaults.texts
 
-    def _format_data(self, dataset: "FeedbackDataset") -> List[Dict[str, Any]]:
+    def _format_data(self, dataset: "FeedbackDataset", num_proc: Optional[int] = None) -> List[Dict[str, Any]]:
         if self.formatting_func:
-            output = self._execute_formatting_func(dataset)
+            output = self._execute_formatting_func(dataset, num_proc=num_proc)
 
             if "label" in output[0]:
                 _all_labels = set()
@@ -1463,13 +1589,11 @@ class TrainingTaskForSentenceSimilarity(BaseModel, TrainingData):
     def compute_unified_responses(self, responses: List[FeedbackRecord]):
         self.label.strategy.compute_unified_responses(responses=responses, field=self.label.question)
 
-    @requires_dependencies("scikit-learn")
     def _train_test_split(
         self, data: List[dict], train_size: float, seed: int, stratify=None
     ) -> Tuple[List[dict], List[dict]]:
-        from sklearn.model_selection import train_test_split
-
-        return train_test_split(data, train_size=train_size, shuffle=True, random_state=seed, stratify=stratify)
+        train_idxs, test_idxs = _train_test_split_indices(len(data), train_size, seed=seed, stratify=stratify)
+        return [data[idx] for idx in train_idxs], [data[idx] for idx in test_idxs]
 
     @requires_dependencies("sentence-transformers")
     def _prepare_for_training_with_sentence_transformers(
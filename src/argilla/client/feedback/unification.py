@@ -14,11 +14,10 @@
 
 import random
 from abc import abstractmethod
-from collections import Counter
 from enum import Enum
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Hashable, List, Tuple, Union
 
-import pandas as pd
+import numpy as np
 
 from argilla.client.feedback.schemas import (
     FeedbackRecord,
@@ -50,6 +49,76 @@ class UnifiedValueSchema(ValueSchema):
     ]
 
 
+def _submitted_values(records: List[FeedbackRecord], question: str) -> Tuple[np.ndarray, List[Any]]:
+    """Collects the values of the submitted responses to a question, along with the index of their record.
+
+    Args:
+        records: the records to collect the responses from.
+        question: the name of the question.
+
+    Returns:
+        record_idxs, values: the record index of each value, in ascending order, and the values.
+    """
+    record_idxs, values = [], []
+    for idx, rec in enumerate(records):
+        for resp in rec.responses or []:
+            # only allow for submitted responses
+            if resp.status == "submitted" and question in resp.values:
+                record_idxs.append(idx)
+                values.append(resp.values[question].value)
+    return np.array(record_idxs, dtype=np.int64), values
+
+
+def _encode(values: List[Hashable]) -> Tuple[np.ndarray, List[Hashable]]:
+    """Encodes hashable values as integers, in order of first appearance."""
+    codes: Dict[Hashable, int] = {}
+    encoded = np.fromiter((codes.setdefault(value, len(codes)) for value in values), dtype=np.int64)
+    return encoded, list(codes)
+
+
+def _group_starts(record_idxs: np.ndarray) -> np.ndarray:
+    """Returns the positions where each group of consecutive equal record indexes starts."""
+    if len(record_idxs) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, record_idxs[1:] != record_idxs[:-1]])
+
+
+def _most_common_per_record(record_idxs: np.ndarray, values: List[Hashable]) -> Dict[int, Hashable]:
+    """Computes the most frequent value for each record, choosing at random between tied values.
+
+    Args:
+        record_idxs: the record index of each value, in ascending order.
+        values: the values to count.
+
+    Returns:
+        A dict with the record indexes as keys and their most frequent value as values.
+    """
+    if len(values) == 0:
+        return {}
+
+    codes, unique_values = _encode(values)
+    # count each (record, value) pair, keeping the order in which the values appear within each record
+    pairs, first_idxs, counts = np.unique(
+        record_idxs * len(unique_values) + codes, return_index=True, return_counts=True
+    )
+    order = np.lexsort((first_idxs, pairs // len(unique_values)))
+    pairs, counts = pairs[order], counts[order]
+    pair_records, pair_values = np.divmod(pairs, len(unique_values))
+
+    starts = _group_starts(pair_records)
+    group_sizes = np.diff(np.r_[starts, len(pairs)])
+    max_counts = np.maximum.reduceat(counts, starts)
+    is_most_common = counts == np.repeat(max_counts, group_sizes)
+    num_most_common = np.add.reduceat(is_most_common, starts)
+
+    most_common = {}
+    for start, size, num in zip(starts.tolist(), group_sizes.tolist(), num_most_common.tolist()):
+        group_values = pair_values[start : start + size][is_most_common[start : start + size]].tolist()
+        value_code = group_values[0] if num == 1 else random.choice(group_values)
+        most_common[int(pair_records[start])] = unique_values[value_code]
+    return most_common
+
+
 class RatingQuestionStrategyMixin:
     def compute_unified_responses(
         self, records: List[FeedbackRecord], question: Union["RatingQuestionStrategy", "RankingQuestionStrategy"]
@@ -120,52 +189,32 @@ class RatingQuestionStrategy(RatingQuestionStrategyMixin, Enum):
         Returns: the updated list of feedback records with the unified responses for the specified
         question.
         """
-        for rec in records:
-            if not rec.responses:
-                continue
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            ratings = []
-            for resp in responses:
-                if question in resp.values:
-                    ratings.append(int(resp.values[question].value))
-            if not ratings:
-                continue
-            # unified response
-            if self.value == self.MEAN.value:
-                unified_value = str(int(sum(ratings) / len(ratings)))
-            elif self.value == self.MAX.value:
-                unified_value = str(max(ratings))
-            elif self.value == self.MIN.value:
-                unified_value = str(min(ratings))
-            else:
-                raise ValueError("Invalid aggregation method")
-            rec._unified_responses[question] = [UnifiedValueSchema(value=unified_value, strategy=self.value)]
+        record_idxs, values = _submitted_values(records, question)
+        if len(values) == 0:
+            return records
+
+        ratings = np.array([int(value) for value in values], dtype=np.int64)
+        starts = _group_starts(record_idxs)
+        # unified response
+        if self.value == self.MEAN.value:
+            totals = np.add.reduceat(ratings, starts).tolist()
+            counts = np.diff(np.r_[starts, len(ratings)]).tolist()
+            unified_values = [str(int(total / count)) for total, count in zip(totals, counts)]
+        elif self.value == self.MAX.value:
+            unified_values = [str(value) for value in np.maximum.reduceat(ratings, starts).tolist()]
+        elif self.value == self.MIN.value:
+            unified_values = [str(value) for value in np.minimum.reduceat(ratings, starts).tolist()]
+        else:
+            raise ValueError("Invalid aggregation method")
+
+        for idx, unified_value in zip(record_idxs[starts].tolist(), unified_values):
+            records[idx]._unified_responses[question] = [UnifiedValueSchema(value=unified_value, strategy=self.value)]
         return records
 
     def _majority(self, records: List[FeedbackRecord], question: str):
-        for rec in records:
-            if not rec.responses:
-                continue
-            counter = Counter()
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            for resp in responses:
-                if question in resp.values:
-                    counter.update([resp.values[question].value])
-            if not counter.values():
-                continue
-            # Find the maximum count
-            max_count = max(counter.values())
-            # Get a list of values with the maximum count
-            most_common_values = [value for value, count in counter.items() if count == max_count]
-            if len(most_common_values) > 1:
-                majority_value = random.choice(most_common_values)
-            else:
-                majority_value = counter.most_common(1)[0][0]
-            rec._unified_responses[question] = [UnifiedValueSchema(value=majority_value, strategy=self.value)]
+        record_idxs, values = _submitted_values(records, question)
+        for idx, majority_value in _most_common_per_record(record_idxs, values).items():
+            records[idx]._unified_responses[question] = [UnifiedValueSchema(value=majority_value, strategy=self.value)]
         return records
 
 
@@ -236,41 +285,28 @@ class RankingQuestionStrategy(RatingQuestionStrategyMixin, Enum):
         if self.value == self.MEAN.value:
             return self._mean(records, question)
 
-        for rec in records:
-            if not rec.responses:
-                continue
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            total_values = []
-            total_ranks = []
-            for resp in responses:
-                if question in resp.values:
-                    values = []
-                    ranks = []
-                    for value in resp.values[question].value:
-                        values.append(value.value)
-                        ranks.append(value.rank)
-
-                    total_values.append(tuple(values))
-                    total_ranks.append(tuple(ranks))
-
-            if not total_values:
-                continue
-            df = pd.DataFrame({"value": total_values, "rank": total_ranks})
-
-            # unified response
-            if self.value == self.MAX.value:
-                df = df[df["rank"] == df["rank"].max()]
-            elif self.value == self.MIN.value:
-                df = df[df["rank"] == df["rank"].min()]
-            else:
-                raise ValueError("Invalid aggregation method")
-
-            if len(df) > 0:
-                # Extract the first of the possible values (in case there is more than one).
-                unified_rank = [{"rank": item[1], "value": item[0]} for item in zip(*df.iloc[0].to_list())]
-                rec._unified_responses[question] = [UnifiedValueSchema(value=unified_rank, strategy=self.value)]
+        record_idxs, values = _submitted_values(records, question)
+        if len(values) == 0:
+            return records
+
+        total_ranks = [tuple(value.rank for value in ranking) for ranking in values]
+        # position of each tuple of ranks once sorted, so that they are compared as integers
+        sorted_ranks = {ranks: position for position, ranks in enumerate(sorted(set(total_ranks)))}
+        rank_positions = np.array([sorted_ranks[ranks] for ranks in total_ranks], dtype=np.int64)
+
+        # unified response
+        if self.value == self.MAX.value:
+            rank_positions = -rank_positions
+        elif self.value != self.MIN.value:
+            raise ValueError("Invalid aggregation method")
+
+        # first response with the max (or min) ranks of each record
+        order = np.lexsort((np.arange(len(values)), rank_positions, record_idxs))
+        for response_idx in order[_group_starts(record_idxs[order])].tolist():
+            unified_rank = [{"rank": value.rank, "value": value.value} for value in values[response_idx]]
+            records[record_idxs[response_idx]]._unified_responses[question] = [
+                UnifiedValueSchema(value=unified_rank, strategy=self.value)
+            ]
 
         return records
 
@@ -290,36 +326,38 @@ class RankingQuestionStrategy(RatingQuestionStrategyMixin, Enum):
         the updated list of FeedbackRecord objects after aggregating the responses for the
         specified question.
         """
-        from collections import defaultdict
-
         UnifiedValueSchema.update_forward_refs()
 
-        for rec in records:
-            if not rec.responses:
-                continue
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # Step 1: Create an empty dictionary to store cumulative ranks and counts
-            cumulative_ranks = defaultdict(lambda: {"sum": 0, "count": 0})
-
-            # Step 2: Iterate through each ranking and update cumulative ranks and counts
-            for resp in responses:
-                if question in resp.values:
-                    for item in resp.values[question].value:
-                        value = item.value
-                        rank = item.rank
-                        cumulative_ranks[value]["sum"] += rank
-                        cumulative_ranks[value]["count"] += 1
-
-            # Step 3: Calculate the average rank for each response
-            average_ranking = [
-                {"rank": round(cumulative_ranks[value]["sum"] / cumulative_ranks[value]["count"]), "value": value}
-                for value in cumulative_ranks
-            ]
-
-            # Step 4: Create a new list representing the average ranking
-            average_ranking = sorted(average_ranking, key=lambda x: x["rank"])
-            rec._unified_responses[question] = [UnifiedValueSchema(value=average_ranking, strategy=self.value)]
+        record_idxs, values = _submitted_values(records, question)
+        # Step 1: Flatten the rankings into one (record, ranked value, rank) triplet per ranked value
+        item_records = np.repeat(record_idxs, [len(ranking) for ranking in values])
+        item_codes, unique_items = _encode([item.value for ranking in values for item in ranking])
+        item_ranks = np.array([item.rank for ranking in values for item in ranking], dtype=np.float64)
+
+        # Step 2: Compute the cumulative ranks and counts of each value per record
+        pairs, first_idxs, inverse, counts = np.unique(
+            item_records * max(len(unique_items), 1) + item_codes,
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+        )
+        sums = np.bincount(inverse, weights=item_ranks, minlength=len(pairs))
+        pair_records, pair_items = np.divmod(pairs, max(len(unique_items), 1))
+
+        # Step 3: Calculate the average rank for each value, and sort them by average rank
+        # and order of appearance within each record
+        average_ranks = np.round(sums / np.maximum(counts, 1)).astype(np.int64)
+        order = np.lexsort((first_idxs, average_ranks, pair_records))
+
+        # Step 4: Create a new list representing the average ranking
+        average_rankings = {idx: [] for idx, rec in enumerate(records) if rec.responses}
+        for idx, item_code, rank in zip(
+            pair_records[order].tolist(), pair_items[order].tolist(), average_ranks[order].tolist()
+        ):
+            average_rankings[idx].append({"rank": rank, "value": unique_items[item_code]})
+
+        for idx, average_ranking in average_rankings.items():
+            records[idx]._unified_responses[question] = [UnifiedValueSchema(value=average_ranking, strategy=self.value)]
 
         return records
 
@@ -341,36 +379,13 @@ class RankingQuestionStrategy(RatingQuestionStrategyMixin, Enum):
         each record updated for the specified question.
         """
         UnifiedValueSchema.update_forward_refs()
-        for rec in records:
-            if not rec.responses:
-                continue
-            counter = Counter()
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            ranks = []
-            for resp in responses:
-                if question in resp.values:
-                    rank_per_response = []
-                    for value in resp.values[question].value:
-                        rank_per_response.append((value.rank, value.value))
-                    ranks.append(tuple(rank_per_response))
-
-            counter.update(ranks)
-            if not counter.values():
-                continue
-            # Find the maximum count
-            max_count = max(counter.values())
-            # Get a list of values with the maximum count
-            most_common_values = [value for value, count in counter.items() if count == max_count]
-            if len(most_common_values) > 1:
-                majority_value = random.choice(most_common_values)
-            else:
-                majority_value = counter.most_common()[0][0]
 
+        record_idxs, values = _submitted_values(records, question)
+        ranks = [tuple((value.rank, value.value) for value in ranking) for ranking in values]
+        for idx, majority_value in _most_common_per_record(record_idxs, ranks).items():
             # Recreate the final ranking
             majority_rank = [{"rank": item[0], "value": item[1]} for item in majority_value]
-            rec._unified_responses[question] = [UnifiedValueSchema(value=majority_rank, strategy=self.value)]
+            records[idx]._unified_responses[question] = [UnifiedValueSchema(value=majority_rank, strategy=self.value)]
 
         return records
 
@@ -481,31 +496,12 @@ class LabelQuestionStrategy(LabelQuestionStrategyMixin, Enum):
         - question The "question" parameter is a string that represents the specific question for
         which you want to determine the majority value.
 
-        Returns: a modified version of the input `FeedbackRecord` object.
+        Returns: the updated list of FeedbackRecord objects.
         """
-        for rec in records:
-            if not rec.responses:
-                continue
-            counter = Counter()
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            for resp in responses:
-                if question in resp.values:
-                    counter.update([resp.values[question].value])
-            if not counter.values():
-                continue
-            # Find the maximum count
-            max_count = max(counter.values())
-            # Get a list of values with the maximum count
-            most_common_values = [value for value, count in counter.items() if count == max_count]
-            if len(most_common_values) > 1:
-                majority_value = random.choice(most_common_values)
-            else:
-                majority_value = counter.most_common(1)[0][0]
-
-            rec._unified_responses[question] = [UnifiedValueSchema(value=majority_value, strategy=self.value)]
-        return rec
+        record_idxs, values = _submitted_values(records, question)
+        for idx, majority_value in _most_common_per_record(record_idxs, values).items():
+            records[idx]._unified_responses[question] = [UnifiedValueSchema(value=majority_value, strategy=self.value)]
+        return records
 
     @classmethod
     def _majority_weighted(cls, records: List[FeedbackRecord], question: LabelQuestion):
@@ -539,30 +535,39 @@ class MultiLabelQuestionStrategy(LabelQuestionStrategyMixin, Enum):
         Returns: the updated list of FeedbackRecord objects with the "_unified_responses" attribute
         updated for each record.
         """
-        for rec in records:
-            if not rec.responses:
-                continue
-            counter = Counter()
-            # only allow for submitted responses
-            responses = [resp for resp in rec.responses if resp.status == "submitted"]
-            # get responses with a value that is most frequent
-            for resp in responses:
-                if isinstance(resp.values[question].value, list):
-                    for value in resp.values[question].value:
-                        counter.update([value])
-                else:
-                    counter.update([resp.values[question].value])
-            # check if there is a majority based on the number of responses
-            majority = int(len(responses) // 2) + 1
-            majority_value = []
-            for value, count in counter.items():
-                if count >= majority:
-                    majority_value.append(value)
-
+        record_idxs, values = _submitted_values(records, question)
+
+        # Flatten the selected labels into one (record, label) pair per label
+        labels = [label for value in values for label in (value if isinstance(value, list) else [value])]
+        # records whose submitted responses selected no labels are left without a unified response
+        if len(labels) == 0:
+            return records
+        label_records = np.repeat(record_idxs, [len(value) if isinstance(value, list) else 1 for value in values])
+        label_codes, unique_labels = _encode(labels)
+
+        pairs, first_idxs, counts = np.unique(
+            label_records * len(unique_labels) + label_codes, return_index=True, return_counts=True
+        )
+        order = np.lexsort((first_idxs, pairs // len(unique_labels)))
+        pairs, counts = pairs[order], counts[order]
+        pair_records, pair_labels = np.divmod(pairs, len(unique_labels))
+
+        # check if there is a majority based on the number of responses
+        num_responses = np.array(
+            [sum(resp.status == "submitted" for resp in rec.responses or []) for rec in records], dtype=np.int64
+        )
+        is_majority = counts >= num_responses[pair_records] // 2 + 1
+
+        starts = _group_starts(pair_records)
+        for start, end in zip(starts.tolist(), np.r_[starts[1:], len(pairs)].tolist()):
+            group_labels = pair_labels[start:end]
+            majority_value = group_labels[is_majority[start:end]].tolist()
             if not majority_value:
-                majority_value = [random.choice(list(counter.keys()))]
+                majority_value = [random.choice(group_labels.tolist())]
 
-            rec._unified_responses[question] = [UnifiedValueSchema(value=list(majority_value), strategy=self.value)]
+            records[int(pair_records[start])]._unified_responses[question] = [
+                UnifiedValueSchema(value=[unique_labels[code] for code in majority_value], strategy=self.value)
+            ]
         return records
 
     @classmethod
@@ -19,7 +19,9 @@ from argilla.client.feedback.utils.assignment import (
     assign_records_to_individuals,
     assign_workspaces,
     check_user,
+    check_users,
     check_workspace,
+    check_workspaces,
 )
 from argilla.client.feedback.utils.html_utils import (
     audio_to_html,
@@ -15,7 +15,7 @@
 
 import random
 import warnings
-from collections import defaultdict
+from itertools import chain
 from typing import Any, Dict, List, Union
 
 from rich.progress import Progress
@@ -66,6 +66,75 @@ def check_workspace(workspace_to_check: str) -> Workspace:
     return workspace
 
 
+def check_users(users_to_check: List[Union[str, User]]) -> List[User]:
+    """
+    Helper function to check a list of users at once. The existing users are retrieved from Argilla with a single
+    request, and only the usernames that don't exist yet are checked one by one via `check_user`, so that they are
+    created. Each username is checked just once, even if it's repeated.
+
+    Args:
+        users_to_check: a list of user objects or strings that represent usernames
+
+    Returns:
+        The User objects corresponding to the input, in the same order.
+    """
+    usernames = {user for user in users_to_check if not isinstance(user, User)}
+    existing_users = {user.username: user for user in User.list()} if usernames else {}
+
+    users = {}
+    for user in users_to_check:
+        if isinstance(user, User):
+            continue
+        if user not in users:
+            users[user] = existing_users[user] if user in existing_users else check_user(user)
+    return [user if isinstance(user, User) else users[user] for user in users_to_check]
+
+
+def check_workspaces(workspaces_to_check: List[str]) -> Dict[str, Workspace]:
+    """
+    Helper function to check a list of workspaces at once. The existing workspaces are retrieved from Argilla with a
+    single request, and the ones that don't exist yet are created.
+
+    Args:
+        workspaces_to_check: a list of workspace string names
+
+    Returns:
+        A dictionary where keys are the workspace names and values are the corresponding Workspace objects.
+    """
+    existing_workspaces = {workspace.name: workspace for workspace in Workspace.list()}
+
+    workspaces = {}
+    for workspace_name in workspaces_to_check:
+        if workspace_name not in workspaces:
+            workspaces[workspace_name] = existing_workspaces.get(workspace_name) or Workspace.create(workspace_name)
+    return workspaces
+
+
+def _assign_indices(num_records: int, num_assignees: int, overlap: int) -> List[List[int]]:
+    """
+    Computes the indices of the records assigned to each assignee (user or group), where each record is assigned
+    to `overlap` consecutive assignees, starting by the one at the record index modulo the number of assignees.
+
+    Args:
+        num_records: the number of records to be assigned.
+        num_assignees: the number of users or groups the records are assigned to.
+        overlap: the number of times each record is assigned to consecutive assignees.
+
+    Returns:
+        A list with the sorted record indices assigned to each assignee.
+    """
+    # The assignee at position `i` gets the records `idx` where `(idx + offset) % num_assignees == i` for any
+    # offset in range(overlap), i.e. the strided slices starting at `(i - offset) % num_assignees`
+    return [
+        sorted(
+            chain.from_iterable(
+                range((assignee - offset) % num_assignees, num_records, num_assignees) for offset in range(overlap)
+            )
+        )
+        for assignee in range(num_assignees)
+    ]
+
+
 def assign_records_to_groups(
     groups: Dict[str, List[Any]], records: List[Any], overlap: int, shuffle: bool = True
 ) -> Dict[str, Dict[str, Any]]:
@@ -96,30 +165,27 @@ def assign_records_to_groups(
     if shuffle:
         random.shuffle(records)
 
-    assignments = {}
-    assignments_grouped = {}
     group_names = list(groups.keys())
-    num_groups = len(group_names)
     overlap = 1 if overlap == 0 else overlap
 
-    group_records = defaultdict(list)
+    group_records = {}
     with Progress() as progress:
-        task = progress.add_task("[green]Processing records...", total=len(records))
-
-        for idx, record in enumerate(records):
-            for offset in range(overlap):
-                group_index = (idx + offset) % num_groups
-                group_name = group_names[group_index]
-                group_records[group_name].append(record)
+        task = progress.add_task("[green]Processing records...", total=len(group_names))
 
+        for group_name, indices in zip(group_names, _assign_indices(len(records), len(group_names), overlap)):
+            group_records[group_name] = [records[idx] for idx in indices]
             progress.update(task, advance=1)
 
-    for group, users in groups.items():
-        users = [check_user(user) for user in users]
-        for user in users:
+    users = iter(check_users([user for group_users in groups.values() for user in group_users]))
+
+    assignments = {}
+    assignments_grouped = {}
+    for group, group_users in groups.items():
+        group_users = [next(users) for _ in group_users]
+        for user in group_users:
             assignments[user] = group_records[group]
 
-        assignments_grouped[group] = {user.username: assignments.get(user, []) for user in users}
+        assignments_grouped[group] = {user.username: assignments.get(user, []) for user in group_users}
 
     return assignments_grouped
 
@@ -154,21 +220,16 @@ def assign_records_to_individuals(
     if shuffle:
         random.shuffle(records)
 
-    users = [check_user(user) for user in users]
+    users = check_users(users)
     assignments = {user.username: [] for user in users}
 
-    num_users = len(users)
     overlap = 1 if overlap == 0 else overlap
 
     with Progress() as progress:
-        task = progress.add_task("[green]Processing records...", total=len(records))
-
-        for idx, record in enumerate(records):
-            for offset in range(overlap):
-                user_index = (idx + offset) % num_users
-                user = users[user_index].username
-                assignments[user].append(record)
+        task = progress.add_task("[green]Processing records...", total=len(users))
 
+        for user, indices in zip(users, _assign_indices(len(records), len(users), overlap)):
+            assignments[user.username].extend(records[idx] for idx in indices)
             progress.update(task, advance=1)
 
     return assignments
@@ -222,41 +283,37 @@ def assign_workspaces(
         >>> wk_assignments = assign_workspaces(individual_assignments, "individual")
 
     """
-    wk_assignments = {}
-
+    # Map each workspace name to the names of the users to be added to it
+    workspace_users = {}
     for group, users in assignments.items():
         if workspace_type == "group":
-            workspace_name = group
-            user_ids = [check_user(user).id for user in users.keys()]
-
+            workspace_users[group] = list(users.keys())
         elif workspace_type == "group_personal":
             for user in users.keys():
-                workspace_name = user
-                user_ids = [check_user(user).id]
-                workspace = check_workspace(workspace_name)
-
-                for user_id in user_ids:
-                    try:
-                        workspace.add_user(user_id)
-                    except:
-                        pass
-
-                wk_assignments[workspace_name] = [User.from_id(user.id).username for user in workspace.users]
-
-            continue
-
+                workspace_users[user] = [user]
         elif workspace_type == "individual":
-            workspace_name = group
-            user_ids = [check_user(group).id]
+            workspace_users[group] = [group]
 
-        workspace = check_workspace(workspace_name)
+    # Resolve all the users and workspaces at once
+    usernames = list(dict.fromkeys(user for names in workspace_users.values() for user in names))
+    users = dict(zip(usernames, check_users(usernames)))
+    workspaces = check_workspaces(list(workspace_users))
 
-        for user_id in user_ids:
+    wk_assignments = {}
+    for workspace_name, usernames in workspace_users.items():
+        workspace = workspaces[workspace_name]
+        members = {user.id: user.username for user in workspace.users}
+
+        for username in usernames:
+            user = users[username]
+            if user.id in members:
+                continue
             try:
-                workspace.add_user(user_id)
+                workspace.add_user(user.id)
             except:
-                pass
+                continue
+            members[user.id] = user.username
 
-        wk_assignments[workspace_name] = [User.from_id(user.id).username for user in workspace.users]
+        wk_assignments[workspace_name] = list(members.values())
 
     return wk_assignments
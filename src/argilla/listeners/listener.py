@@ -17,7 +17,8 @@ import dataclasses
 import functools
 import logging
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 import schedule
@@ -28,6 +29,85 @@ from argilla.client.sdk.commons.errors import NotFoundApiError
 from argilla.listeners.models import ListenerAction, ListenerCondition, Metrics, RGListenerContext, Search
 
 
+class _ListenersScheduler:
+    """
+    A process-wide scheduler shared by all listeners. A single thread checks the pending jobs, and the
+    listener iterations are executed by a shared thread pool of ``max_workers`` threads.
+    """
+
+    _LOGGER = logging.getLogger(__name__)
+
+    max_workers: int = 4
+
+    def __init__(self):
+        self.scheduler = schedule.Scheduler()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def every(self, interval_in_seconds: int, job_func, *args, **kwargs) -> schedule.Job:
+        running = threading.Lock()
+        job = None
+
+        def on_job_done(future):
+            running.release()
+            if not future.cancelled() and future.exception() is None and future.result() is schedule.CancelJob:
+                self.cancel(job)
+
+        def submit_job():
+            # Skip the tick if the previous iteration of the same job is still running
+            if running.acquire(blocking=False):
+                self._executor.submit(job_func, *args, **kwargs).add_done_callback(on_job_done)
+
+        with self._lock:
+            job = self.scheduler.every(interval_in_seconds).seconds.do(submit_job)
+            self._ensure_running()
+        return job
+
+    def cancel(self, job: schedule.Job):
+        with self._lock:
+            self.scheduler.cancel_job(job)
+            if not self.scheduler.jobs:
+                self._stop()
+
+    def _ensure_running(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="argilla-listener")
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), daemon=True)
+        self._thread.start()
+
+    def _stop(self):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self, stop_event: threading.Event):
+        self._LOGGER.debug("Running listeners thread...")
+        while not stop_event.is_set():
+            self.scheduler.run_pending()
+            idle_seconds = self.scheduler.idle_seconds
+            stop_event.wait(timeout=1 if idle_seconds is None else min(max(idle_seconds, 0), 1))
+        self._LOGGER.debug("Stopping listeners thread...")
+
+
+@dataclasses.dataclass
+class _ListenerCache:
+    """Search results and metrics computed for a listener query in a previous iteration"""
+
+    query: Optional[str]
+    metrics: Metrics
+    total: int
+    # The most recent `last_updated` of the records matching the query, as stamped by the server
+    watermark: Optional[datetime] = None
+    # The number of records matching the query updated within the overlap window before the watermark
+    recent: int = 0
+
+
 @dataclasses.dataclass
 class RGDatasetListener:
     """
@@ -43,6 +123,12 @@ class RGDatasetListener:
         query_records: If ``False``, the records won't be passed as argument to the action.
             Default: ``True``
         interval_in_seconds: How often the listener is executed. Default to 30 seconds
+        incremental: If ``True``, only the records created or updated since the last action execution
+            (using the records ``last_updated`` field as watermark) are passed to the action, and iterations
+            where no record was updated are skipped. Default: ``False``
+        watermark_overlap_in_seconds: Records updated up to this number of seconds before the watermark are
+            checked (and passed to incremental actions) again, so records that become searchable after a
+            later update are not missed. Default: 5 seconds
     """
 
     _LOGGER = logging.getLogger(__name__)
@@ -55,6 +141,8 @@ class RGDatasetListener:
     condition: Optional[ListenerCondition] = None
     query_records: bool = True
     interval_in_seconds: int = 30
+    incremental: bool = False
+    watermark_overlap_in_seconds: float = 5
 
     @property
     def formatted_query(self) -> Optional[str]:
@@ -64,9 +152,9 @@ class RGDatasetListener:
         return self.query.format(**(self.query_params or {}))
 
     __listener_job__: Optional[schedule.Job] = dataclasses.field(init=False, default=None)
-    __stop_schedule_event__ = None
-    __current_thread__ = None
-    __scheduler__ = schedule.Scheduler()
+    __last_action_watermark__: Optional[datetime] = dataclasses.field(init=False, default=None)
+    __cache__: Optional["_ListenerCache"] = dataclasses.field(init=False, default=None)
+    __scheduler__ = _ListenersScheduler()
 
     def __post_init__(self):
         self.metrics = self.metrics or []
@@ -89,7 +177,11 @@ class RGDatasetListener:
             @functools.wraps(job_func)
             def wrapper(*args, **kwargs):
                 try:
-                    return job_func(*args, **kwargs)
+                    result = job_func(*args, **kwargs)
+                    if result is schedule.CancelJob:
+                        # The scheduler cancels the job
+                        self.__listener_job__ = None
+                    return result
                 except:  # noqa: E722
                     import traceback
 
@@ -114,30 +206,12 @@ class RGDatasetListener:
 
         job_step = self.__catch_exceptions__(cancel_on_failure=True)(self.__listener_iteration_job__)
 
-        self.__listener_job__ = self.__scheduler__.every(self.interval_in_seconds).seconds.do(
-            job_step, *action_args, **action_kwargs
+        self.__last_action_watermark__ = None
+        self.__cache__ = None
+        self.__listener_job__ = self.__scheduler__.every(
+            self.interval_in_seconds, job_step, *action_args, **action_kwargs
         )
 
-        class _ScheduleThread(threading.Thread):
-            _WAIT_EVENT = threading.Event()
-
-            _THREAD_LOGGER = logging.getLogger(__name__)
-
-            @classmethod
-            def run(cls):
-                cls._THREAD_LOGGER.debug("Running listener thread...")
-                while not cls._WAIT_EVENT.is_set():
-                    self.__scheduler__.run_pending()
-                    time.sleep(self.interval_in_seconds - 1)
-                cls._THREAD_LOGGER.debug("Stopping listener thread...")
-
-            @classmethod
-            def stop(cls):
-                cls._WAIT_EVENT.set()
-
-        self.__current_thread__ = _ScheduleThread()
-        self.__current_thread__.start()
-
     def stop(self):
         """
         Stops listener if it's still running.
@@ -148,10 +222,8 @@ class RGDatasetListener:
         if not self.is_running():
             raise ValueError("Listener is not running")
 
-        self.__scheduler__.cancel_job(self.__listener_job__)
-        self.__listener_job__ = None
-        self.__current_thread__.stop()
-        self.__current_thread__.join()  # TODO: improve it!
+        job, self.__listener_job__ = self.__listener_job__, None
+        self.__scheduler__.cancel(job)
 
     def __listener_iteration_job__(self, *args, **kwargs):
         """
@@ -161,6 +233,9 @@ class RGDatasetListener:
         2. Check search results and metrics with provided condition
         3. Execute the action if condition is satisfied
 
+        Search results and metrics are reused from the previous iteration if no record was created, updated
+        or deleted since then. For incremental listeners, the iteration is skipped in that case.
+
         """
         current_api = singleton.active_api()
         try:
@@ -170,24 +245,30 @@ class RGDatasetListener:
             self._LOGGER.warning(f"Not found dataset <{self.dataset}>")
             return
 
+        query = self.formatted_query
+        if not (self.metrics or self.condition or self.incremental):
+            # Nothing to reuse from previous iterations
+            ctx = RGListenerContext(listener=self, query_params=self.query_params, metrics=Metrics.from_dict({}))
+            return self.__run_action__(ctx, *args, **kwargs)
+
+        changed = self.__dataset_changed__(current_api, dataset, query=query)
+        if changed:
+            self.__cache__ = self.__compute_cache__(current_api, dataset, query=query)
+        elif self.incremental:
+            self._LOGGER.debug("No records updated since last execution. Skipping...")
+            return
+
         ctx = RGListenerContext(
             listener=self,
             query_params=self.query_params,
-            metrics=self.__compute_metrics__(current_api, dataset, query=self.formatted_query),
+            metrics=self.__cache__.metrics,
         )
         if self.condition is None:
             self._LOGGER.debug("No condition found! Running action...")
             return self.__run_action__(ctx, *args, **kwargs)
 
-        search_results = current_api.search.search_records(
-            name=self.dataset,
-            task=dataset.task,
-            size=0,
-            query_text=self.formatted_query,
-        )
-
         ctx.search = Search(
-            total=search_results.total,
+            total=self.__cache__.total,
             query_params=copy.deepcopy(ctx.query_params),
         )
         condition_args = [ctx.search]
@@ -199,6 +280,54 @@ class RGDatasetListener:
             self._LOGGER.debug("Condition passed! Running action...")
             return self.__run_action__(ctx, *args, **kwargs)
 
+    def __dataset_changed__(self, current_api, dataset, query: Optional[str]) -> bool:
+        """
+        Checks with count queries whether any record matching the query was created, updated or deleted since
+        the last iteration. Deletions change the total, and updates change the number of records updated
+        within the overlap window before the watermark.
+        """
+        cache = self.__cache__
+        if cache is None or cache.query != query:
+            return True
+
+        total = current_api.search.search_records(name=self.dataset, task=dataset.task, size=0, query_text=query)
+        if total.total != cache.total:
+            return True
+
+        return self.__count_recent__(current_api, dataset, query=query, watermark=cache.watermark) != cache.recent
+
+    def __compute_cache__(self, current_api, dataset, query: Optional[str]) -> _ListenerCache:
+        records_watermark = current_api.search.records_watermark(
+            name=self.dataset, task=dataset.task, query_text=query
+        )
+        return _ListenerCache(
+            query=query,
+            metrics=self.__compute_metrics__(current_api, dataset, query=query),
+            total=records_watermark.total,
+            watermark=records_watermark.last_updated,
+            recent=self.__count_recent__(current_api, dataset, query=query, watermark=records_watermark.last_updated),
+        )
+
+    def __count_recent__(self, current_api, dataset, query: Optional[str], watermark: Optional[datetime]) -> int:
+        results = current_api.search.search_records(
+            name=self.dataset,
+            task=dataset.task,
+            size=0,
+            query_text=self.__watermark_query__(query, watermark),
+        )
+        return results.total
+
+    def __watermark_query__(self, query: Optional[str], watermark: Optional[datetime]) -> Optional[str]:
+        if watermark is None:
+            return query
+
+        if self.watermark_overlap_in_seconds > 0:
+            since = watermark - timedelta(seconds=self.watermark_overlap_in_seconds)
+            watermark_query = f'last_updated:["{since.isoformat()}" TO *]'
+        else:
+            watermark_query = f'last_updated:{{"{watermark.isoformat()}" TO *]'
+        return f"({query}) AND {watermark_query}" if query else watermark_query
+
     def __compute_metrics__(self, current_api, dataset, query: str) -> Metrics:
         metrics = {}
         for metric in self.metrics:
@@ -217,10 +346,16 @@ class RGDatasetListener:
     def __run_action__(self, ctx: Optional[RGListenerContext] = None, *args, **kwargs):
         try:
             action_args = [ctx] if ctx else []
+            watermark = self.__cache__.watermark if self.__cache__ else None
             if self.query_records:
-                action_args.insert(0, argilla.load(name=self.dataset, query=self.formatted_query))
+                query = self.formatted_query
+                if self.incremental:
+                    query = self.__watermark_query__(query, self.__last_action_watermark__)
+                action_args.insert(0, argilla.load(name=self.dataset, query=query))
             self._LOGGER.debug(f"Running action with arguments: {action_args}")
-            return self.action(*args, *action_args, **kwargs)
+            result = self.action(*args, *action_args, **kwargs)
+            self.__last_action_watermark__ = watermark
+            return result
         except:  # noqa: E722
             import traceback
 
@@ -235,6 +370,8 @@ def listener(
     condition: Optional[ListenerCondition] = None,
     with_records: bool = True,
     execution_interval_in_seconds: int = 30,
+    incremental: bool = False,
+    watermark_overlap_in_seconds: float = 5,
     **query_params,
 ):
     """
@@ -249,6 +386,11 @@ def listener(
             only the listener context ``RGListenerContext`` will be passed. Default: ``True``.
         execution_interval_in_seconds: Define the execution interval in seconds when listener
             iteration will be executed.
+        incremental: If ``True``, only the records updated since the last action execution will be passed
+            to the action, and iterations without updated records will be skipped. Default: ``False``.
+        watermark_overlap_in_seconds: Records updated up to this number of seconds before the last seen
+            ``last_updated`` are checked again, and passed again to incremental actions, so records that become
+            searchable late are not missed. Default: 5 seconds.
         **query_params: Dynamic parameters used in the query. These parameters will be available
             via the listener context and can be updated for subsequent queries.
     """
@@ -263,6 +405,8 @@ def listener(
             metrics=metrics,
             query_records=with_records,
             interval_in_seconds=execution_interval_in_seconds,
+            incremental=incremental,
+            watermark_overlap_in_seconds=watermark_overlap_in_seconds,
         )
 
     return inner_decorator
@@ -79,7 +79,7 @@ class FlairMonitor(BaseMonitor):
 
 
 def flair_monitor(
-    pl: SequenceTagger, api: Api, dataset: str, sample_rate: float, log_interval: float
+    pl: SequenceTagger, api: Api, dataset: str, sample_rate: float, log_interval: float, **kwargs
 ) -> Optional[SequenceTagger]:
     return FlairMonitor(
         pl,
@@ -87,4 +87,5 @@ def flair_monitor(
         dataset=dataset,
         sample_rate=sample_rate,
         log_interval=log_interval,
+        **kwargs,
     )
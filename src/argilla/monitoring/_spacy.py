@@ -99,11 +99,14 @@ class SpacyNERMonitor(BaseMonitor):
             return doc
 
 
-def ner_monitor(nlp: Language, api: Api, dataset: str, sample_rate: float, log_interval: float) -> Language:
+def ner_monitor(
+    nlp: Language, api: Api, dataset: str, sample_rate: float, log_interval: float, **kwargs
+) -> Language:
     return SpacyNERMonitor(
         nlp,
         api=api,
         dataset=dataset,
         sample_rate=sample_rate,
         log_interval=log_interval,
+        **kwargs,
     )
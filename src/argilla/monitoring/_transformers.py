@@ -172,7 +172,7 @@ class TextClassificationMonitor(HuggingFaceMonitor):
 
 
 def huggingface_monitor(
-    pl: Pipeline, api: Api, dataset: str, sample_rate: float, log_interval: float
+    pl: Pipeline, api: Api, dataset: str, sample_rate: float, log_interval: float, **kwargs
 ) -> Optional[Pipeline]:
     if isinstance(pl, TextClassificationPipeline):
         return TextClassificationMonitor(
@@ -181,6 +181,7 @@ def huggingface_monitor(
             dataset=dataset,
             sample_rate=sample_rate,
             log_interval=log_interval,
+            **kwargs,
         )
     if isinstance(pl, ZeroShotClassificationPipeline):
         return ZeroShotMonitor(
@@ -189,5 +190,6 @@ def huggingface_monitor(
             dataset=dataset,
             sample_rate=sample_rate,
             log_interval=log_interval,
+            **kwargs,
         )
     return None
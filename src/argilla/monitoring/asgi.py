@@ -16,7 +16,8 @@ import datetime
 import json
 import logging
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from argilla.client.models import Record, TextClassificationRecord, TokenClassificationRecord
 from argilla.monitoring.base import BaseMonitor
@@ -25,8 +26,8 @@ from argilla.utils.dependency import require_dependencies
 require_dependencies("starlette>=0.13.0")
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response, StreamingResponse
-from starlette.types import Message, Receive
+from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
 
 _logger = logging.getLogger(__name__)
 _default_tokenization_pattern = re.compile(r"\W+")
@@ -59,6 +60,11 @@ def text_classification_mapper(inputs, outputs):
     )
 
 
+def _is_json_content_type(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
 class CachedJsonRequest(Request):
     """
     We must have a cached version of incoming requests since the request body cannot be read from middleware directly.
@@ -82,7 +88,14 @@ class CachedJsonRequest(Request):
 
 
 class ArgillaLogHTTPMiddleware(BaseHTTPMiddleware):
-    """A standard Starlette middleware that enables argilla logs for http prediction requests"""
+    """A standard Starlette middleware that enables argilla logs for http prediction requests
+
+    The sampling decision is taken before reading the request, and the response body is captured while it's
+    streamed to the client into a buffer of at most `max_body_size` bytes. Responses with bigger bodies are
+    not logged. Only responses with a JSON content type are captured. Parsing the captured payloads and
+    mapping them into records runs in a background executor with `num_workers` threads, so it doesn't add
+    latency to the monitored endpoint. The executor is shut down with the application.
+    """
 
     def __init__(
         self,
@@ -93,6 +106,8 @@ class ArgillaLogHTTPMiddleware(BaseHTTPMiddleware):
         log_interval: float = 1.0,
         agent: Optional[str] = None,
         tags: Dict[str, str] = None,
+        max_body_size: int = 1024 * 1024,
+        num_workers: int = 1,
         *args,
         **kwargs,
     ):
@@ -101,6 +116,7 @@ class ArgillaLogHTTPMiddleware(BaseHTTPMiddleware):
         self._endpoint = api_endpoint
         self._dataset = dataset
         self._records_mapper = records_mapper
+        self._max_body_size = max_body_size
         self._monitor_cfg = dict(
             dataset=dataset,
             sample_rate=sample_rate,
@@ -109,6 +125,24 @@ class ArgillaLogHTTPMiddleware(BaseHTTPMiddleware):
             tags=tags,
         )
         self._monitor: Optional[BaseMonitor] = None
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="argilla-asgi-monitoring")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "lifespan":
+            return await super().__call__(scope, receive, send)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] in ("lifespan.shutdown.complete", "lifespan.shutdown.failed"):
+                self.shutdown()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def shutdown(self):
+        """Waits for the captured responses to be logged, and stops the records consumers"""
+        self._executor.shutdown(wait=True)
+        if self._monitor:
+            self._monitor.shutdown()
 
     def init(self):
         if self._monitor:
@@ -132,54 +166,77 @@ class ArgillaLogHTTPMiddleware(BaseHTTPMiddleware):
         if self._endpoint != request.url.path:  # Filtering endpoint path
             return await call_next(request)
 
+        if not self._monitor.is_record_accepted():
+            return await call_next(request)
+
         cached_request = CachedJsonRequest(
             scope=request.scope,
             receive=request.receive,
             send=request._send,
         )
 
+        # Must obtain input parameters from request. Request bodies are parsed later, in the background
+        if cached_request.method in ["POST", "PUT"]:
+            content_type = request.headers.get("Content-type", None)
+            if content_type is not None and "application/json" not in content_type:
+                return await call_next(request)
+            inputs = await cached_request.body()
+        elif cached_request.method == "GET":
+            inputs = cached_request.query_params._dict
+        else:
+            _logger.error("Cannot log to argilla. Only request methods POST, PUT and GET are implemented.")
+            return await call_next(request)
+
+        # Must obtain response from request
+        response: Response = await call_next(cached_request)
+        if response.status_code >= 400 or not _is_json_content_type(response.headers.get("content-type", "")):
+            return response
+
         try:
-            # Must obtain input parameters from request
-            if cached_request.method in ["POST", "PUT"]:
-                content_type = request.headers.get("Content-type", None)
-                if content_type is None:
-                    if "application/json" not in content_type:
-                        return await call_next(request)
-                inputs = await cached_request.json()
-            elif cached_request.method == "GET":
-                inputs = cached_request.query_params._dict
-            else:
-                raise NotImplementedError("Only request methods POST, PUT and GET are implemented.")
-
-            # Must obtain response from request
-            response: Response = await call_next(cached_request)
-            if not isinstance(response, (JSONResponse, StreamingResponse)) or response.status_code >= 400:
-                return response
-
-            new_response, outputs = await self._extract_response_content(response)
-            self._monitor.send_records(inputs=inputs, outputs=outputs)
-            return new_response
+            self._capture_response_content(response, on_complete=lambda body: self._submit(inputs, body))
         except Exception as ex:
             _logger.error("Cannot log to argilla", exc_info=ex)
-            return await call_next(request)
+        return response
 
-    async def _extract_response_content(self, response: Response) -> Tuple[Response, List[Dict[str, Any]]]:
-        """Extracts response body content from response and returns a new processable response"""
-        body = b""
-        new_response = response
-        if isinstance(response, StreamingResponse):
-            async for chunk in response.body_iterator:
-                body += chunk
-            new_response = StreamingResponse(
-                content=(chunk for chunk in [body]),
-                status_code=response.status_code,
-                headers={k: v for k, v in response.headers.items()},
-                media_type=response.media_type,
-                background=response.background,
-            )
-        else:
-            body = response.body
-        return new_response, json.loads(body)
+    def _capture_response_content(self, response: Response, on_complete: Callable[[bytes], None]):
+        """Tees the response body into a bounded buffer and calls `on_complete` with the captured body"""
+        if not hasattr(response, "body_iterator"):
+            on_complete(response.body)
+            return
+
+        body_iterator = response.body_iterator
+        max_body_size = self._max_body_size
+
+        async def tee_body_iterator():
+            chunks, size = [], 0
+            async for chunk in body_iterator:
+                if chunks is not None:
+                    size += len(chunk)
+                    if size > max_body_size:
+                        _logger.debug("Response body exceeds %d bytes. Skipping log to argilla", max_body_size)
+                        chunks = None
+                    else:
+                        chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode(response.charset))
+                yield chunk
+
+            if chunks is not None:
+                on_complete(b"".join(chunks))
+
+        response.body_iterator = tee_body_iterator()
+
+    def _submit(self, inputs: Union[bytes, Dict[str, Any]], body: bytes):
+        try:
+            self._executor.submit(self._log_response, inputs, body)
+        except RuntimeError:
+            _logger.warning("Cannot log to argilla. The middleware is already shut down")
+
+    def _log_response(self, inputs: Union[bytes, Dict[str, Any]], body: bytes):
+        try:
+            if isinstance(inputs, bytes):
+                inputs = json.loads(inputs)
+            self._monitor.send_records(inputs=inputs, outputs=json.loads(body))
+        except Exception as ex:
+            _logger.error("Cannot log to argilla", exc_info=ex)
 
     def _prepare_argilla_data(self, inputs: List[Dict[str, Any]], outputs: List[Dict[str, Any]], **tags):
         # using the base monitor, we only need to provide the input data to the rg.log function
@@ -16,7 +16,8 @@ import atexit
 import logging
 import random
 import threading
-from queue import Empty, Queue
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
 from typing import Any, Dict, Iterable, List, Optional
 
 import backoff
@@ -27,13 +28,29 @@ from argilla.client.api import Api
 from argilla.client.models import Record
 from argilla.client.sdk.commons.errors import ArApiResponseError
 
+# Marker put into the queue to wake up the consumer when it's paused
+_STOP = object()
+# Max time a blocked send waits before checking again whether the consumer is still running
+_PUT_POLL_INTERVAL = 0.1
+
 
 class ModelNotSupportedError(Exception):
     pass
 
 
 class DatasetRecordsConsumer(threading.Thread):
-    """Consumes the records from the dataset queue."""
+    """Consumes the records from the dataset queue.
+
+    Records are dequeued in bulk and uploaded by a pool of ``num_workers`` threads, so several
+    batches can be in flight at the same time. When the buffer is full, the ``on_full`` policy
+    decides what to do with new records: ``"drop"`` discards them (and counts them in
+    ``records_dropped``) while ``"block"`` applies backpressure to the caller until there is
+    room in the buffer (or ``put_timeout`` expires). Once the consumer is paused, sent records are
+    dropped right away instead of waiting for a consumer that won't dequeue them anymore.
+    """
+
+    ON_FULL_DROP = "drop"
+    ON_FULL_BLOCK = "block"
 
     log = logging.getLogger("argilla.monitoring")
 
@@ -49,8 +66,18 @@ class DatasetRecordsConsumer(threading.Thread):
         retries=10,
         timeout=15,
         on_error=None,
+        num_workers: int = 1,
+        on_full: str = ON_FULL_DROP,
+        put_timeout: Optional[float] = None,
     ):
         """Create a consumer thread."""
+        if num_workers < 1:
+            raise ValueError(f"Wrong number of workers {num_workers}. Set a value greater than 0.")
+        if on_full not in (self.ON_FULL_DROP, self.ON_FULL_BLOCK):
+            raise ValueError(
+                f"Wrong on_full policy {on_full!r}. Allowed values are {self.ON_FULL_DROP!r} and {self.ON_FULL_BLOCK!r}."
+            )
+
         threading.Thread.__init__(self)
         self.daemon = True
         self.upload_size = upload_size
@@ -66,47 +93,112 @@ class DatasetRecordsConsumer(threading.Thread):
         self.retries = retries
         self.timeout = timeout
 
+        self.num_workers = num_workers
+        self.on_full = on_full
+        self.put_timeout = put_timeout
+
+        self.records_sent = 0
+        self.records_failed = 0
+        self.records_dropped = 0
+        self._stats_lock = threading.Lock()
+
+        self._workers = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix=f"argilla-monitoring-{name}")
+        # Bound the number of batches waiting for a worker, so the buffer size keeps being meaningful
+        self._inflight = threading.BoundedSemaphore(num_workers)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """The counters of sent, failed and dropped records"""
+        with self._stats_lock:
+            return {
+                "sent": self.records_sent,
+                "failed": self.records_failed,
+                "dropped": self.records_dropped,
+            }
+
     def run(self):
         """Runs the consumer."""
-        while self.running:
-            self.log_next_batch()
-        self._log_remaining()
+        try:
+            while self.running:
+                self.log_next_batch()
+            self._log_remaining()
+        finally:
+            self._workers.shutdown(wait=True)
 
     def _log_remaining(self):
         """When the consumer is paused, send remaining data in the queue"""
-        last_batch = []
-        while not self.queue.empty():
-            last_batch.append(self.queue.get())
-        if not len(last_batch):
-            return
-
-        self._log_records(last_batch)
-        for _ in last_batch:
-            self.queue.task_done()
+        while True:
+            last_batch = self._get_many(self.upload_size)
+            if not last_batch:
+                return
+            self._dispatch(last_batch)
 
     def pause(self):
         """Pause the consumer."""
+        if not self.running:
+            return
         self.running = False
+        try:
+            # Wake up the consumer if it's waiting for new records
+            self.queue.put_nowait(_STOP)
+        except Full:
+            pass
 
     def log_next_batch(self):
-        """Upload the next batch of items, return whether successful."""
+        """Dispatch the next batch of items to the upload workers, return whether a batch was dispatched."""
 
         batch = self._next_batch()
         if len(batch) == 0:
             return False
 
-        success = self._log_records(batch)
-        # mark items as acknowledged from queue
-        for _ in batch:
-            self.queue.task_done()
-        return success
+        self._dispatch(batch)
+        return True
+
+    def _dispatch(self, batch: List[Record]):
+        self._inflight.acquire()
+        try:
+            self._workers.submit(self._upload_batch, batch)
+        except RuntimeError:
+            # The workers pool is already shutdown
+            self._inflight.release()
+            self._upload_batch(batch)
+
+    def _upload_batch(self, batch: List[Record]):
+        try:
+            success = self._log_records(batch)
+            with self._stats_lock:
+                if success:
+                    self.records_sent += len(batch)
+                else:
+                    self.records_failed += len(batch)
+        finally:
+            # mark items as acknowledged from queue
+            for _ in batch:
+                self.queue.task_done()
+            self._inflight.release()
+
+    def _get_many(self, max_items: int) -> List[Record]:
+        """Dequeue up to `max_items` already available records in a single lock acquisition"""
+        queue = self.queue
+        with queue.mutex:
+            items = [queue.queue.popleft() for _ in range(min(max_items, len(queue.queue)))]
+            if items:
+                queue.not_full.notify(len(items))
+
+        records = []
+        for item in items:
+            if item is _STOP:
+                queue.task_done()
+            else:
+                records.append(item)
+        return records
 
     def _next_batch(self) -> List[Record]:
         queue = self.queue
         records = []
 
         start_time = monotonic.monotonic()
-        while len(records) < self.upload_size:
+        while self.running and len(records) < self.upload_size:
             elapsed = monotonic.monotonic() - start_time
             if elapsed >= self.upload_interval:
                 break
@@ -115,10 +207,16 @@ class DatasetRecordsConsumer(threading.Thread):
                     block=True,
                     timeout=self.upload_interval - elapsed,
                 )
-                records.append(item)
             except Empty:
                 break
 
+            if item is _STOP:
+                queue.task_done()
+                break
+
+            records.append(item)
+            records.extend(self._get_many(self.upload_size - len(records)))
+
         return records
 
     def _log_records(self, batch: List[Record]):
@@ -152,12 +250,45 @@ class DatasetRecordsConsumer(threading.Thread):
                 self.on_error(e, batch)
             return False
 
+    def _put(self, record: Record) -> bool:
+        """Enqueue a record following the `on_full` policy, return whether it was enqueued"""
+        if self.on_full != self.ON_FULL_BLOCK:
+            try:
+                self.queue.put_nowait(record)
+                return True
+            except Full:
+                return False
+
+        deadline = None if self.put_timeout is None else monotonic.monotonic() + self.put_timeout
+        # Wait in short slices, so senders blocked on a full buffer are released when the consumer stops
+        while self.running:
+            timeout = _PUT_POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - monotonic.monotonic())
+                if timeout <= 0:
+                    return False
+            try:
+                self.queue.put(record, block=True, timeout=timeout)
+                return True
+            except Full:
+                pass
+        return False
+
     def send(self, records: Iterable[Record]):
         """Send records to the consumer"""
+        dropped = 0
         for record in records:
-            self.queue.put(
-                item=record,
-                block=False,
+            if not self.running or not self._put(record):
+                dropped += 1
+
+        if dropped:
+            with self._stats_lock:
+                self.records_dropped += dropped
+            self.log.warning(
+                "Monitoring buffer for dataset %s is %s. %d records were dropped",
+                self.dataset,
+                "full" if self.running else "stopped",
+                dropped,
             )
 
 
@@ -171,6 +302,17 @@ class BaseMonitor(wrapt.ObjectProxy):
         argilla dataset name
     sample_rate:
         The portion of the data to be store in argilla. Default = 0.2
+    num_workers:
+        The number of concurrent upload workers per dataset. Default = 1
+    buffer_size:
+        The max number of records waiting to be uploaded per dataset. Default = 10000
+    upload_size:
+        The max number of records uploaded per request. Default = 256
+    on_full:
+        What to do with new records when the buffer is full: "drop" them or "block" the caller. Default = "drop"
+    put_timeout:
+        With on_full="block", the max seconds to wait for room in the buffer before dropping a record.
+        Default = None (wait while the monitor is running)
     """
 
     def __init__(
@@ -182,6 +324,11 @@ class BaseMonitor(wrapt.ObjectProxy):
         log_interval: float = 1.0,
         agent: Optional[str] = None,
         tags: Dict[str, str] = None,
+        num_workers: int = 1,
+        buffer_size: int = 10000,
+        upload_size: int = 256,
+        on_full: str = DatasetRecordsConsumer.ON_FULL_DROP,
+        put_timeout: Optional[float] = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
@@ -195,6 +342,11 @@ class BaseMonitor(wrapt.ObjectProxy):
         self.tags = tags
         self._api = api
         self._log_interval = log_interval
+        self._num_workers = num_workers
+        self._buffer_size = buffer_size
+        self._upload_size = upload_size
+        self._on_full = on_full
+        self._put_timeout = put_timeout
         self._consumers: Dict[str, DatasetRecordsConsumer] = {}
 
         atexit.register(self.shutdown)
@@ -211,8 +363,13 @@ class BaseMonitor(wrapt.ObjectProxy):
     def _prepare_log_data(self, *args, **kwargs) -> Dict[str, Any]:
         raise NotImplementedError()
 
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """The sent, failed and dropped records counters by dataset"""
+        return {dataset: consumer.stats for dataset, consumer in self._consumers.items()}
+
     def shutdown(self):
-        """Stop consumers"""
+        """Stop consumers, flushing the records still pending to be uploaded"""
         for consumer in self._consumers.values():
             try:
                 consumer.pause()
@@ -238,6 +395,11 @@ class BaseMonitor(wrapt.ObjectProxy):
             name=name,
             api=self._api,
             upload_interval=self._log_interval,
+            upload_size=self._upload_size,
+            buffer_size=self._buffer_size,
+            num_workers=self._num_workers,
+            on_full=self._on_full,
+            put_timeout=self._put_timeout,
         )
         consumer.start()
         return consumer
@@ -31,6 +31,11 @@ def monitor(
     sample_rate: float = 0.3,
     agent: Optional[str] = None,
     log_interval: float = 5,
+    num_workers: int = 1,
+    buffer_size: int = 10000,
+    upload_size: int = 256,
+    on_full: str = "drop",
+    put_timeout: Optional[float] = None,
 ) -> Union[BaseMonitor, Language, Pipeline, SequenceTagger]:
     """Automatically monitor (i.e. log) data fed through Transformer pipelines,
     spaCy models or flAIr taggers.
@@ -42,6 +47,13 @@ def monitor(
         sample_rate (float, optional): The portion of processed data to log. Defaults to 0.3.
         agent (Optional[str], optional): The name of the logging agent. Defaults to None.
         log_interval (float, optional): The interval for uploading in seconds. Defaults to 5.
+        num_workers (int, optional): The number of concurrent upload workers. Defaults to 1.
+        buffer_size (int, optional): The max number of records waiting to be uploaded. Defaults to 10000.
+        upload_size (int, optional): The max number of records uploaded per request. Defaults to 256.
+        on_full (str, optional): What to do with new records when the buffer is full. "drop" discards
+            them, while "block" waits until there is room in the buffer. Defaults to "drop".
+        put_timeout (Optional[float], optional): With `on_full="block"`, the max seconds to wait for room
+            in the buffer before dropping a record. Defaults to None, which waits while the monitor is running.
 
     Returns:
         Union[BaseMonitor, Language, Pipeline, SequenceTagger]: The monitor that acts equivalently
@@ -49,6 +61,13 @@ def monitor(
     """
     model_monitor = None
     api = active_api()
+    consumer_kwargs = dict(
+        num_workers=num_workers,
+        buffer_size=buffer_size,
+        upload_size=upload_size,
+        on_full=on_full,
+        put_timeout=put_timeout,
+    )
     if isinstance(task_model, Language):
         model_monitor = ner_monitor(
             task_model,
@@ -56,6 +75,7 @@ def monitor(
             dataset=dataset,
             sample_rate=sample_rate,
             log_interval=log_interval,
+            **consumer_kwargs,
         )
     elif isinstance(task_model, Pipeline):
         model_monitor = huggingface_monitor(
@@ -64,6 +84,7 @@ def monitor(
             dataset=dataset,
             sample_rate=sample_rate,
             log_interval=log_interval,
+            **consumer_kwargs,
         )
     elif isinstance(task_model, SequenceTagger):
         model_monitor = flair_monitor(
@@ -72,6 +93,7 @@ def monitor(
             dataset=dataset,
             sample_rate=sample_rate,
             log_interval=log_interval,
+            **consumer_kwargs,
         )
     if model_monitor:
         model_monitor.agent = agent
@@ -11,10 +11,12 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import functools
 import json
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 from fastapi import APIRouter, Depends, Query, Security
+from fastapi.responses import StreamingResponse
 
 from argilla.client.sdk.token_classification.models import TokenClassificationQuery
 from argilla.server.apis.v0.models.commons.model import SortableField
@@ -31,6 +33,25 @@ from argilla.server.services.datasets import DatasetsService
 # TODO(@frascuchon): This will be merged with `records.py`
 #  once the similarity search feature is merged into develop
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_json_dumps = functools.partial(json.dumps, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def _iter_scan_response_json(records: List[dict], next_idx: Optional[str], next_page_cfg: str) -> Iterator[bytes]:
+    """Serializes a scan response, sending the records in chunks instead of as a single JSON blob"""
+    chunk, chunk_size = ['{"records":['], 0
+    for idx, record in enumerate(records):
+        data = _json_dumps(record)
+        chunk.append(data if idx == 0 else f",{data}")
+        chunk_size += len(data)
+        if chunk_size >= _STREAM_CHUNK_SIZE:
+            yield "".join(chunk).encode("utf-8")
+            chunk, chunk_size = [], 0
+
+    chunk.append(f'],"next_idx":{_json_dumps(next_idx)},"next_page_cfg":{_json_dumps(next_page_cfg)}}}')
+    yield "".join(chunk).encode("utf-8")
+
 
 def configure_router(router: APIRouter):
     QueryType = Union[
@@ -51,6 +72,10 @@ def configure_router(router: APIRouter):
         next_page_cfg: Optional[str] = Field(
             description="Field to paginate over scan results. Use value fetched from previous response"
         )
+        highlight: bool = Field(
+            default=False,
+            description="Extract the `search_keywords` matching the query text for each record",
+        )
 
     class ScanDatasetRecordsResponse(BaseModel):
         records: List[dict]
@@ -88,7 +113,12 @@ def configure_router(router: APIRouter):
             paginated_sort.next_search_params = [request.next_idx]
 
         docs = engine.scan_records(
-            id=found.id, query=request.query, sort=paginated_sort, include_fields=request.fields, limit=limit
+            id=found.id,
+            query=request.query,
+            sort=paginated_sort,
+            include_fields=request.fields,
+            limit=limit,
+            enable_highlight=request.highlight,
         )
 
         docs = list(docs)
@@ -100,7 +130,11 @@ def configure_router(router: APIRouter):
         if paginated_sort.next_search_params and not request.sort_by:
             next_idx = paginated_sort.next_search_params[0]
 
-        return ScanDatasetRecordsResponse(next_idx=next_idx, next_page_cfg=paginated_sort.json(), records=docs)
+        # Records are plain json documents from the search engine, so they are streamed without any validation
+        return StreamingResponse(
+            _iter_scan_response_json(docs, next_idx=next_idx, next_page_cfg=paginated_sort.json()),
+            media_type="application/json",
+        )
 
 
 router = APIRouter(tags=["datasets"], prefix="/datasets")
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Security, status
@@ -20,7 +20,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla.server.contexts import accounts, datasets
 from argilla.server.database import get_async_db
-from argilla.server.enums import ResponseStatusFilter
 from argilla.server.models import Dataset as DatasetModel
 from argilla.server.models import ResponseStatus, User
 from argilla.server.policies import DatasetPolicyV1, MetadataPropertyPolicyV1, authorize, is_authorized
@@ -28,6 +27,7 @@ from argilla.server.schemas.v1.datasets import (
     Dataset,
     DatasetCreate,
     Datasets,
+    DatasetsMetrics,
     DatasetUpdate,
     Field,
     FieldCreate,
@@ -95,6 +95,48 @@ async def _filter_metadata_properties_by_policy(
     return filtered_metadata_properties
 
 
+async def _list_current_user_datasets(
+    db: AsyncSession, current_user: User, workspace_id: Optional[UUID] = None
+) -> List[DatasetModel]:
+    if not workspace_id:
+        if current_user.is_owner:
+            return await datasets.list_datasets(db)
+        else:
+            await current_user.awaitable_attrs.datasets
+            return current_user.datasets
+    else:
+        return await datasets.list_datasets_by_workspace_id(db, workspace_id)
+
+
+async def _get_current_user_datasets_metrics(
+    db: AsyncSession, current_user: User, dataset_ids: List[UUID]
+) -> Dict[UUID, Dict[str, Any]]:
+    if not dataset_ids:
+        return {}
+
+    records_count = await datasets.count_records_by_dataset_ids(db, dataset_ids)
+    responses_count = await datasets.count_responses_by_dataset_ids_and_user_id_group_by_status(
+        db, dataset_ids, current_user.id
+    )
+
+    metrics = {}
+    for dataset_id in dataset_ids:
+        dataset_responses_count = responses_count.get(dataset_id, {})
+        metrics[dataset_id] = {
+            "records": {
+                "count": records_count.get(dataset_id, 0),
+            },
+            "responses": {
+                "count": sum(dataset_responses_count.values()),
+                "submitted": dataset_responses_count.get(ResponseStatus.submitted, 0),
+                "discarded": dataset_responses_count.get(ResponseStatus.discarded, 0),
+                "draft": dataset_responses_count.get(ResponseStatus.draft, 0),
+            },
+        }
+
+    return metrics
+
+
 @router.get("/me/datasets", response_model=Datasets)
 async def list_current_user_datasets(
     *,
@@ -104,18 +146,28 @@ async def list_current_user_datasets(
 ):
     await authorize(current_user, DatasetPolicyV1.list(workspace_id))
 
-    if not workspace_id:
-        if current_user.is_owner:
-            dataset_list = await datasets.list_datasets(db)
-        else:
-            await current_user.awaitable_attrs.datasets
-            dataset_list = current_user.datasets
-    else:
-        dataset_list = await datasets.list_datasets_by_workspace_id(db, workspace_id)
+    dataset_list = await _list_current_user_datasets(db, current_user, workspace_id)
 
     return Datasets(items=dataset_list)
 
 
+@router.get("/me/datasets/metrics", response_model=DatasetsMetrics)
+async def list_current_user_datasets_metrics(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    workspace_id: Optional[UUID] = None,
+    current_user: User = Security(auth.get_current_user),
+):
+    await authorize(current_user, DatasetPolicyV1.list(workspace_id))
+
+    dataset_list = await _list_current_user_datasets(db, current_user, workspace_id)
+    metrics = await _get_current_user_datasets_metrics(db, current_user, [dataset.id for dataset in dataset_list])
+
+    return DatasetsMetrics(
+        items=[{"dataset_id": dataset.id, **metrics[dataset.id]} for dataset in dataset_list],
+    )
+
+
 @router.get("/datasets/{dataset_id}/fields", response_model=Fields)
 async def list_dataset_fields(
     *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
@@ -183,23 +235,9 @@ async def get_current_user_dataset_metrics(
 
     await authorize(current_user, DatasetPolicyV1.get(dataset))
 
-    return {
-        "records": {
-            "count": await datasets.count_records_by_dataset_id(db, dataset_id),
-        },
-        "responses": {
-            "count": await datasets.count_responses_by_dataset_id_and_user_id(db, dataset_id, current_user.id),
-            "submitted": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus(ResponseStatusFilter.submitted)
-            ),
-            "discarded": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus(ResponseStatusFilter.discarded)
-            ),
-            "draft": await datasets.count_responses_by_dataset_id_and_user_id(
-                db, dataset_id, current_user.id, ResponseStatus(ResponseStatusFilter.draft)
-            ),
-        },
-    }
+    metrics = await _get_current_user_datasets_metrics(db, current_user, [dataset_id])
+
+    return metrics[dataset_id]
 
 
 @router.post("/datasets", status_code=status.HTTP_201_CREATED, response_model=Dataset)
@@ -274,6 +274,8 @@ async def _get_search_responses(
 
         if filters:
             similarity_search_params["filter"] = _to_search_engine_filter(filters, user=user)
+        if vector_query.num_candidates:
+            similarity_search_params["num_candidates"] = vector_query.num_candidates
 
         return await search_engine.similarity_search(**similarity_search_params)
     else:
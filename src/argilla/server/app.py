@@ -22,7 +22,6 @@ import tempfile
 from pathlib import Path
 
 import backoff
-from brotli_asgi import BrotliMiddleware
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.middleware.cors import CORSMiddleware
@@ -31,6 +30,7 @@ from starlette.responses import RedirectResponse
 from argilla import __version__ as argilla_version
 from argilla.logging import configure_logging
 from argilla.server import helpers
+from argilla.server.compression import CompressionMiddleware
 from argilla.server.constants import DEFAULT_API_KEY, DEFAULT_PASSWORD, DEFAULT_USERNAME
 from argilla.server.contexts import accounts
 from argilla.server.daos.backend import GenericElasticEngineBackend
@@ -54,6 +54,7 @@ from argilla.server.models import User
 from argilla.server.pydantic_v1 import ValidationError
 from argilla.server.pydantic_v1.errors import ConfigError
 from argilla.server.routes import api_router
+from argilla.server.search_engine import close_search_engine, open_search_engine
 from argilla.server.security import auth
 from argilla.server.settings import settings
 from argilla.server.static_rewrite import RewriteStaticFiles
@@ -86,6 +87,7 @@ def create_server_app() -> FastAPI:
         configure_app_logging,
         configure_database,
         configure_storage,
+        configure_search_engine,
         configure_telemetry,
         configure_middleware,
         configure_api_exceptions,
@@ -109,7 +111,7 @@ def configure_middleware(app: FastAPI):
         allow_headers=["*"],
     )
 
-    app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
+    app.add_middleware(CompressionMiddleware, minimum_size=512, quality=7)
 
 
 def configure_api_exceptions(api: FastAPI):
@@ -215,6 +217,16 @@ def configure_storage(app: FastAPI):
         _setup_elasticsearch()
 
 
+def configure_search_engine(app: FastAPI):
+    @app.on_event("startup")
+    async def open_shared_search_engine():
+        await open_search_engine()
+
+    @app.on_event("shutdown")
+    async def close_shared_search_engine():
+        await close_search_engine()
+
+
 def configure_app_security(app: FastAPI):
     auth.configure_app(app)
 
@@ -0,0 +1,156 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import zlib
+from typing import Callable, Optional
+
+import brotli
+from anyio import to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content types already compressed, or streamed to clients processing them line by line
+_NOT_COMPRESSIBLE_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/octet-stream",
+    "application/zip",
+    "application/gzip",
+    "image/",
+    "audio/",
+    "video/",
+    "font/woff",
+)
+
+# Supported encodings, by preference
+_ENCODINGS = ("br", "gzip")
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = set()
+    for value in accept_encoding.split(","):
+        coding, _, params = value.partition(";")
+        try:
+            if params and float(params.strip().split("=", 1)[-1]) == 0:
+                continue
+        except ValueError:
+            pass
+        accepted.add(coding.strip().lower())
+
+    for encoding in _ENCODINGS:
+        if encoding in accepted:
+            return encoding
+
+
+def _is_compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers:
+        return False
+    return not headers.get("content-type", "").startswith(_NOT_COMPRESSIBLE_CONTENT_TYPES)
+
+
+class _Compressor:
+    def __init__(self, encoding: str, quality: int):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+            self.process, self.flush, self.finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            compressor = zlib.compressobj(level=min(max(quality, 1), 9), wbits=zlib.MAX_WBITS | 16)
+            self.process, self.finish = compressor.compress, compressor.flush
+            self.flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def compress(self, body: bytes, finish: bool) -> bytes:
+        return self.process(body) + (self.finish() if finish else self.flush())
+
+
+class CompressionMiddleware:
+    """Compresses the responses with brotli, or gzip for clients not accepting brotli.
+
+    Responses already encoded or with binary and NDJSON content types are sent as they are. Streamed responses, and
+    bodies bigger than `large_body_size`, are compressed with the cheaper `large_body_quality`, and out of the event
+    loop, so big record pages and exports don't delay the rest of requests. Both are chosen once per response, as
+    the size of a stream isn't known from its first chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 512,
+        quality: int = 7,
+        large_body_size: int = 512 * 1024,
+        large_body_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.quality = quality
+        self.large_body_size = large_body_size
+        self.large_body_quality = large_body_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        responder = _CompressionResponder(self, encoding=encoding, send=send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start_message: Optional[Message] = None
+        self._compressor: Optional[_Compressor] = None
+        self._passthrough = False
+        self._is_large = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Headers are sent with the first body chunk, once it's known whether to compress the response
+            self._start_message = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            return await self._send(message)
+
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self._compressor is None:
+            headers = MutableHeaders(raw=self._start_message["headers"])
+            if (len(body) < self.middleware.minimum_size and not more_body) or not _is_compressible(headers):
+                self._passthrough = True
+                await self._send(self._start_message)
+                return await self._send(message)
+
+            self._is_large = more_body or len(body) >= self.middleware.large_body_size
+            quality = self.middleware.large_body_quality if self._is_large else self.middleware.quality
+            self._compressor = _Compressor(self.encoding, quality=quality)
+
+            body = await self._compress(body, finish=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self._send(self._start_message)
+        else:
+            body = await self._compress(body, finish=not more_body)
+
+        await self._send({**message, "body": body})
+
+    async def _compress(self, body: bytes, finish: bool) -> bytes:
+        compress: Callable[[], bytes] = lambda: self._compressor.compress(body, finish=finish)
+        if self._is_large:
+            return await to_thread.run_sync(compress)
+        return compress()
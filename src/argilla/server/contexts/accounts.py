@@ -12,15 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, FrozenSet, Hashable, List, NamedTuple, Tuple, Union
 from uuid import UUID
 
 from passlib.context import CryptContext
-from sqlalchemy import exists, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import exists, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from argilla.server.helpers import TTLCache
 from argilla.server.models import User, Workspace, WorkspaceUser
 from argilla.server.security.model import UserCreate, WorkspaceCreate, WorkspaceUserCreate
+from argilla.server.settings import settings
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,6 +31,91 @@ if TYPE_CHECKING:
 _CRYPT_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+# Users found by API key or username, and the workspaces users belong to, so authenticating and authorizing the
+# requests of the same users doesn't query the database every time. The caches are per process and only invalidated
+# by the changes made through this module in the same process: changes made by other workers, or by the users CLI
+# commands (e.g. a new role), are seen once the entries expire after `settings.auth_cache_ttl` seconds
+_USERS_CACHE = TTLCache(ttl=settings.auth_cache_ttl, max_size=settings.auth_cache_max_size)
+_WORKSPACE_USERS_CACHE = TTLCache(ttl=settings.auth_cache_ttl, max_size=settings.auth_cache_max_size)
+
+
+def clear_users_cache() -> None:
+    _USERS_CACHE.clear()
+    _WORKSPACE_USERS_CACHE.clear()
+
+
+def _invalidate_user_cache(user_id: UUID) -> None:
+    _USERS_CACHE.discard_if(lambda _, cached_user: cached_user.user["id"] == user_id)
+    _WORKSPACE_USERS_CACHE.discard_if(lambda key, _: key[0] == user_id)
+
+
+class _CachedUser(NamedTuple):
+    """The column values of a user and its workspaces, so that no instance bound to a session is cached"""
+
+    user: Dict[str, Any]
+    workspaces: Tuple[Dict[str, Any], ...]
+
+    @classmethod
+    def from_user(cls, user: User) -> "_CachedUser":
+        return cls(
+            user=_column_values(user),
+            workspaces=tuple(_column_values(workspace) for workspace in user.workspaces),
+        )
+
+    def to_user(self) -> User:
+        user = User(**self.user)
+        workspaces = [Workspace(**workspace) for workspace in self.workspaces]
+        for instance in [user, *workspaces]:
+            make_transient_to_detached(instance)
+        # Set as loaded, without the backref appending the user to the (not loaded) users of the workspaces
+        set_committed_value(user, "workspaces", workspaces)
+        return user
+
+
+def _column_values(instance: Any) -> Dict[str, Any]:
+    return {column.key: getattr(instance, column.key) for column in inspect(instance).mapper.column_attrs}
+
+
+async def _get_cached_user(
+    db: "AsyncSession", key: Hashable, get_user: Callable[[], Awaitable[Union[User, None]]]
+) -> Union[User, None]:
+    cached_user = _USERS_CACHE.get(key)
+    if cached_user is not None:
+        # Attach a new user (and its workspaces) built from the cached values to the session without querying the
+        # database
+        return await db.merge(cached_user.to_user(), load=False)
+
+    user = await get_user()
+    if user is not None:
+        _USERS_CACHE.set(key, _CachedUser.from_user(user))
+
+    return user
+
+
+class UserWorkspaces(NamedTuple):
+    ids: FrozenSet[UUID]
+    names: FrozenSet[str]
+
+
+async def get_user_workspaces(db: "AsyncSession", user_id: UUID) -> UserWorkspaces:
+    """Returns the ids and names of the workspaces the user belongs to.
+
+    Memberships are resolved with a single query and cached per user, so authorizing any number of datasets,
+    records or responses for the same user is checked in memory.
+    """
+    key = (user_id, "workspaces")
+    user_workspaces = _WORKSPACE_USERS_CACHE.get(key)
+    if user_workspaces is None:
+        workspaces = await list_workspaces_by_user_id(db, user_id)
+        user_workspaces = UserWorkspaces(
+            ids=frozenset(workspace.id for workspace in workspaces),
+            names=frozenset(workspace.name for workspace in workspaces),
+        )
+        _WORKSPACE_USERS_CACHE.set(key, user_workspaces)
+
+    return user_workspaces
+
+
 async def get_workspace_user_by_workspace_id_and_user_id(
     db: "AsyncSession", workspace_id: UUID, user_id: UUID
 ) -> Union[WorkspaceUser, None]:
@@ -42,11 +130,26 @@ async def create_workspace_user(db: "AsyncSession", workspace_user_create: Works
         user_id=workspace_user_create.user_id,
     )
     await db.refresh(workspace_user, attribute_names=["workspace", "user"])
+    _invalidate_user_cache(workspace_user.user_id)
     return workspace_user
 
 
 async def delete_workspace_user(db: "AsyncSession", workspace_user: WorkspaceUser) -> WorkspaceUser:
-    return await workspace_user.delete(db)
+    workspace_user = await workspace_user.delete(db)
+    _invalidate_user_cache(workspace_user.user_id)
+    return workspace_user
+
+
+async def exists_workspace_user_by_workspace_id_and_user_id(
+    db: "AsyncSession", workspace_id: UUID, user_id: UUID
+) -> bool:
+    return workspace_id in (await get_user_workspaces(db, user_id)).ids
+
+
+async def exists_workspace_user_by_workspace_name_and_user_id(
+    db: "AsyncSession", workspace_name: str, user_id: UUID
+) -> bool:
+    return workspace_name in (await get_user_workspaces(db, user_id)).names
 
 
 async def get_workspace_by_id(db: "AsyncSession", workspace_id: UUID) -> Workspace:
@@ -78,7 +181,10 @@ async def create_workspace(db: "AsyncSession", workspace_create: WorkspaceCreate
 
 
 async def delete_workspace(db: "AsyncSession", workspace: Workspace):
-    return await workspace.delete(db)
+    workspace = await workspace.delete(db)
+    # The workspace name can be reused by a new workspace, and its users are no longer members of it
+    clear_users_cache()
+    return workspace
 
 
 async def get_user_by_id(db: "AsyncSession", user_id: UUID) -> Union[User, None]:
@@ -107,6 +213,14 @@ async def get_user_by_api_key(db: "AsyncSession", api_key: str) -> Union[User, N
     return result.scalar_one_or_none()
 
 
+async def get_cached_user_by_api_key(db: "AsyncSession", api_key: str) -> Union[User, None]:
+    return await _get_cached_user(db, ("api_key", api_key), lambda: get_user_by_api_key(db, api_key))
+
+
+async def get_cached_user_by_username(db: "AsyncSession", username: str) -> Union[User, None]:
+    return await _get_cached_user(db, ("username", username), lambda: get_user_by_username(db, username))
+
+
 async def list_users(db: "AsyncSession") -> List[User]:
     result = await db.execute(select(User).order_by(User.inserted_at.asc()).options(selectinload(User.workspaces)))
     return result.scalars().all()
@@ -142,7 +256,9 @@ async def create_user(db: "AsyncSession", user_create: UserCreate) -> User:
 
 
 async def delete_user(db: "AsyncSession", user: User) -> User:
-    return await user.delete(db)
+    user = await user.delete(db)
+    _invalidate_user_cache(user.id)
+    return user
 
 
 async def authenticate_user(db: "AsyncSession", username: str, password: str):
@@ -476,6 +476,15 @@ async def count_records_by_dataset_id(db: "AsyncSession", dataset_id: UUID) -> i
     return result.scalar()
 
 
+async def count_records_by_dataset_ids(db: "AsyncSession", dataset_ids: List[UUID]) -> Dict[UUID, int]:
+    result = await db.execute(
+        select(Record.dataset_id, func.count(Record.id))
+        .filter(Record.dataset_id.in_(dataset_ids))
+        .group_by(Record.dataset_id)
+    )
+    return dict(result.all())
+
+
 _EXTRA_METADATA_FLAG = "extra"
 
 
@@ -972,19 +981,21 @@ async def get_response_by_record_id_and_user_id(
     return result.scalar_one_or_none()
 
 
-async def count_responses_by_dataset_id_and_user_id(
-    db: "AsyncSession", dataset_id: UUID, user_id: UUID, response_status: Optional[ResponseStatus] = None
-) -> int:
-    expressions = [Response.user_id == user_id]
-    if response_status:
-        expressions.append(Response.status == response_status)
-
+async def count_responses_by_dataset_ids_and_user_id_group_by_status(
+    db: "AsyncSession", dataset_ids: List[UUID], user_id: UUID
+) -> Dict[UUID, Dict[ResponseStatus, int]]:
     result = await db.execute(
-        select(func.count(Response.id))
-        .join(Record, and_(Record.id == Response.record_id, Record.dataset_id == dataset_id))
-        .filter(*expressions)
+        select(Record.dataset_id, Response.status, func.count(Response.id))
+        .join(Record, Record.id == Response.record_id)
+        .filter(Response.user_id == user_id, Record.dataset_id.in_(dataset_ids))
+        .group_by(Record.dataset_id, Response.status)
     )
-    return result.scalar()
+
+    responses_count = {}
+    for dataset_id, response_status, count in result.all():
+        responses_count.setdefault(dataset_id, {})[response_status] = count
+
+    return responses_count
 
 
 async def create_response(
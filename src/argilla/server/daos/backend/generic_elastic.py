@@ -26,7 +26,7 @@ from argilla.server.daos.backend.mappings.text2text import text2text_mappings
 from argilla.server.daos.backend.mappings.text_classification import text_classification_mappings
 from argilla.server.daos.backend.mappings.token_classification import token_classification_mappings
 from argilla.server.daos.backend.metrics import ALL_METRICS
-from argilla.server.daos.backend.metrics.base import ElasticsearchMetric
+from argilla.server.daos.backend.metrics.base import ElasticsearchMetric, NestedPathElasticsearchMetric
 from argilla.server.daos.backend.search.model import (
     BackendRecordsQuery,
     BaseDatasetsQuery,
@@ -145,6 +145,41 @@ class GenericElasticEngineBackend(LoggingMixin):
         index = dataset_records_index(id)
         return self.client.get_index_schema(index=index)
 
+    def is_metric_supported(self, id: str, metric_id: str, query: Optional[BackendRecordsQuery] = None) -> bool:
+        """Checks if the fields required by a metric are mapped in the dataset records index, and filled for all
+        the records matching the query.
+
+        Indices created by older versions may lack the nested fields used by recently added metrics, or have them
+        dynamically mapped as plain objects, and records logged by older versions lack their values
+        """
+        metric = self.find_metric_by_id(metric_id)
+        if not isinstance(metric, NestedPathElasticsearchMetric):
+            return True
+
+        schema = self.get_schema(id)
+        node = schema.get("mappings", {})
+        for field in metric.nested_path.split("."):
+            node = node.get("properties", {}).get(field)
+            if node is None:
+                return False
+        if node.get("type") != "nested":
+            return False
+
+        missing_values_query = metric.missing_values_query()
+        if missing_values_query is None:
+            return True
+
+        es_query = self.client.query_builder.map_2_es_query(schema=schema, query=query)["query"]
+        total, _ = self.search_records(
+            id=id,
+            query=BaseRecordsQuery(raw_query={"bool": {"filter": [es_query, missing_values_query]}}),
+            size=0,
+            enable_highlight=False,
+        )
+        if isinstance(total, dict):
+            total = total["value"]
+        return total == 0
+
     async def update_records_content(
         self,
         id: str,
@@ -210,6 +245,7 @@ class GenericElasticEngineBackend(LoggingMixin):
         limit: Optional[int] = None,
         include_fields: Optional[List[str]] = None,
         exclude_fields: Optional[List[str]] = None,
+        enable_highlight: bool = False,
     ) -> Iterable[Dict[str, Any]]:
         index = dataset_records_index(id)
 
@@ -222,7 +258,7 @@ class GenericElasticEngineBackend(LoggingMixin):
             fetch_once=sort.shuffle,
             include_fields=include_fields,
             exclude_fields=exclude_fields,
-            enable_highlight=True,
+            enable_highlight=enable_highlight,
         )
 
     def open(self, id: str):
@@ -33,6 +33,15 @@ class TokenMetrics(BaseModel):
     capitalness: Optional[str] = None
 
 
+class EntityLabelMetrics(BaseModel):
+    """Per label entity counts used to aggregate the F1 metric"""
+
+    label: str
+    correct: int
+    predicted: int
+    annotated: int
+
+
 def token_classification_mappings():
     metrics_mentions_mappings = nested_mappings_from_base_model(MentionMetrics)
     return {
@@ -57,5 +66,6 @@ def token_classification_mappings():
             "metrics.tokens": nested_mappings_from_base_model(TokenMetrics),
             "metrics.predicted.mentions": metrics_mentions_mappings,
             "metrics.annotated.mentions": metrics_mentions_mappings,
+            "metrics.entities": nested_mappings_from_base_model(EntityLabelMetrics),
         },
     }
@@ -100,6 +100,13 @@ class NestedPathElasticsearchMetric(ElasticsearchMetric):
     def compound_nested_field(self, inner_field: str) -> str:
         return f"{self.nested_path}.{inner_field}"
 
+    def missing_values_query(self) -> Optional[Dict[str, Any]]:
+        """
+        A query matching the records that should have values under the nested path but lack them, like records
+        logged before the nested field was added. ``None`` if those records cannot be told apart
+        """
+        return None
+
 
 @dataclasses.dataclass
 class HistogramAggregation(ElasticsearchMetric):
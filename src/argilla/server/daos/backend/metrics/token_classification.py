@@ -13,7 +13,7 @@
 #  limitations under the License.
 
 import dataclasses
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from argilla.server.daos.backend.metrics.base import (
     BidimensionalTermsAggregation,
@@ -86,6 +86,43 @@ class TopKMentionsConsistency(NestedPathElasticsearchMetric):
         return {"mentions": result}
 
 
+@dataclasses.dataclass
+class EntityLabelCountsAggregation(NestedPathElasticsearchMetric):
+    """Sums the per record entity counts (correct, predicted and annotated) by label"""
+
+    label_field: str
+    count_fields: Tuple[str, ...] = ("correct", "predicted", "annotated")
+    # Records with entities in any of these fields have entity counts
+    entities_fields: Tuple[str, ...] = ("predicted_as", "annotated_as")
+
+    def _inner_aggregation(self, entity_size: int = _DEFAULT_MAX_ENTITY_BUCKET) -> Dict[str, Any]:
+        return {
+            "labels": {
+                **aggregations.terms_aggregation(self.compound_nested_field(self.label_field), size=entity_size),
+                "aggs": {
+                    count_field: {"sum": {"field": self.compound_nested_field(count_field)}}
+                    for count_field in self.count_fields
+                },
+            }
+        }
+
+    def missing_values_query(self) -> Optional[Dict[str, Any]]:
+        return {
+            "bool": {
+                "should": [{"exists": {"field": field}} for field in self.entities_fields],
+                "minimum_should_match": 1,
+                "must_not": [{"nested": {"path": self.nested_path, "query": {"match_all": {}}}}],
+            }
+        }
+
+    def aggregation_result(self, aggregation_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the summed counts by label"""
+        return {
+            label: {count_field: int(counts.get(count_field) or 0) for count_field in self.count_fields}
+            for label, counts in aggregation_result.items()
+        }
+
+
 METRICS = {
     "token_frequency": NestedTermsAggregation(
         id="token_frequency",
@@ -141,6 +178,11 @@ METRICS = {
         nested_path="metrics.annotated.mentions",
         biterms=BidimensionalTermsAggregation(id="bi-dimensional", field_x="label", field_y="value"),
     ),
+    "entity_label_counts": EntityLabelCountsAggregation(
+        id="entity_label_counts",
+        nested_path="metrics.entities",
+        label_field="label",
+    ),
     "predicted_top_k_mentions_consistency": TopKMentionsConsistency(
         id="predicted_top_k_mentions_consistency",
         nested_path="metrics.predicted.mentions",
@@ -70,6 +70,13 @@ class VectorSearch(BaseModel):
         default=None,
         description="Number of elements to retrieve. " "If not provided, the request size will be used instead",
     )
+    num_candidates: Optional[int] = Field(
+        default=None,
+        gt=0,
+        le=10000,
+        description="Number of candidates per shard considered by the search. "
+        "If not provided, it's computed from the number of elements to retrieve",
+    )
 
 
 class BaseRecordsQuery(BaseQuery):
@@ -26,6 +26,7 @@ from argilla.server.daos.backend.search.model import (
     SortableField,
     SortConfig,
 )
+from argilla.server.helpers import compute_num_candidates
 
 
 class HighlightParser:
@@ -200,6 +201,7 @@ class EsQueryBuilder:
                 vector_field=self.get_vector_field_name(query.vector.name),
                 vector_value=query.vector.value,
                 top_k=query.vector.k or size,
+                num_candidates=query.vector.num_candidates,
             )
 
         return es_query
@@ -316,27 +318,18 @@ class EsQueryBuilder:
         vector_field: str,
         vector_value: List[float],
         top_k: Optional[int] = None,
+        num_candidates: Optional[int] = None,
     ):
-        def compute_num_candidates(k: int):
-            if k < 50:
-                return 500
-            if 50 <= k < 200:
-                return 100
-            if 200 <= k < 500:
-                return 2000
-            # > 500
-            return 2500
-
         top_k = top_k or 5
-        num_candidates = compute_num_candidates(top_k)
+        num_candidates = compute_num_candidates(top_k, num_candidates)
 
         es_query_filter = es_query["query"]
 
         es_query["knn"] = {
             "field": vector_field,
             "query_vector": vector_value,
-            "k": top_k,  # TODO: parameterize
-            "num_candidates": num_candidates,  # TODO: parameterize
+            "k": top_k,
+            "num_candidates": num_candidates,
             "filter": es_query_filter,
         }
         es_query.pop("sort", None)
@@ -364,7 +357,9 @@ class OpenSearchQueryBuilder(EsQueryBuilder):
         vector_field: str,
         vector_value: List[float],
         top_k: Optional[int] = None,
+        num_candidates: Optional[int] = None,
     ):
+        # OpenSearch kNN queries have no number of candidates, it's part of the index configuration (ef_search)
         top_k = top_k or 5
         knn = {
             vector_field: {
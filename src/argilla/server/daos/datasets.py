@@ -12,6 +12,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import copy
 import json
 from typing import Any, Dict, List, Optional, Type
 
@@ -27,6 +28,8 @@ from argilla.server.daos.models.datasets import (
 )
 from argilla.server.daos.records import DatasetRecordsDAO
 from argilla.server.errors import WrongTaskError
+from argilla.server.helpers import TTLCache
+from argilla.server.settings import settings as server_settings
 
 
 class DatasetsDAO:
@@ -67,12 +70,34 @@ class DatasetsDAO:
     ):
         self._es = es
         self.__records_dao__ = records_dao
+        # Dataset documents by id, so every request on a dataset doesn't search for it in the datasets index.
+        # The cached documents are only stored when no dataset document changed while fetching them (same version)
+        self._documents_cache = TTLCache(
+            ttl=server_settings.datasets_cache_ttl, max_size=server_settings.datasets_cache_max_size
+        )
+        self._documents_version = 0
         self.init()
 
     def init(self):
         """Initializes dataset dao. Used on app startup"""
         self._es.create_datasets_index()
 
+    def _find_dataset_document(self, id: str) -> Optional[Dict[str, Any]]:
+        document = self._documents_cache.get(id)
+        if document is None:
+            version = self._documents_version
+            document = self._es.find_dataset(id=id)
+            if document is None:
+                return None
+            if version == self._documents_version:
+                self._documents_cache.set(id, document)
+        # Callers may change the returned document, so the cached one is never shared
+        return copy.deepcopy(document)
+
+    def _invalidate_dataset_document(self, id: str):
+        self._documents_version += 1
+        self._documents_cache.discard(id)
+
     def list_datasets(
         self,
         workspaces: List[str] = None,
@@ -103,6 +128,7 @@ class DatasetsDAO:
             id=dataset.id,
             document=self._dataset_to_es_doc(dataset),
         )
+        self._invalidate_dataset_document(dataset.id)
         self._es.create_dataset(
             id=dataset.id,
             task=dataset.task,
@@ -115,10 +141,12 @@ class DatasetsDAO:
         dataset: DatasetDB,
     ) -> DatasetDB:
         self._es.update_dataset_document(id=dataset.id, document=self._dataset_to_es_doc(dataset))
+        self._invalidate_dataset_document(dataset.id)
         return dataset
 
     def delete_dataset(self, dataset: DatasetDB):
         self._es.delete(dataset.id)
+        self._invalidate_dataset_document(dataset.id)
 
     def find_by_name_and_workspace(self, name: str, workspace: str) -> Optional[DatasetDB]:
         return self.find_by_name(name=name, workspace=workspace)
@@ -130,7 +158,7 @@ class DatasetsDAO:
         as_dataset_class: Type[DatasetDB] = BaseDatasetDB,
     ) -> Optional[DatasetDB]:
         dataset_id = BaseDatasetDB.build_dataset_id(name=name, workspace=workspace)
-        document = self._es.find_dataset(id=dataset_id)
+        document = self._find_dataset_document(id=dataset_id)
         if document is None:
             return None
         dataset_type = as_dataset_class or BaseDatasetDB
@@ -173,7 +201,7 @@ class DatasetsDAO:
         }
 
     def copy(self, source: DatasetDB, target: DatasetDB):
-        document = self._es.find_dataset(id=source.id)
+        document = self._find_dataset_document(id=source.id)
         self._es.add_dataset_document(
             id=target.id,
             document={
@@ -181,15 +209,18 @@ class DatasetsDAO:
                 **self._dataset_to_es_doc(target),
             },
         )
+        self._invalidate_dataset_document(target.id)
         self._es.copy(id_from=source.id, id_to=target.id)
 
     def open(self, dataset: DatasetDB):
         """Make available a dataset"""
         self._es.open(dataset.id)
+        self._invalidate_dataset_document(dataset.id)
 
     def close(self, dataset: DatasetDB):
         """Close a dataset. It's mean that release all related resources, like elasticsearch index"""
         self._es.close(dataset.id)
+        self._invalidate_dataset_document(dataset.id)
 
     def save_settings(
         self,
@@ -201,6 +232,7 @@ class DatasetsDAO:
             id=dataset.id,
             document={"settings": settings.dict(exclude_none=True)},
         )
+        self._invalidate_dataset_document(dataset.id)
         return settings
 
     def _configure_vectors(self, dataset, settings):
@@ -214,7 +246,7 @@ class DatasetsDAO:
         )
 
     def load_settings(self, dataset: DatasetDB, as_class: Type[DatasetSettingsDB]) -> Optional[DatasetSettingsDB]:
-        doc = self._es.find_dataset(id=dataset.id)
+        doc = self._find_dataset_document(id=dataset.id)
         if doc and "settings" in doc:
             settings = doc["settings"]
             return as_class.parse_obj(settings) if settings else None
@@ -224,3 +256,4 @@ class DatasetsDAO:
             id=dataset.id,
             field="settings",
         )
+        self._invalidate_dataset_document(dataset.id)
@@ -138,6 +138,9 @@ class DatasetRecordsDAO:
             params=metric_params,
         )
 
+    def is_metric_supported(self, dataset: DatasetDB, metric_id: str, query: Optional[BaseRecordsQuery] = None) -> bool:
+        return self._es.is_metric_supported(id=dataset.id, metric_id=metric_id, query=query)
+
     def search_records(
         self,
         dataset: DatasetDB,
@@ -178,6 +181,7 @@ class DatasetRecordsDAO:
         id_from: Optional[str] = None,
         include_fields: Optional[Set[str]] = None,
         exclude_fields: Optional[Set[str]] = None,
+        highligth_results: bool = False,
     ) -> Iterable[Dict[str, Any]]:
         """
         Iterates over a dataset records
@@ -196,6 +200,8 @@ class DatasetRecordsDAO:
             A set of record fields to retrieve. Wildcard are allowed
         exclude_fields:
             A set of record fields to exclude. Wildcard are allowed
+        highligth_results:
+            If True, the `search_keywords` matching the query text are extracted for every record
 
         Returns
         -------
@@ -215,6 +221,7 @@ class DatasetRecordsDAO:
             limit=limit,
             include_fields=list(include_fields) if include_fields else None,
             exclude_fields=list(exclude_fields) if exclude_fields else None,
+            enable_highlight=highligth_results,
         )
 
     async def delete_records_by_query(
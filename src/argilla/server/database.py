@@ -17,6 +17,7 @@ from sqlite3 import Connection as SQLite3Connection
 from typing import TYPE_CHECKING, Generator
 
 from sqlalchemy import event, make_url
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
@@ -42,13 +43,31 @@ TAGGED_REVISIONS = OrderedDict(
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    if isinstance(dbapi_connection, SQLite3Connection):
+    if isinstance(dbapi_connection, (SQLite3Connection, AsyncAdapt_aiosqlite_connection)):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA busy_timeout={settings.database_sqlite_timeout * 1000}")
+        if settings.database_sqlite_wal_mode:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            # Safe with the write-ahead log, and avoids syncing the database file on every commit
+            cursor.execute("PRAGMA synchronous=NORMAL")
         cursor.close()
 
 
-async_engine = create_async_engine(settings.database_url)
+def _engine_options(database_url: str) -> dict:
+    # SQLite allows a single writer, so pool settings only apply to PostgreSQL
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": settings.database_pool_pre_ping,
+    }
+
+
+async_engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
 AsyncSessionLocal = async_sessionmaker(autocommit=False, expire_on_commit=False, bind=async_engine)
 
 
@@ -17,10 +17,17 @@
 Common helper functions
 """
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from argilla.server.settings import settings
 
 _LOGGER = logging.getLogger("argilla.server")
 
+# The max number of candidates per shard accepted by Elasticsearch kNN searches
+_MAX_NUM_CANDIDATES = 10000
+
 
 def unflatten_dict(data: Dict[str, Any], sep: str = ".", stop_keys: Optional[List[str]] = None) -> Dict[str, Any]:
     """
@@ -147,3 +154,70 @@ def replace_string_in_file(filename: str, string: str, replace_by: str, encoding
     with open(filename, mode="w", encoding=encoding) as f:
         data = data.replace(string, replace_by)
         f.write(data)
+
+
+def compute_num_candidates(k: int, num_candidates: Optional[int] = None) -> int:
+    """
+    Computes the number of candidates per shard an approximate kNN search considers to find the `k` nearest
+    neighbours. More candidates improve the search recall, at the cost of a slower search
+
+    Parameters
+    ----------
+    k:
+        The number of neighbours to find
+    num_candidates:
+        A number of candidates to use instead of the configured policy. Optional
+
+    Returns
+    -------
+        The number of candidates, never lower than `k`
+
+    """
+    if num_candidates is None:
+        num_candidates = max(
+            k * settings.vector_search_num_candidates_factor,
+            settings.vector_search_min_num_candidates,
+        )
+    return min(max(num_candidates, k), _MAX_NUM_CANDIDATES)
+
+
+class TTLCache:
+    """A size-bounded cache whose entries expire `ttl` seconds after being set. The least recently used
+    entries are evicted first when the cache is full. A `ttl` of 0 disables the cache."""
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        for key in [key for key, (_, value) in list(self._entries.items()) if predicate(key, value)]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
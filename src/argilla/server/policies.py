@@ -40,16 +40,12 @@ PolicyAction = Callable[[User], Awaitable[bool]]
 
 async def _exists_workspace_user_by_user_and_workspace_id(user: User, workspace_id: UUID) -> bool:
     db = async_object_session(user)
-    workspace = await accounts.get_workspace_user_by_workspace_id_and_user_id(db, workspace_id, user.id)
-    return workspace is not None
+    return await accounts.exists_workspace_user_by_workspace_id_and_user_id(db, workspace_id, user.id)
 
 
 async def _exists_workspace_user_by_user_and_workspace_name(user: User, workspace_name: str) -> bool:
     db = async_object_session(user)
-    workspace = await accounts.get_workspace_by_name(db, workspace_name)
-    if workspace is None:
-        return False
-    return await accounts.get_workspace_user_by_workspace_id_and_user_id(db, workspace.id, user.id) is not None
+    return await accounts.exists_workspace_user_by_workspace_name_and_user_id(db, workspace_name, user.id)
 
 
 class WorkspaceUserPolicy:
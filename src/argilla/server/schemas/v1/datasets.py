@@ -168,6 +168,14 @@ class Metrics(BaseModel):
     responses: ResponseMetrics
 
 
+class DatasetMetrics(Metrics):
+    dataset_id: UUID
+
+
+class DatasetsMetrics(BaseModel):
+    items: List[DatasetMetrics]
+
+
 class TextFieldSettings(BaseModel):
     type: Literal[FieldType.text]
     use_markdown: bool = False
@@ -705,6 +713,7 @@ class VectorQuery(BaseModel):
     record_id: Optional[UUID] = None
     value: Optional[List[float]] = None
     order: SimilarityOrder = SimilarityOrder.most_similar
+    num_candidates: Optional[int] = PydanticField(None, gt=0, le=10000)
 
     @root_validator(skip_on_failure=True)
     def check_required(cls, values: dict) -> dict:
@@ -12,14 +12,41 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from ..settings import settings
 from .base import *
 from .elasticsearch import ElasticSearchEngine
 from .opensearch import OpenSearchEngine
 
+_SEARCH_ENGINE: Optional[SearchEngine] = None
+
+
+async def open_search_engine() -> SearchEngine:
+    """Creates the search engine shared by all the requests served by the current process, so its client
+    connection pool is reused instead of opening new connections for each request."""
+    global _SEARCH_ENGINE
+
+    if _SEARCH_ENGINE is None:
+        _SEARCH_ENGINE = await SearchEngine.new_instance_by_name(settings.search_engine)
+
+    return _SEARCH_ENGINE
+
+
+async def close_search_engine() -> None:
+    """Closes the search engine shared by all the requests served by the current process, if any."""
+    global _SEARCH_ENGINE
+
+    if _SEARCH_ENGINE is not None:
+        search_engine, _SEARCH_ENGINE = _SEARCH_ENGINE, None
+        await search_engine.close()
+
 
 async def get_search_engine() -> AsyncGenerator[SearchEngine, None]:
+    if _SEARCH_ENGINE is not None:
+        yield _SEARCH_ENGINE
+        return
+
+    # Outside the server (e.g. cli commands) a new search engine is created and closed after its use
     async with SearchEngine.get_by_name(settings.search_engine) as engine:
         yield engine
@@ -273,8 +273,7 @@ class SearchEngine(metaclass=ABCMeta):
         return decorator
 
     @classmethod
-    @asynccontextmanager
-    async def get_by_name(cls, engine_name: str) -> AsyncGenerator["SearchEngine", None]:
+    async def new_instance_by_name(cls, engine_name: str) -> "SearchEngine":
         engine_name = engine_name.lower().strip()
 
         if engine_name not in cls.registered_classes:
@@ -282,10 +281,15 @@ class SearchEngine(metaclass=ABCMeta):
 
         engine_class = cls.registered_classes[engine_name]
 
+        return await engine_class.new_instance()
+
+    @classmethod
+    @asynccontextmanager
+    async def get_by_name(cls, engine_name: str) -> AsyncGenerator["SearchEngine", None]:
         engine = None
 
         try:
-            engine = await engine_class.new_instance()
+            engine = await cls.new_instance_by_name(engine_name)
             yield engine
         except Exception as e:
             raise e
@@ -373,5 +377,6 @@ class SearchEngine(metaclass=ABCMeta):
         max_results: int = 100,
         order: SimilarityOrder = SimilarityOrder.most_similar,
         threshold: Optional[float] = None,
+        num_candidates: Optional[int] = None,
     ) -> SearchResponses:
         pass
@@ -13,8 +13,9 @@
 #  limitations under the License.
 
 import dataclasses
+import functools
 from abc import abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 from uuid import UUID
 
 from argilla.server.enums import FieldType, MetadataPropertyType, RecordSortField, ResponseStatusFilter, SimilarityOrder
@@ -237,6 +238,22 @@ def _unify_sort_by_with_order(sort_by: List[SortBy], order: List[Order]) -> List
     return new_order
 
 
+def _forget_indices_on_not_found(method):
+    """Forgets the indices known to exist if the engine reports a missing resource, so their existence is
+    requested again to the engine (the index may have been deleted by another server process)."""
+
+    @functools.wraps(method)
+    async def wrapper(self: "BaseElasticAndOpenSearchEngine", *args, **kwargs):
+        try:
+            return await method(self, *args, **kwargs)
+        except Exception as e:
+            if getattr(e, "status_code", None) == 404:
+                self._existing_indices.clear()
+            raise
+
+    return wrapper
+
+
 @dataclasses.dataclass
 class BaseElasticAndOpenSearchEngine(SearchEngine):
     """
@@ -261,13 +278,18 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     # See https://www.elastic.co/guide/en/elasticsearch/reference/5.1/index-modules.html#dynamic-index-settings
     max_result_window: int = 500000
 
+    # Names of the indices known to exist, to avoid requesting their existence to the engine on every operation
+    _existing_indices: Set[str] = dataclasses.field(default_factory=set, init=False, repr=False)
+
     async def create_index(self, dataset: Dataset):
         settings = self._configure_index_settings()
         mappings = self._configure_index_mappings(dataset)
 
         index_name = es_index_name_for_dataset(dataset)
         await self._create_index_request(index_name, mappings, settings)
+        self._existing_indices.add(index_name)
 
+    @_forget_indices_on_not_found
     async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
         mapping = es_mapping_for_metadata_property(metadata_property)
         index_name = await self._get_index_or_raise(dataset)
@@ -277,8 +299,10 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
     async def delete_index(self, dataset: Dataset):
         index_name = es_index_name_for_dataset(dataset)
 
+        self._existing_indices.discard(index_name)
         await self._delete_index_request(index_name)
 
+    @_forget_indices_on_not_found
     async def index_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = await self._get_index_or_raise(dataset)
 
@@ -296,6 +320,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         await self._bulk_op_request(bulk_actions)
         await self._refresh_index_request(index_name)
 
+    @_forget_indices_on_not_found
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         index_name = await self._get_index_or_raise(dataset)
 
@@ -303,6 +328,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         await self._bulk_op_request(bulk_actions)
 
+    @_forget_indices_on_not_found
     async def update_record_response(self, response: Response):
         record = response.record
         index_name = await self._get_index_or_raise(record.dataset)
@@ -311,6 +337,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         await self._update_document_request(index_name, id=record.id, body={"doc": {"responses": es_responses}})
 
+    @_forget_indices_on_not_found
     async def delete_record_response(self, response: Response):
         record = response.record
         index_name = await self._get_index_or_raise(record.dataset)
@@ -319,6 +346,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             index_name, id=record.id, body={"script": f'ctx._source["responses"].remove("{response.user.username}")'}
         )
 
+    @_forget_indices_on_not_found
     async def update_record_suggestion(self, suggestion: Suggestion):
         index_name = await self._get_index_or_raise(suggestion.record.dataset)
 
@@ -330,6 +358,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             body={"doc": {"suggestions": es_suggestions}},
         )
 
+    @_forget_indices_on_not_found
     async def delete_record_suggestion(self, suggestion: Suggestion):
         index_name = await self._get_index_or_raise(suggestion.record.dataset)
 
@@ -339,6 +368,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             body={"script": f'ctx._source["suggestions"].remove("{suggestion.question.name}")'},
         )
 
+    @_forget_indices_on_not_found
     async def set_records_vectors(self, dataset: Dataset, vectors: Iterable[Vector]):
         index_name = await self._get_index_or_raise(dataset)
 
@@ -355,6 +385,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         await self._bulk_op_request(bulk_actions)
         await self._refresh_index_request(index_name)
 
+    @_forget_indices_on_not_found
     async def similarity_search(
         self,
         dataset: Dataset,
@@ -370,6 +401,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         max_results: int = 100,
         order: SimilarityOrder = SimilarityOrder.most_similar,
         threshold: Optional[float] = None,
+        num_candidates: Optional[int] = None,
     ) -> SearchResponses:
         # TODO: This block will be moved (maybe to contexts/search.py), and only filter and order arguments will be kept
         if metadata_filters:
@@ -407,6 +439,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
             k=max_results,
             excluded_id=record_id,
             query_filters=query_filters,
+            num_candidates=num_candidates,
         )
 
         return await self._process_search_response(response, threshold)
@@ -544,12 +577,14 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return search_engine_metadata
 
+    @_forget_indices_on_not_found
     async def configure_index_vectors(self, vector_settings: VectorSettings) -> None:
         index = await self._get_index_or_raise(vector_settings.dataset)
 
         mappings = self._mapping_for_vector_settings(vector_settings)
         await self.put_index_mapping_request(index, mappings)
 
+    @_forget_indices_on_not_found
     async def search(
         self,
         dataset: Dataset,
@@ -590,6 +625,7 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         return await self._process_search_response(response)
 
+    @_forget_indices_on_not_found
     async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
         index_name = await self._get_index_or_raise(metadata_property.dataset)
 
@@ -729,9 +765,13 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
     async def _get_index_or_raise(self, dataset: Dataset):
         index_name = es_index_name_for_dataset(dataset)
+        if index_name in self._existing_indices:
+            return index_name
+
         if not await self._index_exists_request(index_name):
             raise ValueError(f"Cannot access to index for dataset {dataset.id}: the specified index does not exist")
 
+        self._existing_indices.add(index_name)
         return index_name
 
     def _mapping_for_vectors_settings(self, vectors_settings: List[VectorSettings]) -> dict:
@@ -785,10 +825,12 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        num_candidates: Optional[int] = None,
     ) -> dict:
         """
         Applies the similarity search request based on a vector configuration, a vector value,
-        the `k` number of results to retrieve and an optional filter configuration to apply
+        the `k` number of results to retrieve and an optional filter configuration to apply.
+        The `num_candidates` overrides the number of candidates considered, if the engine supports it
         """
         pass
 
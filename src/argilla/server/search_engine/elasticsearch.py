@@ -18,6 +18,7 @@ from uuid import UUID
 
 from elasticsearch8 import AsyncElasticsearch, helpers
 
+from argilla.server.helpers import compute_num_candidates
 from argilla.server.models import VectorSettings
 from argilla.server.search_engine import SearchEngine
 from argilla.server.search_engine.commons import (
@@ -29,14 +30,6 @@ from argilla.server.search_engine.commons import (
 from argilla.server.settings import settings
 
 
-def _compute_num_candidates_from_k(k: int) -> int:
-    if k < 50:
-        return 500
-    elif 50 <= k < 200:
-        return 100
-    return 2000
-
-
 @SearchEngine.register(engine_name="elasticsearch")
 @dataclasses.dataclass
 class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
@@ -53,6 +46,9 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             ca_certs=settings.elasticsearch_ca_path,
             retry_on_timeout=True,
             max_retries=5,
+            connections_per_node=settings.elasticsearch_max_connections,
+            request_timeout=settings.elasticsearch_request_timeout,
+            http_compress=settings.elasticsearch_http_compress,
         )
         return cls(
             config=config,
@@ -91,12 +87,13 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        num_candidates: Optional[int] = None,
     ) -> dict:
         knn_query = {
             "field": es_field_for_vector_settings(vector_settings),
             "query_vector": value,
             "k": k,
-            "num_candidates": _compute_num_candidates_from_k(k=k),
+            "num_candidates": compute_num_candidates(k, num_candidates),
         }
 
         if bool(excluded_id) or bool(query_filters):
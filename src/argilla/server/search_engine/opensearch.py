@@ -45,6 +45,9 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
             ca_certs=settings.elasticsearch_ca_path,
             retry_on_timeout=True,
             max_retries=5,
+            maxsize=settings.elasticsearch_max_connections,
+            timeout=settings.elasticsearch_request_timeout,
+            http_compress=settings.elasticsearch_http_compress,
         )
         return cls(
             config=config,
@@ -85,7 +88,9 @@ class OpenSearchEngine(BaseElasticAndOpenSearchEngine):
         k: int,
         excluded_id: Optional[UUID] = None,
         query_filters: Optional[List[dict]] = None,
+        num_candidates: Optional[int] = None,
     ) -> dict:
+        # OpenSearch kNN queries have no number of candidates, it's part of the index configuration (ef_search)
         knn_query = {"vector": value, "k": k}
 
         if excluded_id:
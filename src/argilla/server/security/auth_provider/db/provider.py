@@ -71,7 +71,7 @@ class DBAuthProvider(AuthProvider):
         user = None
 
         if api_key:
-            user = await accounts.get_user_by_api_key(db, api_key)
+            user = await accounts.get_cached_user_by_api_key(db, api_key)
         elif token:
             user = await self.fetch_token_user(db, token)
 
@@ -97,7 +97,7 @@ class DBAuthProvider(AuthProvider):
             payload = jwt.decode(token, self.settings.secret_key, algorithms=[self.settings.algorithm])
             username: str = payload.get("sub")
             if username:
-                user = await accounts.get_user_by_username(db, username)
+                user = await accounts.get_cached_user_by_username(db, username)
                 return user
         except JWTError:
             return None
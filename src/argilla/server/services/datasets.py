@@ -135,9 +135,10 @@ class DatasetsService:
         if not await is_authorized(user, DatasetPolicy.list):
             raise ForbiddenOperationError("You don't have the necessary permissions to list datasets.")
 
-        accessible_workspace_names = [
-            ws.name for ws in (await accounts.list_workspaces(self._db) if user.is_owner else user.workspaces)
-        ]
+        if user.is_owner:
+            accessible_workspace_names = {ws.name for ws in await accounts.list_workspaces(self._db)}
+        else:
+            accessible_workspace_names = (await accounts.get_user_workspaces(self._db, user.id)).names
 
         if workspaces:
             for ws in workspaces:
@@ -145,7 +146,7 @@ class DatasetsService:
                     raise EntityNotFoundError(name=ws, type=Workspace)
             workspace_names = workspaces
         else:  # no workspaces
-            workspace_names = accessible_workspace_names
+            workspace_names = list(accessible_workspace_names)
 
         return self.__dao__.list_datasets(workspaces=workspace_names, task2dataset_map=task2dataset_map)
 
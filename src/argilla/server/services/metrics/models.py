@@ -31,13 +31,18 @@ class ServiceBaseMetric(BaseModel):
 
 class ServicePythonMetric(ServiceBaseMetric, Generic[ServiceRecord]):
     """
-    A metric definition which will be calculated using raw queried data
+    A metric definition which will be calculated using raw queried data.
+
+    If ``aggregation_id`` is defined and the dataset supports it, the metric will be computed
+    from that backend aggregation through ``apply_aggregation`` instead of scanning the records
     """
 
     records_to_fetch: Optional[int] = None
 
     shuffle_records: bool = Field(default=False)
 
+    aggregation_id: Optional[str] = None
+
     def apply(self, records: Iterable[ServiceRecord]) -> Dict[str, Any]:
         """
         ServiceBaseMetric calculation method.
@@ -53,6 +58,21 @@ class ServicePythonMetric(ServiceBaseMetric, Generic[ServiceRecord]):
         """
         raise NotImplementedError()
 
+    def apply_aggregation(self, aggregation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ServiceBaseMetric calculation method from the ``aggregation_id`` backend aggregation results.
+
+        Parameters
+        ----------
+        aggregation:
+            The aggregation results
+
+        Returns
+        -------
+            The metric result
+        """
+        raise NotImplementedError()
+
     def prepare_query(self, query: ServiceRecordsQuery):
         """Add an extra filter required for the metric"""
         return query
@@ -95,6 +95,14 @@ class MetricsService:
         if isinstance(metric, ServicePythonMetric):
             query = query or ServiceBaseRecordsQuery()
             query = metric.prepare_query(query)
+            if metric.aggregation_id and self.__dao__.is_metric_supported(dataset, metric.aggregation_id, query=query):
+                aggregation = self.__dao__.compute_metric(
+                    metric_id=metric.aggregation_id,
+                    dataset=dataset,
+                    query=query,
+                )
+                return metric.apply_aggregation(aggregation)
+
             records = self.__dao__.scan_dataset(
                 dataset,
                 search=DaoRecordsSearch(query=query, sort=SortConfig(shuffle=metric.shuffle_records)),
@@ -33,32 +33,37 @@ class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
     `"precision is the percentage of named entities found by the learning system that are correct.
     Recall is the percentage of named entities present in the corpus that are found by the system.
     A named entity is correct only if it is an exact match (...).”`
+
+    The entity counts by label are computed for each record at index time (see ``record_label_counts``),
+    so the metric is aggregated by the backend when the dataset supports it.
     """
 
-    def apply(self, records: Iterable[ServiceTokenClassificationRecord]) -> Dict[str, Any]:
-        # store entities per label in dicts
-        predicted_entities = {}
-        annotated_entities = {}
+    aggregation_id: str = Field("entity_label_counts", const=True)
 
-        # extract entities per label to dicts
+    def apply(self, records: Iterable[ServiceTokenClassificationRecord]) -> Dict[str, Any]:
+        label_counts = {}
         for rec in records:
-            if rec.prediction:
-                self._add_entities_to_dict(rec.prediction.entities, predicted_entities)
-            if rec.annotation:
-                self._add_entities_to_dict(rec.annotation.entities, annotated_entities)
+            for entry in self.record_label_counts(rec):
+                counts = label_counts.setdefault(entry["label"], {"correct": 0, "predicted": 0, "annotated": 0})
+                for key in counts:
+                    counts[key] += entry[key]
+        return self.apply_aggregation(label_counts)
+
+    def apply_aggregation(self, aggregation: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+        # only annotated labels are considered
+        annotated_labels = {label: counts for label, counts in aggregation.items() if counts["annotated"] > 0}
 
         # store precision, recall, and f1 per label
         per_label_metrics = {}
 
         annotated_total, predicted_total, correct_total = 0, 0, 0
         precision_macro, recall_macro = 0, 0
-        for label, annotated in annotated_entities.items():
-            predicted = predicted_entities.get(label, set())
-            correct = len(annotated & predicted)
+        for label, counts in annotated_labels.items():
+            correct, predicted, annotated = counts["correct"], counts["predicted"], counts["annotated"]
 
             # safe divides are used to cover the 0/0 cases
-            precision = self._safe_divide(correct, len(predicted))
-            recall = self._safe_divide(correct, len(annotated))
+            precision = self._safe_divide(correct, predicted)
+            recall = self._safe_divide(correct, annotated)
             per_label_metrics.update(
                 {
                     f"{label}_precision": precision,
@@ -67,12 +72,12 @@ class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
                 }
             )
 
-            annotated_total += len(annotated)
-            predicted_total += len(predicted)
+            annotated_total += annotated
+            predicted_total += predicted
             correct_total += correct
 
-            precision_macro += precision / len(annotated_entities)
-            recall_macro += recall / len(annotated_entities)
+            precision_macro += precision / len(annotated_labels)
+            recall_macro += recall / len(annotated_labels)
 
         # store macro and micro averaged precision, recall and f1
         averaged_metrics = {
@@ -93,6 +98,26 @@ class F1Metric(ServicePythonMetric[ServiceTokenClassificationRecord]):
 
         return {**averaged_metrics, **per_label_metrics}
 
+    @classmethod
+    def record_label_counts(cls, record: ServiceTokenClassificationRecord) -> List[Dict[str, Any]]:
+        """Computes the correct, predicted and annotated entities by label for a single record"""
+        predicted_entities = {}
+        annotated_entities = {}
+        if record.prediction:
+            cls._add_entities_to_dict(record.prediction.entities, predicted_entities)
+        if record.annotation:
+            cls._add_entities_to_dict(record.annotation.entities, annotated_entities)
+
+        return [
+            {
+                "label": label,
+                "correct": len(annotated_entities.get(label, set()) & predicted_entities.get(label, set())),
+                "predicted": len(predicted_entities.get(label, set())),
+                "annotated": len(annotated_entities.get(label, set())),
+            }
+            for label in dict.fromkeys([*predicted_entities, *annotated_entities])
+        ]
+
     @staticmethod
     def _add_entities_to_dict(entities: List[EntitySpan], dictionary: Dict[str, Set[Tuple[int, int]]]):
         """Helper function for the apply method."""
@@ -205,7 +230,7 @@ class TokenClassificationMetrics(CommonTasksMetrics[ServiceTokenClassificationRe
                     [
                         token_idx
                         for i in range(entity.start, entity.end)
-                        for token_idx in [record.span_utils.char_to_token_idx.get(i)]
+                        for token_idx in [record.span_utils.char_to_token(i)]
                         if token_idx is not None
                     ]
                 )
@@ -239,6 +264,7 @@ class TokenClassificationMetrics(CommonTasksMetrics[ServiceTokenClassificationRe
             "tokens": tokens_metrics,
             "predicted": {"mentions": cls.mentions_metrics(record, record.predicted_mentions())},
             "annotated": {"mentions": cls.mentions_metrics(record, record.annotated_mentions())},
+            "entities": F1Metric.record_label_counts(record),
         }
 
     @staticmethod
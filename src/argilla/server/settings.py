@@ -41,6 +41,15 @@ class Settings(BaseSettings):
     elasticseach: (ELASTICSEARCH env var)
         The elasticsearch endpoint for datasets persistence
 
+    elasticsearch_max_connections: (ELASTICSEARCH_MAX_CONNECTIONS env var)
+        Max number of connections to each search engine node kept open by the server process. Default=10
+
+    elasticsearch_request_timeout: (ELASTICSEARCH_REQUEST_TIMEOUT env var)
+        Timeout in seconds for the requests to the search engine. Default=10
+
+    elasticsearch_http_compress: (ELASTICSEARCH_HTTP_COMPRESS env var)
+        If True, the request bodies sent to the search engine are gzip-compressed. Default=False
+
     cors_origins: (CORS_ORIGINS env var)
         List of host patterns for CORS origin access
 
@@ -66,10 +75,52 @@ class Settings(BaseSettings):
     home_path: Optional[str] = Field(description="The home path where argilla related files will be stored")
     base_url: Optional[str] = Field(description="The default base url where server will be deployed")
     database_url: Optional[str] = Field(description="The database url that argilla will use as data store")
+    database_pool_size: int = Field(
+        default=15,
+        gt=0,
+        description="Number of database connections kept open by the server process (PostgreSQL only)",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Max number of database connections opened beyond the pool size under load (PostgreSQL only)",
+    )
+    database_pool_recycle: int = Field(
+        default=3600,
+        description="Seconds after which pooled database connections are replaced. Set it to -1 to never replace"
+        " them (PostgreSQL only)",
+    )
+    database_pool_pre_ping: bool = Field(
+        default=True,
+        description="Check that pooled database connections are alive before using them (PostgreSQL only)",
+    )
+    database_sqlite_wal_mode: bool = Field(
+        default=True,
+        description="Use the SQLite write-ahead log, so database reads don't wait for writes",
+    )
+    database_sqlite_timeout: int = Field(
+        default=15,
+        ge=0,
+        description="Seconds SQLite waits for a locked database before failing with `database is locked`",
+    )
 
     elasticsearch: str = "http://localhost:9200"
     elasticsearch_ssl_verify: bool = True
     elasticsearch_ca_path: Optional[str] = None
+    elasticsearch_max_connections: int = Field(
+        default=10,
+        gt=0,
+        description="Max number of connections to each search engine node kept open by the server process",
+    )
+    elasticsearch_request_timeout: int = Field(
+        default=10,
+        gt=0,
+        description="Timeout in seconds for the requests to the search engine",
+    )
+    elasticsearch_http_compress: bool = Field(
+        default=False,
+        description="If enabled, the request bodies sent to the search engine are gzip-compressed",
+    )
     cors_origins: List[str] = ["*"]
 
     docs_enabled: bool = True
@@ -109,6 +160,39 @@ class Settings(BaseSettings):
         " Values containing higher than this will be truncated",
     )
 
+    auth_cache_ttl: int = Field(
+        default=10,
+        ge=0,
+        description="Seconds the authenticated users and their workspaces memberships are cached for by each worker."
+        " Changes made by other workers or by the users CLI commands, like a new user role, are applied once the"
+        " cached entries expire. Set it to 0 to disable the cache",
+    )
+    auth_cache_max_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Max number of authenticated users and workspaces memberships kept in the cache",
+    )
+    vector_search_num_candidates_factor: int = Field(
+        default=5,
+        gt=0,
+        description="Number of candidates per shard considered by vector searches for each requested result",
+    )
+    vector_search_min_num_candidates: int = Field(
+        default=100,
+        gt=0,
+        description="Min number of candidates per shard considered by vector searches",
+    )
+    datasets_cache_ttl: int = Field(
+        default=5,
+        ge=0,
+        description="Seconds the (old) datasets documents are cached for. Set it to 0 to disable the cache",
+    )
+    datasets_cache_max_size: int = Field(
+        default=1000,
+        gt=0,
+        description="Max number of (old) datasets documents kept in the cache",
+    )
+
     # See also the telemetry.py module
     enable_telemetry: bool = True
     telemetry_key: str = DEFAULT_TELEMETRY_KEY
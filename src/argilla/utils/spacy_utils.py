@@ -0,0 +1,97 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import math
+import multiprocessing
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from argilla.utils.dependency import requires_dependencies
+
+if TYPE_CHECKING:
+    import spacy
+    from spacy.tokens import DocBin
+
+
+def _build_docbin(nlp: "spacy.Language", examples: List[Tuple[str, Dict[str, Any]]]) -> "DocBin":
+    from spacy.tokens import DocBin
+
+    db = DocBin(store_user_data=True)
+    # only the tokenizer is applied, as `nlp.make_doc` does, but the texts are processed in batches
+    for doc, annotations in nlp.pipe(examples, as_tuples=True, disable=nlp.pipe_names):
+        if "user_data" in annotations:
+            doc.user_data.update(annotations["user_data"])
+        if "cats" in annotations:
+            doc.cats = annotations["cats"]
+        if "ents" in annotations:
+            entities = []
+            for label, start, end in annotations["ents"]:
+                span = doc.char_span(start, end, label=label)
+                # There is a misalignment between record tokenization and spaCy tokenization
+                if span is None:
+                    # TODO(@dcfidalgo): Do we want to warn and continue or should we stop the training set generation?
+                    raise ValueError(
+                        "The following annotation does not align with the tokens"
+                        " produced by the provided spacy language model:"
+                        f" {(label, doc.text[start:end])}, {list(doc)}"
+                    )
+                entities.append(span)
+            doc.ents = entities
+        db.add(doc)
+    return db
+
+
+def _build_docbin_bytes(nlp: "spacy.Language", examples: List[Tuple[str, Dict[str, Any]]]) -> bytes:
+    return _build_docbin(nlp, examples).to_bytes()
+
+
+@requires_dependencies("spacy")
+def docbin_from_examples(
+    nlp: "spacy.Language", examples: List[Tuple[str, Dict[str, Any]]], n_process: int = 1
+) -> "DocBin":
+    """Builds a `spacy.tokens.DocBin` out of texts and their annotations, as in
+    https://spacy.io/usage/training#training-data.
+
+    The texts are tokenized with `nlp`, without running any of its pipeline components. With more than one
+    process, each process builds the `DocBin` of a contiguous shard of the examples, and the shards are
+    merged in order, so the `Doc` objects keep the order of the examples.
+
+    Args:
+        nlp: The spaCy language used to tokenize the texts.
+        examples: A list of tuples with the text and a dict with its annotations: the `cats`, the `ents` as
+            `(label, start char idx, end char idx)` tuples and/or the `user_data` of the `Doc`.
+        n_process: The number of processes used to build the `DocBin`. -1 means using all the CPUs.
+
+    Returns:
+        The `DocBin` with one `Doc` per example.
+
+    Raises:
+        ValueError: If an entity span is not aligned with the tokens produced by `nlp`.
+    """
+    from spacy.tokens import DocBin
+
+    if n_process == -1:
+        n_process = multiprocessing.cpu_count()
+    n_process = min(n_process, len(examples))
+    if n_process <= 1:
+        return _build_docbin(nlp, examples)
+
+    shard_size = math.ceil(len(examples) / n_process)
+    shards = [examples[start : start + shard_size] for start in range(0, len(examples), shard_size)]
+    with multiprocessing.Pool(len(shards)) as pool:
+        shards_bytes = pool.starmap(_build_docbin_bytes, [(nlp, shard) for shard in shards])
+
+    db = DocBin(store_user_data=True)
+    for shard_bytes in shards_bytes:
+        db.merge(DocBin(store_user_data=True).from_bytes(shard_bytes))
+    return db
@@ -14,12 +14,17 @@
 #  limitations under the License.
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 
 class SpanUtils:
     """Holds utility methods to work with a tokenized text and entity spans.
 
     Spans must be tuples containing the label (str), start char idx (int), and end char idx (int).
 
+    Token boundaries are kept in two compact, sorted integer arrays, and all the span lookups are
+    binary searches over them. The dictionary views of the token/char mappings are only built on demand.
+
     Args:
         text: The text the spans refer to.
         tokens: The tokens of the text.
@@ -28,31 +33,27 @@ class SpanUtils:
     def __init__(self, text: str, tokens: List[str]):
         self._text, self._tokens = text, tokens
 
-        self._token_to_char_idx: Dict[int, Tuple[int, int]] = {}
-        self._start_to_token_idx: Dict[int, int] = {}
-        self._end_to_token_idx: Dict[int, int] = {}
-        self._char_to_token_idx: Dict[int, int] = {}
-
+        starts, ends = [], []
         end_idx = 0
-        for idx, token in enumerate(tokens):
+        for token in tokens:
             start_idx = text.find(token, end_idx)
             if start_idx == -1:
                 raise ValueError(f"Token '{token}' not found in text: {text}")
             end_idx = start_idx + len(token)
 
-            self._token_to_char_idx[idx] = (start_idx, end_idx)
-            self._start_to_token_idx[start_idx] = idx
-            self._end_to_token_idx[end_idx] = idx
-            for i in range(start_idx, end_idx):
-                self._char_to_token_idx[i] = idx
+            starts.append(start_idx)
+            ends.append(end_idx)
 
             # convention: skip first white space after a token
-            try:
-                if text[end_idx] == " ":
-                    end_idx += 1
-            # reached end of text
-            except IndexError:
-                pass
+            if text[end_idx : end_idx + 1] == " ":
+                end_idx += 1
+
+        # both arrays are sorted, since tokens are searched in order along the text
+        self._starts = np.array(starts, dtype=np.int32)
+        self._ends = np.array(ends, dtype=np.int32)
+
+        self._token_to_char_idx: Optional[Dict[int, Tuple[int, int]]] = None
+        self._char_to_token_idx: Optional[Dict[int, int]] = None
 
     @property
     def text(self) -> str:
@@ -67,13 +68,66 @@ class SpanUtils:
     @property
     def token_to_char_idx(self) -> Dict[int, Tuple[int, int]]:
         """The token index to start/end char index mapping."""
+        if self._token_to_char_idx is None:
+            self._token_to_char_idx = {
+                idx: (start, end) for idx, (start, end) in enumerate(zip(self._starts.tolist(), self._ends.tolist()))
+            }
         return self._token_to_char_idx
 
     @property
     def char_to_token_idx(self) -> Dict[int, int]:
         """The char index to token index mapping."""
+        if self._char_to_token_idx is None:
+            self._char_to_token_idx = {}
+            for idx, (start, end) in enumerate(zip(self._starts.tolist(), self._ends.tolist())):
+                for i in range(start, end):
+                    self._char_to_token_idx[i] = idx
         return self._char_to_token_idx
 
+    @property
+    def _start_to_token_idx(self) -> Dict[int, int]:
+        return {start: idx for idx, start in enumerate(self._starts.tolist())}
+
+    @property
+    def _end_to_token_idx(self) -> Dict[int, int]:
+        return {end: idx for idx, end in enumerate(self._ends.tolist())}
+
+    def _lookup(self, boundaries: np.ndarray, char_idxs: List[int]) -> List[Optional[int]]:
+        """Finds the tokens whose boundary (start or end) matches exactly the given char indexes.
+
+        Args:
+            boundaries: The sorted token starts or ends.
+            char_idxs: The char indexes to look up.
+
+        Returns:
+            The token index for each char index, or None if no token boundary matches it.
+        """
+        if len(char_idxs) == 0:
+            return []
+        if len(boundaries) == 0:
+            return [None] * len(char_idxs)
+
+        queries = np.asarray(char_idxs, dtype=np.int64)
+        # the last token with a boundary <= char idx, so later tokens win as with the former dict mappings
+        token_idxs = np.searchsorted(boundaries, queries, side="right") - 1
+        found = (token_idxs >= 0) & (boundaries[np.maximum(token_idxs, 0)] == queries)
+
+        return [idx if is_found else None for idx, is_found in zip(token_idxs.tolist(), found.tolist())]
+
+    def char_to_token(self, char_idx: int) -> Optional[int]:
+        """Returns the index of the token containing the given char index.
+
+        Args:
+            char_idx: The char index.
+
+        Returns:
+            The token index, or None if the char is not part of any token (white spaces between tokens for example).
+        """
+        token_idx = int(np.searchsorted(self._starts, char_idx, side="right")) - 1
+        if token_idx >= 0 and char_idx < self._ends[token_idx]:
+            return token_idx
+        return None
+
     def validate(self, spans: List[Tuple[str, int, int]]):
         """Validates the alignment of span boundaries and tokens.
 
@@ -85,14 +139,14 @@ class SpanUtils:
         """
         not_valid_spans_errors, misaligned_spans_errors = [], []
 
-        for span in spans:
+        start_token_idxs = self._lookup(self._starts, [span[1] for span in spans])
+        end_token_idxs = self._lookup(self._ends, [span[2] for span in spans])
+
+        for span, start_token_idx, end_token_idx in zip(spans, start_token_idxs, end_token_idxs):
             char_start, char_end = span[1], span[2]
             if char_end - char_start < 1:
                 not_valid_spans_errors.append(span)
-            elif None in (
-                self._start_to_token_idx.get(char_start),
-                self._end_to_token_idx.get(char_end),
-            ):
+            elif None in (start_token_idx, end_token_idx):
                 span_str = self.text[char_start:char_end]
                 message = f"{span} - {repr(span_str)}"
                 misaligned_spans_errors.append(message)
@@ -155,10 +209,15 @@ class SpanUtils:
             if sorted_spans[i - 1][2] > sorted_spans[i][1]:
                 raise ValueError("IOB tags cannot handle overlapping spans!")
 
+        start_token_idxs = self._lookup(self._starts, [span[1] for span in spans])
+        end_token_idxs = self._lookup(self._ends, [span[2] for span in spans])
+
         tags = ["O"] * len(self.tokens)
-        for span in spans:
-            start_token_idx = self._start_to_token_idx[span[1]]
-            end_token_idx = self._end_to_token_idx[span[2]]
+        for span, start_token_idx, end_token_idx in zip(spans, start_token_idxs, end_token_idxs):
+            if start_token_idx is None:
+                raise KeyError(span[1])
+            if end_token_idx is None:
+                raise KeyError(span[2])
 
             tags[start_token_idx] = f"B-{span[0]}"
             for token_idx in range(start_token_idx + 1, end_token_idx + 1):
@@ -191,6 +250,8 @@ class SpanUtils:
         if len(tags) != len(self.tokens):
             raise ValueError("The list of tags must have the same length as the list of tokens!")
 
+        token_to_char_idx = list(zip(self._starts.tolist(), self._ends.tolist()))
+
         spans, start_idx = [], None
         for idx, tag in enumerate(tags):
             prefix, entity = get_prefix_and_entity(tag)
@@ -199,7 +260,7 @@ class SpanUtils:
                 continue
 
             if prefix == "U":
-                start_idx, end_idx = self._token_to_char_idx[idx]
+                start_idx, end_idx = token_to_char_idx[idx]
                 spans.append((entity, start_idx, end_idx))
                 start_idx = None
                 continue
@@ -207,20 +268,20 @@ class SpanUtils:
             if prefix == "L":
                 # If no start prefix, we just assume "L" == "U":
                 if start_idx is None:
-                    start_idx, end_idx = self._token_to_char_idx[idx]
+                    start_idx, end_idx = token_to_char_idx[idx]
                 else:
-                    _, end_idx = self._token_to_char_idx[idx]
+                    _, end_idx = token_to_char_idx[idx]
                 spans.append((entity, start_idx, end_idx))
                 start_idx = None
                 continue
 
             if prefix == "B":
-                start_idx, end_idx = self._token_to_char_idx[idx]
+                start_idx, end_idx = token_to_char_idx[idx]
             elif prefix == "I":
                 # If "B" is missing, we just assume "I" starts the span
                 if start_idx is None:
-                    start_idx = self._token_to_char_idx[idx][0]
-                end_idx = self._token_to_char_idx[idx][1]
+                    start_idx = token_to_char_idx[idx][0]
+                end_idx = token_to_char_idx[idx][1]
             else:
                 raise ValueError("Tags are not in the IOB or BILOU format!")
 
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import random
 import uuid
 from typing import TYPE_CHECKING, FrozenSet, List, Tuple, Union
 
@@ -21,9 +22,13 @@ from argilla.client.feedback.dataset import FeedbackDataset
 from argilla.client.feedback.metrics.agreement_metrics import (
     AgreementMetric,
     AgreementMetricResult,
+    kendall_tau_dist,
+    krippendorff_alpha,
     prepare_dataset_for_annotation_task,
 )
 from argilla.client.feedback.schemas import FeedbackRecord
+from nltk.metrics.agreement import AnnotationTask
+from nltk.metrics.distance import binary_distance, interval_distance, masi_distance
 
 from tests.factories import UserFactory, WorkspaceFactory
 
@@ -346,3 +351,53 @@ async def test_agreement_metrics_from_remote_feedback_dataset(
                 metrics_report = [metrics_report]
         assert isinstance(metrics_report, list)
         assert all([isinstance(m, AgreementMetricResult) for m in metrics_report])
+
+
+@pytest.mark.parametrize(
+    "distance, random_value",
+    [
+        (binary_distance, lambda: random.choice(["a", "b", "c"])),
+        (interval_distance, lambda: random.randint(1, 5)),
+        (masi_distance, lambda: frozenset(random.sample(["a", "b", "c", "d"], random.randint(1, 3)))),
+        (kendall_tau_dist, lambda: tuple(random.sample([1, 2, 3, 4], 4))),
+    ],
+)
+def test_krippendorff_alpha_matches_nltk(distance, random_value) -> None:
+    random.seed(42)
+    formatted_responses = []
+    for item in range(50):
+        value = random_value()
+        for user in range(4):
+            if random.random() < 0.8:
+                user_value = value if random.random() < 0.6 else random_value()
+                formatted_responses.append((f"user-{user}", f"item-{item}", user_value))
+
+    expected = AnnotationTask(data=formatted_responses, distance=distance).alpha()
+
+    assert krippendorff_alpha(formatted_responses, distance=distance) == pytest.approx(expected)
+    # custom distance functions are computed once per pair of unique values
+    assert krippendorff_alpha(formatted_responses, distance=lambda x, y: distance(x, y)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("distance, expected", [("nominal", 0.743), ("ordinal", 0.815), ("interval", 0.849)])
+def test_krippendorff_alpha_reference_values(distance: str, expected: float) -> None:
+    # Example from Krippendorff, K. (2011). Computing Krippendorff's Alpha-Reliability
+    values_by_user = [
+        [1, 2, 3, 3, 2, 1, 4, 1, 2, None, None, None],
+        [1, 2, 3, 3, 2, 2, 4, 1, 2, 5, None, 3],
+        [None, 3, 3, 3, 2, 3, 4, 2, 2, 5, 1, None],
+        [1, 2, 3, 3, 2, 4, 4, 1, 2, 5, 1, None],
+    ]
+    formatted_responses = [
+        (user, item, value)
+        for user, values in enumerate(values_by_user)
+        for item, value in enumerate(values)
+        if value is not None
+    ]
+
+    assert krippendorff_alpha(formatted_responses, distance=distance) == pytest.approx(expected, abs=1e-3)
+
+
+def test_krippendorff_alpha_with_wrong_distance() -> None:
+    with pytest.raises(ValueError, match="Distance 'ratio' is not supported"):
+        krippendorff_alpha([("user", "item", 1)], distance="ratio")
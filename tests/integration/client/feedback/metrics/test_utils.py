@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING, List, Optional, Union
 import pytest
 from argilla.client.feedback.dataset import FeedbackDataset
 from argilla.client.feedback.metrics.utils import (
+    extract_responses_and_suggestions,
     get_responses_and_suggestions_per_user,
     get_unified_responses_and_suggestions,
 )
@@ -78,6 +79,41 @@ def test_responses_and_suggestions_per_user(
         assert len(user_data["responses"]) == len(user_data["suggestions"]) == num_responses
 
 
+@pytest.mark.parametrize("question", ["question-2", "question-3", "question-4", "question-5"])
+@pytest.mark.usefixtures(
+    "feedback_dataset_guidelines",
+    "feedback_dataset_fields",
+    "feedback_dataset_questions",
+    "feedback_dataset_records_with_paired_suggestions",
+)
+def test_extract_responses_and_suggestions(
+    feedback_dataset_guidelines: str,
+    feedback_dataset_fields: List["AllowedFieldTypes"],
+    feedback_dataset_questions: List["AllowedQuestionTypes"],
+    feedback_dataset_records_with_paired_suggestions: List[FeedbackRecord],
+    question: str,
+):
+    dataset = FeedbackDataset(
+        guidelines=feedback_dataset_guidelines,
+        fields=feedback_dataset_fields,
+        questions=feedback_dataset_questions,
+    )
+    dataset.add_records(records=feedback_dataset_records_with_paired_suggestions)
+
+    extracted = extract_responses_and_suggestions(dataset, question, show_progress=False)
+
+    assert len(extracted.user_ids) == 3
+    assert len(extracted.user_codes) == len(extracted.record_idxs) == len(extracted.response_codes) == 12
+    assert len(extracted.suggestion_codes) == len(dataset)
+    assert extracted.record_idxs.tolist() == sorted(extracted.record_idxs.tolist())
+
+    per_user = extracted.per_user()
+    assert list(per_user) == extracted.user_ids
+    for user_code, user_id in enumerate(extracted.user_ids):
+        responses = [extracted.values[code] for code in extracted.response_codes[extracted.user_codes == user_code]]
+        assert per_user[user_id]["responses"] == responses
+
+
 @pytest.mark.parametrize(
     "question, expected_unified_responses, value_type, strategy",
     [
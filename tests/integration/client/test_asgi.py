@@ -14,9 +14,11 @@
 #  limitations under the License.
 
 import time
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 import argilla
+import pytest
+from argilla.client.sdk.commons.errors import NotFoundApiError
 from argilla.monitoring.asgi import (
     ArgillaLogHTTPMiddleware,
     text_classification_mapper,
@@ -25,11 +27,14 @@ from argilla.monitoring.asgi import (
 from argilla.server.models import User
 from fastapi import FastAPI
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from starlette.testclient import TestClient
 
 from tests.integration.utils import delete_ignoring_errors
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 def test_argilla_middleware_for_text_classification(argilla_user: User):
     expected_endpoint = "/predict"
@@ -181,3 +186,77 @@ def test_argilla_middleware_for_token_classification(argilla_user: User):
     df = argilla.load(expected_dataset_name)
     df = df.to_pandas()
     assert len(df) == 3
+
+
+def test_argilla_middleware_skips_responses_bigger_than_max_body_size(argilla_user: User):
+    expected_endpoint = "/predict"
+    expected_dataset_name = "mlmodel_v3_monitor_ds"
+    delete_ignoring_errors(expected_dataset_name)
+
+    app = Starlette()
+    app.add_middleware(
+        ArgillaLogHTTPMiddleware,
+        api_endpoint=expected_endpoint,
+        dataset=expected_dataset_name,
+        records_mapper=text_classification_mapper,
+        log_interval=0.1,
+        max_body_size=16,
+    )
+
+    @app.route(expected_endpoint, methods=["GET"])
+    def mock_predict(request):
+        return StreamingResponse(
+            content=iter([b'{"labels": ["A", "B"],', b' "scores": [0.9, 0.1]}']),
+            media_type="application/json",
+        )
+
+    mock = TestClient(app)
+    response = mock.get(expected_endpoint, params={"text": "The main text data"})
+    assert response.json() == {"labels": ["A", "B"], "scores": [0.9, 0.1]}
+
+    time.sleep(0.5)
+    with pytest.raises(NotFoundApiError):
+        argilla.load(expected_dataset_name)
+
+
+def test_argilla_middleware_only_captures_json_responses(mocker: "MockerFixture"):
+    mocker.patch("argilla.client.singleton.active_api")
+    submit_mock = mocker.patch.object(ArgillaLogHTTPMiddleware, "_submit")
+
+    app = Starlette()
+    app.add_middleware(
+        ArgillaLogHTTPMiddleware,
+        api_endpoint="/predict",
+        dataset="mlmodel_v3_monitor_ds",
+        records_mapper=text_classification_mapper,
+    )
+
+    @app.route("/predict", methods=["GET"])
+    def mock_predict(request):
+        if request.query_params.get("format") == "text":
+            return PlainTextResponse("A")
+        return JSONResponse(content={"labels": ["A", "B"], "scores": [0.9, 0.1]})
+
+    mock = TestClient(app)
+    mock.get("/predict", params={"text": "The main text data", "format": "text"})
+    submit_mock.assert_not_called()
+
+    mock.get("/predict", params={"text": "The main text data"})
+    submit_mock.assert_called_once()
+
+
+def test_argilla_middleware_shutdown_with_application(mocker: "MockerFixture"):
+    shutdown_spy = mocker.spy(ArgillaLogHTTPMiddleware, "shutdown")
+
+    app = Starlette()
+    app.add_middleware(
+        ArgillaLogHTTPMiddleware,
+        api_endpoint="/predict",
+        dataset="mlmodel_v3_monitor_ds",
+        records_mapper=text_classification_mapper,
+    )
+
+    with TestClient(app):
+        shutdown_spy.assert_not_called()
+
+    shutdown_spy.assert_called_once()
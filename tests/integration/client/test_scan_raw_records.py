@@ -54,6 +54,25 @@ def test_scan_records_with_filter(
         assert expected_id == TokenClassificationRecord.parse_obj(d).id
 
 
+@pytest.mark.parametrize(("highlight", "expected_keywords"), [(False, False), (True, True)])
+def test_scan_records_with_highlight(
+    mocked_client,
+    gutenberg_spacy_ner,
+    highlight: bool,
+    expected_keywords: bool,
+):
+    data = active_api().datasets.scan(
+        name=gutenberg_spacy_ner,
+        projection={"text", "search_keywords"},
+        query_text="text:the",
+        limit=10,
+        highlight=highlight,
+    )
+    data = list(data)
+    assert len(data) > 0
+    assert any(d.get("search_keywords") for d in data) is expected_keywords
+
+
 def test_scan_records_without_results(
     mocked_client,
     gutenberg_spacy_ner,
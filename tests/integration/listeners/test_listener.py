@@ -18,7 +18,7 @@ from typing import List
 import argilla as rg
 import pytest
 from argilla import RGListenerContext, listener
-from argilla.client.api import delete, log
+from argilla.client.api import delete, delete_records, log
 from argilla.client.models import Record, TextClassificationRecord
 
 
@@ -104,3 +104,71 @@ def test_listener_with_parameters(mocked_client, dataset, query, metrics, condit
         assert test.executed
         if test.error:
             raise test.error
+
+
+def test_incremental_listener_only_receives_updated_records(mocked_client):
+    dataset = "test_incremental_listener"
+    try:
+        delete(dataset)
+    except Exception:
+        pass
+
+    log(TextClassificationRecord(id=0, text="This is a text"), name=dataset)
+
+    received = []
+
+    @listener(dataset=dataset, execution_interval_in_seconds=1, incremental=True, watermark_overlap_in_seconds=0)
+    def action(records: List[Record], ctx: RGListenerContext):
+        received.append([record.id for record in records])
+
+    action.start()
+    time.sleep(1.5)
+    log(TextClassificationRecord(id=1, text="This is another text"), name=dataset)
+    time.sleep(2)
+    action.stop()
+
+    assert received == [[0], [1]]
+
+
+def test_listener_condition_with_deleted_records(mocked_client):
+    dataset = "test_listener_with_deleted_records"
+    try:
+        delete(dataset)
+    except Exception:
+        pass
+
+    log(TextClassificationRecord(id=0, text="This is a text"), name=dataset)
+
+    totals = []
+
+    @listener(dataset=dataset, execution_interval_in_seconds=1, condition=lambda search: True, with_records=False)
+    def action(ctx: RGListenerContext):
+        totals.append(ctx.search.total)
+
+    action.start()
+    time.sleep(1.5)
+    delete_records(dataset, ids=[0])
+    time.sleep(1.5)
+    action.stop()
+
+    assert totals[0] == 1
+    assert totals[-1] == 0
+
+
+def test_listener_stops_running_when_action_fails(mocked_client):
+    dataset = "test_listener_with_failing_action"
+    try:
+        delete(dataset)
+    except Exception:
+        pass
+
+    log(TextClassificationRecord(id=0, text="This is a text"), name=dataset)
+
+    @listener(dataset=dataset, execution_interval_in_seconds=1)
+    def action(records: List[Record], ctx: RGListenerContext):
+        raise ValueError("Action error")
+
+    action.start()
+    time.sleep(1.5)
+
+    assert not action.is_running()
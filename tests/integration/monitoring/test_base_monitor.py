@@ -12,13 +12,15 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import threading
 from time import sleep
 from typing import Any, Dict, List
 
+import pytest
 from argilla.client.api import Api
 from argilla.client.models import TextClassificationRecord
 from argilla.client.singleton import active_api
-from argilla.monitoring.base import BaseMonitor
+from argilla.monitoring.base import BaseMonitor, DatasetRecordsConsumer
 
 
 def test_base_monitor_shutdown(mocked_client):
@@ -63,3 +65,84 @@ def test_base_monitor_shutdown(mocked_client):
     sleep(1)  # wait for refresh
     ds = api.load(dataset)
     assert len(ds) == expected_number_of_records
+
+
+class _FakeApi:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.logged = []
+
+    def log(self, name: str, records: List[TextClassificationRecord], **kwargs):
+        sleep(self.delay)
+        self.logged.extend(records)
+
+
+def test_records_consumer_with_multiple_workers_flushes_on_pause():
+    api = _FakeApi(delay=0.01)
+    consumer = DatasetRecordsConsumer(name="mock", api=api, upload_size=32, upload_interval=10, num_workers=4)
+    consumer.start()
+
+    consumer.send([TextClassificationRecord(text=f"text {i}") for i in range(1000)])
+    consumer.pause()
+    consumer.join()
+
+    assert len(api.logged) == 1000
+    assert consumer.queue.unfinished_tasks == 0
+    assert consumer.stats == {"sent": 1000, "failed": 0, "dropped": 0}
+
+
+def test_records_consumer_drops_records_when_buffer_is_full():
+    api = _FakeApi()
+    consumer = DatasetRecordsConsumer(name="mock", api=api, buffer_size=10)
+
+    consumer.send([TextClassificationRecord(text=f"text {i}") for i in range(15)])
+    assert consumer.records_dropped == 5
+
+    consumer.start()
+    consumer.pause()
+    consumer.join()
+
+    assert len(api.logged) == 10
+    assert consumer.stats == {"sent": 10, "failed": 0, "dropped": 5}
+
+
+def test_records_consumer_with_wrong_on_full_policy():
+    with pytest.raises(ValueError, match="Wrong on_full policy"):
+        DatasetRecordsConsumer(name="mock", api=_FakeApi(), on_full="wait")
+
+
+def test_records_consumer_with_put_timeout_when_buffer_is_full():
+    consumer = DatasetRecordsConsumer(name="mock", api=_FakeApi(), buffer_size=10, on_full="block", put_timeout=0.2)
+
+    consumer.send([TextClassificationRecord(text=f"text {i}") for i in range(15)])
+
+    assert consumer.records_dropped == 5
+    assert consumer.queue.qsize() == 10
+
+
+def test_records_consumer_drops_records_sent_after_pause():
+    api = _FakeApi()
+    consumer = DatasetRecordsConsumer(name="mock", api=api, on_full="block")
+    consumer.start()
+    consumer.pause()
+    consumer.join()
+
+    consumer.send([TextClassificationRecord(text=f"text {i}") for i in range(5)])
+
+    assert api.logged == []
+    assert consumer.stats == {"sent": 0, "failed": 0, "dropped": 5}
+
+
+def test_records_consumer_releases_blocked_send_on_pause():
+    consumer = DatasetRecordsConsumer(name="mock", api=_FakeApi(), buffer_size=10, on_full="block")
+
+    sender = threading.Thread(
+        target=consumer.send, args=([TextClassificationRecord(text=f"text {i}") for i in range(15)],)
+    )
+    sender.start()
+    sleep(0.2)
+    consumer.pause()
+    sender.join(timeout=5)
+
+    assert not sender.is_alive()
+    assert consumer.records_dropped == 5
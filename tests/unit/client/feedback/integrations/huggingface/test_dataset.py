@@ -12,14 +12,29 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import gc
+from pathlib import Path
 from typing import Any, Dict
+from uuid import uuid4
 
 import pytest
 from argilla.client.feedback.dataset.local.dataset import FeedbackDataset
 from argilla.client.feedback.integrations.huggingface.dataset import HuggingFaceDatasetMixin
 from argilla.client.feedback.schemas.fields import TextField
-from argilla.client.feedback.schemas.questions import TextQuestion
+from argilla.client.feedback.schemas.metadata import (
+    FloatMetadataProperty,
+    IntegerMetadataProperty,
+    TermsMetadataProperty,
+)
+from argilla.client.feedback.schemas.questions import (
+    LabelQuestion,
+    MultiLabelQuestion,
+    RankingQuestion,
+    RatingQuestion,
+    TextQuestion,
+)
 from argilla.client.feedback.schemas.records import FeedbackRecord
+from argilla.client.feedback.schemas.vector_settings import VectorSettings
 
 
 class TestSuiteHuggingFaceDatasetMixin:
@@ -45,3 +60,127 @@ class TestSuiteHuggingFaceDatasetMixin:
         assert hf_record == {
             key: value for key, value in hf_dataset[0].items() if key in [field.name for field in dataset.fields]
         }
+
+    def test__huggingface_format_removes_arrow_files(self, tmp_path: Path, monkeypatch) -> None:
+        from datasets import config as datasets_config
+
+        monkeypatch.setattr(datasets_config, "HF_DATASETS_CACHE", tmp_path / "cache")
+
+        dataset = FeedbackDataset(
+            fields=[TextField(name="text", required=True)],
+            questions=[TextQuestion(name="question", required=True)],
+        )
+        dataset.add_records([FeedbackRecord(fields={"text": f"value {idx}"}) for idx in range(10)])
+
+        first = HuggingFaceDatasetMixin._huggingface_format(dataset=dataset)
+        second = HuggingFaceDatasetMixin._huggingface_format(dataset=dataset)
+
+        cache_dir = tmp_path / "cache" / "argilla"
+        cache_files = {Path(hf_dataset.cache_files[0]["filename"]) for hf_dataset in [first, second]}
+        assert set(cache_dir.iterdir()) == cache_files
+        assert first["text"] == second["text"] == [f"value {idx}" for idx in range(10)]
+
+        # each file is removed once its dataset is released
+        del first, second
+        gc.collect()
+        assert list(cache_dir.iterdir()) == []
+
+        examples = HuggingFaceDatasetMixin._huggingface_examples
+
+        def failing_examples(dataset):
+            yield next(examples(dataset))
+            raise RuntimeError("Error fetching records")
+
+        monkeypatch.setattr(HuggingFaceDatasetMixin, "_huggingface_examples", staticmethod(failing_examples))
+        with pytest.raises(RuntimeError, match="Error fetching records"):
+            HuggingFaceDatasetMixin._huggingface_format(dataset=dataset)
+
+        assert list(cache_dir.iterdir()) == []
+
+    def test_from_huggingface_in_batches(self, tmp_path: Path, monkeypatch) -> None:
+        import datasets
+        import huggingface_hub
+        from argilla.client.feedback.config import DatasetConfig
+
+        dataset = FeedbackDataset(
+            fields=[TextField(name="text"), TextField(name="optional-text", required=False)],
+            questions=[
+                TextQuestion(name="text-question"),
+                RatingQuestion(name="rating-question", values=[1, 2, 3]),
+                LabelQuestion(name="label-question", labels=["A", "B"]),
+                MultiLabelQuestion(name="multi-label-question", labels=["A", "B", "C"]),
+                RankingQuestion(name="ranking-question", values=["A", "B"]),
+            ],
+            metadata_properties=[
+                TermsMetadataProperty(name="terms", values=["A", "B"]),
+                IntegerMetadataProperty(name="integer", min=0, max=100),
+                FloatMetadataProperty(name="float", min=0.0, max=100.0),
+            ],
+            vectors_settings=[VectorSettings(name="vector", dimensions=2)],
+        )
+        user_ids = [uuid4(), uuid4()]
+        dataset.add_records(
+            [
+                FeedbackRecord(
+                    fields={"text": f"text {idx}", **({"optional-text": f"optional {idx}"} if idx % 2 else {})},
+                    responses=[
+                        {
+                            "user_id": user_id,
+                            "values": {
+                                "text-question": {"value": f"response {idx}"},
+                                "rating-question": {"value": (idx + user_idx) % 3 + 1},
+                                "label-question": {"value": "AB"[(idx + user_idx) % 2]},
+                                "multi-label-question": {"value": ["A", "C"][: idx % 2 + 1]},
+                                "ranking-question": {
+                                    "value": [{"value": "A", "rank": 1}, {"value": "B", "rank": user_idx + 1}]
+                                },
+                            },
+                            "status": "submitted" if user_idx else "draft",
+                        }
+                        for user_idx, user_id in enumerate(user_ids[: idx % 3])
+                    ],
+                    suggestions=[
+                        {"question_name": "rating-question", "value": 2, "type": "human"},
+                        {"question_name": "label-question", "value": "A", "score": 0.5, "agent": "model"},
+                    ][: idx % 3],
+                    metadata={"terms": "AB"[idx % 2], "integer": idx, "float": idx / 2}
+                    if idx % 4
+                    else {"terms": "A", "extra": [idx]},
+                    vectors={"vector": [float(idx), float(idx + 1)]} if idx % 2 else {},
+                    external_id=f"external-{idx}" if idx % 2 else None,
+                )
+                for idx in range(10)
+            ]
+        )
+
+        config_path = tmp_path / "argilla.yaml"
+        config_path.write_text(
+            DatasetConfig(
+                fields=dataset.fields,
+                questions=dataset.questions,
+                guidelines=dataset.guidelines,
+                metadata_properties=dataset.metadata_properties,
+                allow_extra_metadata=dataset.allow_extra_metadata,
+                vectors_settings=dataset.vectors_settings,
+            ).to_yaml()
+        )
+        hf_dataset = dataset.format_as("datasets")
+        monkeypatch.setattr(huggingface_hub, "hf_hub_download", lambda *args, **kwargs: str(config_path))
+        monkeypatch.setattr(datasets, "load_dataset", lambda *args, **kwargs: hf_dataset)
+
+        # the batches don't divide the rows evenly, so the last one is smaller
+        loaded_dataset = FeedbackDataset.from_huggingface("argilla/dataset", show_progress=False, batch_size=3)
+
+        assert len(loaded_dataset.records) == len(dataset.records)
+        for loaded_record, record in zip(loaded_dataset.records, dataset.records):
+            # the optional fields without value are loaded as `None`
+            assert loaded_record.fields == {field.name: record.fields.get(field.name) for field in dataset.fields}
+            assert [response.dict() for response in loaded_record.responses] == [
+                response.dict() for response in record.responses
+            ]
+            assert [suggestion.dict() for suggestion in loaded_record.suggestions] == [
+                suggestion.dict() for suggestion in record.suggestions
+            ]
+            assert loaded_record.metadata == record.metadata
+            assert loaded_record.vectors == record.vectors
+            assert loaded_record.external_id == record.external_id
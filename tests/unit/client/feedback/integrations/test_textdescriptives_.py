@@ -12,12 +12,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pandas as pd
 import pytest
 from argilla.client.feedback.dataset import FeedbackDataset
-from argilla.client.feedback.integrations.textdescriptives import TextDescriptivesExtractor
+from argilla.client.feedback.dataset.remote.dataset import RemoteFeedbackDataset
+from argilla.client.feedback.integrations.textdescriptives import TextDescriptivesExtractor, _load_pipeline
 from argilla.client.feedback.schemas.fields import TextField
 from argilla.client.feedback.schemas.metadata import (
     FloatMetadataProperty,
@@ -94,6 +96,21 @@ def test_extract_metrics_for_single_field_empty_field() -> None:
     assert field_metrics is None
 
 
+def test_extract_metrics_for_single_field_in_batches(records) -> None:
+    field_metrics = TextDescriptivesExtractor()._extract_metrics_for_single_field(records, "text")
+    batched_field_metrics = TextDescriptivesExtractor(batch_size=1)._extract_metrics_for_single_field(records, "text")
+    pd.testing.assert_frame_equal(batched_field_metrics, field_metrics)
+
+
+def test_extract_metrics_loads_pipeline_once(records, mocker) -> None:
+    from textdescriptives import utils
+
+    _load_pipeline.cache_clear()
+    create_spacy_pipeline_spy = mocker.spy(utils, "_create_spacy_pipeline")
+    TextDescriptivesExtractor(batch_size=1)._extract_metrics_for_single_field(records, "text")
+    create_spacy_pipeline_spy.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "records",
     [
@@ -277,6 +294,44 @@ def test_update_feedback_dataset():
     ]
 
 
+def test_update_remote_dataset_in_chunks(records) -> None:
+    remote_records = [SimpleNamespace(id=idx, fields=record.fields, metadata={}) for idx, record in enumerate(records)]
+    dataset = MagicMock(spec=RemoteFeedbackDataset)
+    dataset.fields = [TextField(name="text")]
+    dataset.records.__iter__.side_effect = lambda: iter(remote_records)
+
+    tde = TextDescriptivesExtractor(batch_size=1)
+    updated_dataset = tde.update_dataset(dataset)
+
+    assert updated_dataset == dataset
+    # The records are fetched twice, to extract the metrics and to update them, and never all of them at once
+    assert dataset.records.__iter__.call_count == 2
+    assert [call.args[0] for call in dataset.update_records.call_args_list] == [[record] for record in remote_records]
+    assert "text_flesch_reading_ease" in [call.args[0].name for call in dataset.add_metadata_property.call_args_list]
+    assert [record.metadata["text_n_tokens"] for record in remote_records] == [4, 4]
+
+
+def test_update_remote_dataset_with_empty_fields() -> None:
+    texts = ["This is a text.", "", "This is a longer text with more tokens."]
+    remote_records = [
+        SimpleNamespace(id=f"id-{idx}", fields={"text": text}, metadata={}) for idx, text in enumerate(texts)
+    ]
+    dataset = MagicMock(spec=RemoteFeedbackDataset)
+    dataset.fields = [TextField(name="text")]
+    dataset.records.__iter__.side_effect = lambda: iter(remote_records)
+
+    # With a batch size of 1, the chunk of the second record only has empty fields
+    tde = TextDescriptivesExtractor(batch_size=1)
+    tde.update_dataset(dataset)
+
+    # The metrics of the third record are not shifted onto the second one
+    assert [call.args[0] for call in dataset.update_records.call_args_list] == [
+        [remote_records[0]],
+        [remote_records[2]],
+    ]
+    assert [record.metadata.get("text_n_tokens") for record in remote_records] == [4, None, 8]
+
+
 def test_update_dataset_with_invalid_dataset():
     tde = TextDescriptivesExtractor()
     dataset = "invalid_dataset"
@@ -0,0 +1,164 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+from typing import Any, Dict, List
+
+import pytest
+from argilla.client.feedback.schemas import FeedbackRecord
+from argilla.client.feedback.unification import (
+    LabelQuestionStrategy,
+    MultiLabelQuestionStrategy,
+    RatingQuestionStrategy,
+    UnifiedValueSchema,
+)
+
+QUESTION = "question"
+
+
+def _record(*responses: Dict[str, Any]) -> FeedbackRecord:
+    return FeedbackRecord(fields={"text": "This is a text"}, responses=list(responses))
+
+
+def _response(value: Any, status: str = "submitted") -> Dict[str, Any]:
+    return {"values": {QUESTION: {"value": value}}, "status": status}
+
+
+class TestSuiteLabelQuestionStrategy:
+    def test_majority(self) -> None:
+        records = [
+            _record(_response("a"), _response("b"), _response("b")),
+            _record(_response("a"), _response("b", status="discarded"), _response("b", status="draft")),
+            _record(),
+            _record(_response("b", status="discarded")),
+        ]
+
+        unified_records = LabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        # All the records are returned, instead of the last one
+        assert unified_records is records
+        assert [record._unified_responses.get(QUESTION) for record in records] == [
+            [UnifiedValueSchema(value="b", strategy="majority")],
+            [UnifiedValueSchema(value="a", strategy="majority")],
+            None,
+            None,
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_majority_tie_break(self, seed: int) -> None:
+        records = [_record(_response("c"), _response("b"), _response("a"), _response("b"), _response("c"))]
+        # Tied values are chosen at random in order of appearance, so seeded runs unify as they used to
+        random.seed(seed)
+        expected_value = random.choice(["c", "b"])
+
+        random.seed(seed)
+        LabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        assert records[0]._unified_responses[QUESTION] == [
+            UnifiedValueSchema(value=expected_value, strategy="majority")
+        ]
+
+    def test_disagreement(self) -> None:
+        records = [
+            _record(_response("a"), _response("b", status="discarded"), _response("b"), _response("a")),
+            _record(_response("a", status="draft")),
+            _record(),
+        ]
+
+        LabelQuestionStrategy("disagreement").compute_unified_responses(records, QUESTION)
+
+        assert [record._unified_responses.get(QUESTION) for record in records] == [
+            [UnifiedValueSchema(value=value, strategy="disagreement") for value in ["a", "b", "a"]],
+            [],
+            None,
+        ]
+
+
+class TestSuiteMultiLabelQuestionStrategy:
+    @pytest.mark.parametrize(
+        "responses, expected_value",
+        [
+            ([_response(["a", "b"]), _response(["b", "a"]), _response(["b"])], ["a", "b"]),
+            ([_response(["c", "b"]), _response(["b"]), _response(["a"])], ["b"]),
+            # Responses without labels count towards the majority
+            ([_response(["a"]), _response(["a"]), _response([]), _response([])], ["a"]),
+        ],
+    )
+    def test_majority(self, responses: List[Dict[str, Any]], expected_value: List[str]) -> None:
+        records = [_record(*responses)]
+
+        unified_records = MultiLabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        assert unified_records is records
+        assert records[0]._unified_responses[QUESTION] == [
+            UnifiedValueSchema(value=expected_value, strategy="majority")
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_majority_without_majority(self, seed: int) -> None:
+        records = [_record(_response(["c", "b"]), _response(["a"]), _response(["b", "d"]), _response([]))]
+        # Without a majority, one of the labels is chosen at random in order of appearance, as it used to
+        random.seed(seed)
+        expected_value = [random.choice(["c", "b", "a", "d"])]
+
+        random.seed(seed)
+        MultiLabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        assert records[0]._unified_responses[QUESTION] == [
+            UnifiedValueSchema(value=expected_value, strategy="majority")
+        ]
+
+    def test_majority_without_labels(self) -> None:
+        records = [
+            _record(_response([]), _response([])),
+            _record(_response(["a"]), _response([])),
+            _record(),
+        ]
+
+        # Responses without any label used to raise an IndexError choosing among no labels
+        MultiLabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        assert [record._unified_responses.get(QUESTION) for record in records] == [
+            None,
+            [UnifiedValueSchema(value=["a"], strategy="majority")],
+            None,
+        ]
+
+    def test_majority_without_any_labels(self) -> None:
+        records = [_record(_response([])), _record(_response([]), _response([]))]
+
+        MultiLabelQuestionStrategy("majority").compute_unified_responses(records, QUESTION)
+
+        assert [record._unified_responses.get(QUESTION) for record in records] == [None, None]
+
+
+class TestSuiteRatingQuestionStrategy:
+    @pytest.mark.parametrize(
+        "strategy, expected_values",
+        [("mean", ["1", "3"]), ("max", ["3", "3"]), ("min", ["1", "3"]), ("majority", ["1", "3"])],
+    )
+    def test_unify_multiple_records(self, strategy: str, expected_values: List[str]) -> None:
+        records = [
+            _record(_response("1"), _response("1"), _response("3"), _response("3", status="discarded")),
+            _record(),
+            _record(_response("3")),
+        ]
+
+        RatingQuestionStrategy(strategy).compute_unified_responses(records, QUESTION)
+
+        assert [record._unified_responses.get(QUESTION) for record in records] == [
+            [UnifiedValueSchema(value=expected_values[0], strategy=strategy)],
+            None,
+            [UnifiedValueSchema(value=expected_values[1], strategy=strategy)],
+        ]
@@ -22,7 +22,7 @@ from argilla import (
     RatingQuestion,
     TextField,
 )
-from argilla.client.feedback.training.schemas.base import TrainingTask
+from argilla.client.feedback.training.schemas.base import TrainingTask, _train_test_split_indices
 from argilla.client.feedback.unification import (
     LabelQuestionUnification,
     MultiLabelQuestionUnification,
@@ -354,3 +354,78 @@ def test_training_task_repr(label_question_payload):
     label = LabelQuestion(**label_question_payload)
     task_mapping = TrainingTask.for_text_classification(text=field, label=label)
     assert isinstance(repr(task_mapping), str)
+
+
+def test_format_data_deduplicates_exploded_rows() -> None:
+    from argilla.client.feedback.dataset import FeedbackDataset
+    from argilla.client.feedback.schemas import FeedbackRecord
+
+    question = MultiLabelQuestion(name="label", labels=["a", "b", "c"])
+    dataset = FeedbackDataset(fields=[TextField(name="text")], questions=[question])
+    dataset.add_records(
+        [
+            FeedbackRecord(
+                fields={"text": text},
+                responses=[{"values": {"label": {"value": value}}, "status": "submitted"}] if value else [],
+            )
+            for text, value in [("t1", ["a", "b"]), ("t1", ["a", "b"]), ("t2", ["c"]), ("t3", None)]
+        ]
+    )
+    dataset.compute_unified_responses(question=question, strategy="majority")
+
+    task = TrainingTask.for_text_classification(text=dataset.field_by_name("text"), label=question)
+    assert task._format_data(dataset) == [{"text": "t1", "label": ["a", "b"]}, {"text": "t2", "label": ["c"]}]
+
+
+@pytest.mark.parametrize(
+    "stratify",
+    [None, ["a"] * 60 + ["b"] * 30 + ["c"] * 10, [["a", "b"], ["b", "a"], ["c"], ["a"]] * 25],
+)
+def test_train_test_split_indices(stratify) -> None:
+    train_idxs, test_idxs = _train_test_split_indices(100, train_size=0.8, seed=42, stratify=stratify)
+
+    assert (len(train_idxs), len(test_idxs)) == (80, 20)
+    assert sorted([*train_idxs, *test_idxs]) == list(range(100))
+
+    other_train_idxs, other_test_idxs = _train_test_split_indices(100, train_size=0.8, seed=42, stratify=stratify)
+    assert (train_idxs == other_train_idxs).all() and (test_idxs == other_test_idxs).all()
+
+    if stratify is not None:
+        keys = [frozenset(label) if isinstance(label, list) else label for label in stratify]
+        for key in set(keys):
+            assert sum(keys[idx] == key for idx in test_idxs) == keys.count(key) * 20 // 100
+
+
+def test_train_test_split_indices_with_empty_split() -> None:
+    with pytest.raises(ValueError, match="the train or the test split would be empty"):
+        _train_test_split_indices(3, train_size=0.1, seed=42)
+
+
+def test_execute_formatting_func_with_num_proc() -> None:
+    from argilla.client.feedback.dataset import FeedbackDataset
+    from argilla.client.feedback.schemas import FeedbackRecord
+
+    dataset = FeedbackDataset(
+        fields=[TextField(name="text")], questions=[LabelQuestion(name="label", labels=["a", "b"])]
+    )
+    dataset.add_records(
+        [
+            FeedbackRecord(
+                fields={"text": f"text {idx}"},
+                responses=[{"values": {"label": {"value": "ab"[idx % 2]}}, "status": "submitted"}] if idx % 3 else [],
+            )
+            for idx in range(10)
+        ]
+    )
+    prefix = "formatted"
+
+    def formatting_func(sample):
+        # A closure, which the standard library can't pickle to send it to other processes
+        if sample["label"]:
+            return f"{prefix} {sample['text']}", sample["label"][0]["value"]
+
+    task = TrainingTask.for_text_classification(formatting_func=formatting_func)
+    expected_output = task._execute_formatting_func(dataset, batch_size=3)
+
+    assert len(expected_output) == 6
+    assert task._execute_formatting_func(dataset, batch_size=3, num_proc=2) == expected_output
@@ -22,7 +22,9 @@ from argilla.client.feedback.utils.assignment import (
     assign_records_to_individuals,
     assign_workspaces,
     check_user,
+    check_users,
     check_workspace,
+    check_workspaces,
 )
 from argilla.client.users import User
 from argilla.client.workspaces import Workspace
@@ -51,6 +53,14 @@ def mock_check_user():
     return _mock
 
 
+@pytest.fixture
+def mock_check_users(mock_check_user):
+    def _mock(user_names):
+        return [mock_check_user(user_name) for user_name in user_names]
+
+    return _mock
+
+
 @pytest.fixture
 def mock_workspace_factory():
     def _factory(*args, **kwargs):
@@ -60,6 +70,7 @@ def mock_workspace_factory():
         def create_mock_user(user_id):
             user_mock = Mock()
             user_mock.id = user_id
+            user_mock.username = user_id.split("_")[0]
             return user_mock
 
         def add_user(user_id):
@@ -122,6 +133,36 @@ def test_check_workspace(mock_create, mock_from_name, mock_workspace, workspace_
         mock_create.assert_called_with(workspace_name)
 
 
+@patch("argilla.client.feedback.utils.assignment.check_user")
+@patch("argilla.client.users.User.list")
+def test_check_users(mock_list, mock_check_user, mock_user):
+    existing_user = Mock(spec=User)
+    existing_user.username = "existing_user"
+    mock_list.return_value = iter([existing_user])
+    mock_check_user.return_value = mock_user
+
+    result = check_users(["existing_user", mock_user, "new_user", "new_user"])
+
+    assert result == [existing_user, mock_user, mock_user, mock_user]
+    mock_list.assert_called_once()
+    mock_check_user.assert_called_once_with("new_user")
+
+
+@patch("argilla.client.workspaces.Workspace.create")
+@patch("argilla.client.workspaces.Workspace.list")
+def test_check_workspaces(mock_list, mock_create, mock_workspace):
+    existing_workspace = Mock(spec=Workspace)
+    existing_workspace.name = "existing_workspace"
+    mock_list.return_value = iter([existing_workspace])
+    mock_create.return_value = mock_workspace
+
+    result = check_workspaces(["existing_workspace", "new_workspace", "new_workspace"])
+
+    assert result == {"existing_workspace": existing_workspace, "new_workspace": mock_workspace}
+    mock_list.assert_called_once()
+    mock_create.assert_called_once_with("new_workspace")
+
+
 @pytest.mark.parametrize(
     "overlap, shuffle, expected_error, expected_result",
     [
@@ -158,11 +199,11 @@ def test_check_workspace(mock_create, mock_from_name, mock_workspace, workspace_
     ],
 )
 @patch("argilla.client.feedback.utils.assignment.random.shuffle")
-def test_assign_records_to_groups(mock_shuffle, overlap, shuffle, expected_error, expected_result, mock_check_user):
+def test_assign_records_to_groups(mock_shuffle, overlap, shuffle, expected_error, expected_result, mock_check_users):
     mock_groups = {"group1": ["user1", "user2"], "group2": ["user3", "user4"], "group3": ["user5"]}
     mock_records = ["record1", "record2", "record3", "record4", "record5", "record6"]
 
-    with patch("argilla.client.feedback.utils.assignment.check_user", side_effect=mock_check_user):
+    with patch("argilla.client.feedback.utils.assignment.check_users", side_effect=mock_check_users):
         if expected_error:
             with pytest.raises(expected_error):
                 assign_records_to_groups(mock_groups, mock_records, overlap, shuffle)
@@ -199,12 +240,12 @@ def test_assign_records_to_groups(mock_shuffle, overlap, shuffle, expected_error
 )
 @patch("argilla.client.feedback.utils.assignment.random.shuffle")
 def test_assign_records_to_individuals(
-    mock_shuffle, overlap, shuffle, expected_error, expected_result, mock_check_user
+    mock_shuffle, overlap, shuffle, expected_error, expected_result, mock_check_users
 ):
     mock_users = [f"user{i}" for i in range(1, 4)]
     mock_records = ["record1", "record2", "record3", "record4", "record5"]
 
-    with patch("argilla.client.feedback.utils.assignment.check_user", side_effect=mock_check_user):
+    with patch("argilla.client.feedback.utils.assignment.check_users", side_effect=mock_check_users):
         if expected_error:
             with pytest.raises(expected_error):
                 assign_records_to_individuals(mock_users, mock_records, overlap, shuffle)
@@ -290,12 +331,13 @@ def test_assign_records(input, overlap, shuffle, expected_result):
         ),
     ],
 )
-def test_assign_workspaces(mock_check_user, mock_workspace_factory, mock_assignments, assignment_type, expected_result):
-    with patch("argilla.client.feedback.utils.assignment.check_user", side_effect=mock_check_user):
+def test_assign_workspaces(
+    mock_check_users, mock_workspace_factory, mock_assignments, assignment_type, expected_result
+):
+    with patch("argilla.client.feedback.utils.assignment.check_users", side_effect=mock_check_users):
         with patch(
-            "argilla.client.feedback.utils.assignment.User.from_id",
-            side_effect=lambda user_id: Mock(username=user_id.split("_")[0]),
+            "argilla.client.feedback.utils.assignment.check_workspaces",
+            side_effect=lambda names: {name: mock_workspace_factory() for name in names},
         ):
-            with patch("argilla.client.feedback.utils.assignment.check_workspace", side_effect=mock_workspace_factory):
-                result = assign_workspaces(mock_assignments, assignment_type)
-                assert result == expected_result
+            result = assign_workspaces(mock_assignments, assignment_type)
+            assert result == expected_result
@@ -13,11 +13,13 @@
 #  limitations under the License.
 
 from datetime import datetime
+from typing import TYPE_CHECKING
 from unittest.mock import call
 from uuid import UUID, uuid4
 
 import pytest
 from argilla.server.constants import API_KEY_HEADER_NAME
+from argilla.server.contexts import accounts
 from argilla.server.enums import ResponseStatus
 from argilla.server.models import Response, User
 from argilla.server.search_engine import SearchEngine
@@ -34,6 +36,9 @@ from tests.factories import (
     WorkspaceUserFactory,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.asyncio
 class TestCreateCurrentUserResponsesBulk:
@@ -155,6 +160,39 @@ class TestCreateCurrentUserResponsesBulk:
         ]
         mock_search_engine.update_record_response.assert_has_calls(expected_calls)
 
+    async def test_multiple_responses_resolve_user_workspaces_once(
+        self, async_client: AsyncClient, mocker: "MockerFixture"
+    ):
+        annotator = await AnnotatorFactory.create()
+
+        records = []
+        for _ in range(2):
+            dataset = await DatasetFactory.create()
+            await RatingQuestionFactory.create(name="prompt-quality", required=True, dataset=dataset)
+            await WorkspaceUserFactory.create(user_id=annotator.id, workspace_id=dataset.workspace.id)
+            records += await RecordFactory.create_batch(3, dataset=dataset)
+
+        list_workspaces_by_user_id_spy = mocker.spy(accounts, "list_workspaces_by_user_id")
+
+        resp = await async_client.post(
+            self.url(),
+            headers={API_KEY_HEADER_NAME: annotator.api_key},
+            json={
+                "items": [
+                    {
+                        "values": {"prompt-quality": {"value": 5}},
+                        "status": ResponseStatus.submitted,
+                        "record_id": str(record.id),
+                    }
+                    for record in records
+                ],
+            },
+        )
+
+        assert resp.status_code == 200
+        assert [item["error"] for item in resp.json()["items"]] == [None] * len(records)
+        list_workspaces_by_user_id_spy.assert_called_once()
+
     async def test_response_to_create(
         self,
         async_client: AsyncClient,
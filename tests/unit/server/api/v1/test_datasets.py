@@ -791,6 +791,78 @@ class TestSuiteDatasets:
 
         assert response.status_code == 404
 
+    async def test_list_current_user_datasets_metrics(
+        self, async_client: "AsyncClient", owner: User, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        record_a = await RecordFactory.create(dataset=dataset)
+        record_b = await RecordFactory.create(dataset=dataset)
+        record_c = await RecordFactory.create(dataset=dataset)
+        await RecordFactory.create_batch(2, dataset=dataset)
+        await ResponseFactory.create(record=record_a, user=owner)
+        await ResponseFactory.create(record=record_b, user=owner, status=ResponseStatus.discarded)
+        await ResponseFactory.create(record=record_c, user=owner, status=ResponseStatus.draft)
+
+        other_dataset = await DatasetFactory.create()
+        other_record_a = await RecordFactory.create(dataset=other_dataset)
+        other_record_b = await RecordFactory.create(dataset=other_dataset)
+        await ResponseFactory.create(record=other_record_a, user=owner)
+        await ResponseFactory.create(record=other_record_b)
+
+        empty_dataset = await DatasetFactory.create()
+
+        response = await async_client.get("/api/v1/me/datasets/metrics", headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [
+                {
+                    "dataset_id": str(dataset.id),
+                    "records": {"count": 5},
+                    "responses": {"count": 3, "submitted": 1, "discarded": 1, "draft": 1},
+                },
+                {
+                    "dataset_id": str(other_dataset.id),
+                    "records": {"count": 2},
+                    "responses": {"count": 1, "submitted": 1, "discarded": 0, "draft": 0},
+                },
+                {
+                    "dataset_id": str(empty_dataset.id),
+                    "records": {"count": 0},
+                    "responses": {"count": 0, "submitted": 0, "discarded": 0, "draft": 0},
+                },
+            ]
+        }
+
+    async def test_list_current_user_datasets_metrics_without_authentication(self, async_client: "AsyncClient"):
+        response = await async_client.get("/api/v1/me/datasets/metrics")
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("role", [UserRole.annotator, UserRole.admin])
+    async def test_list_current_user_datasets_metrics_as_restricted_user_role(
+        self, async_client: "AsyncClient", role: UserRole
+    ):
+        workspace = await WorkspaceFactory.create()
+        user = await UserFactory.create(workspaces=[workspace], role=role)
+        dataset = await DatasetFactory.create(workspace=workspace)
+        record = await RecordFactory.create(dataset=dataset)
+        await ResponseFactory.create(record=record, user=user, status=ResponseStatus.discarded)
+        await DatasetFactory.create()
+
+        response = await async_client.get("/api/v1/me/datasets/metrics", headers={API_KEY_HEADER_NAME: user.api_key})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "items": [
+                {
+                    "dataset_id": str(dataset.id),
+                    "records": {"count": 1},
+                    "responses": {"count": 1, "submitted": 0, "discarded": 1, "draft": 0},
+                },
+            ]
+        }
+
     async def test_create_dataset(self, async_client: "AsyncClient", db: "AsyncSession", owner_auth_header: dict):
         workspace = await WorkspaceFactory.create()
         dataset_json = {
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Dict, Generator
 import pytest
 import pytest_asyncio
 from argilla.server.constants import API_KEY_HEADER_NAME, DEFAULT_API_KEY
+from argilla.server.contexts import accounts
 from argilla.server.daos.backend import GenericElasticEngineBackend
 from argilla.server.daos.datasets import DatasetsDAO
 from argilla.server.daos.records import DatasetRecordsDAO
@@ -110,6 +111,11 @@ def test_telemetry(mocker: "MockerFixture") -> "MagicMock":
     return mocker.spy(telemetry._CLIENT, "track_data")
 
 
+@pytest.fixture(autouse=True)
+def clear_users_cache() -> None:
+    accounts.clear_users_cache()
+
+
 @pytest.fixture(scope="session")
 def records_dao(es: GenericElasticEngineBackend):
     return DatasetRecordsDAO.get_instance(es)
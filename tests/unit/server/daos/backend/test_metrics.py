@@ -0,0 +1,139 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla.server.daos.backend import GenericElasticEngineBackend
+from argilla.server.daos.backend.metrics.token_classification import METRICS
+from argilla.server.daos.backend.query_helpers import parse_aggregations
+from argilla.server.daos.backend.search.model import BaseRecordsQuery
+from argilla.server.daos.backend.search.query_builder import EsQueryBuilder
+from argilla.server.services.tasks.token_classification.metrics import F1Metric
+from argilla.server.services.tasks.token_classification.model import ServiceTokenClassificationRecord
+
+
+def test_entity_label_counts_aggregation():
+    metric = METRICS["entity_label_counts"]
+
+    assert metric.aggregation_request() == {
+        "entity_label_counts": {
+            "meta": {"kind": "terms"},
+            "nested": {"path": "metrics.entities"},
+            "aggs": {
+                "labels": {
+                    "meta": {"kind": "terms"},
+                    "terms": {"field": "metrics.entities.label", "size": 1000, "order": {"_count": "desc"}},
+                    "aggs": {
+                        "correct": {"sum": {"field": "metrics.entities.correct"}},
+                        "predicted": {"sum": {"field": "metrics.entities.predicted"}},
+                        "annotated": {"sum": {"field": "metrics.entities.annotated"}},
+                    },
+                }
+            },
+        }
+    }
+
+    es_aggregations = {
+        "entity_label_counts": {
+            "meta": {"kind": "terms"},
+            "doc_count": 4,
+            "labels": {
+                "meta": {"kind": "terms"},
+                "buckets": [
+                    {
+                        "key": "a",
+                        "doc_count": 2,
+                        "correct": {"value": 1.0},
+                        "predicted": {"value": 1.0},
+                        "annotated": {"value": 2.0},
+                    },
+                    {
+                        "key": "b",
+                        "doc_count": 2,
+                        "correct": {"value": 1.0},
+                        "predicted": {"value": 2.0},
+                        "annotated": {"value": 1.0},
+                    },
+                ]
+            },
+        }
+    }
+    results = parse_aggregations(es_aggregations)
+
+    assert metric.aggregation_result(results[metric.id]) == {
+        "a": {"correct": 1, "predicted": 1, "annotated": 2},
+        "b": {"correct": 1, "predicted": 2, "annotated": 1},
+    }
+
+
+def test_f1_metric_from_aggregation_matches_records_scan():
+    text = "test the f1 metric of the token classification task"
+    records = [
+        ServiceTokenClassificationRecord(
+            id=idx,
+            text=text,
+            tokens=text.split(),
+            prediction={
+                "agent": "mock",
+                "entities": [{"label": "a", "start": 0, "end": 4}, {"label": "b", "start": 5, "end": 8}],
+            },
+            annotation={
+                "agent": "mock",
+                "entities": [{"label": "a", "start": 0, "end": 4}, {"label": "a", "start": 9, "end": 11}],
+            },
+        )
+        for idx in range(3)
+    ]
+    metric = F1Metric(id="F1", name="F1")
+
+    label_counts = {}
+    for record in records:
+        for entry in F1Metric.record_label_counts(record):
+            counts = label_counts.setdefault(entry["label"], {"correct": 0, "predicted": 0, "annotated": 0})
+            for key in counts:
+                counts[key] += entry[key]
+
+    assert label_counts == {
+        "a": {"correct": 3, "predicted": 3, "annotated": 6},
+        "b": {"correct": 0, "predicted": 3, "annotated": 0},
+    }
+    assert metric.apply_aggregation(label_counts) == metric.apply(records)
+    assert metric.apply(records)["a_recall"] == 0.5
+
+
+@pytest.mark.parametrize(
+    "entities_mapping, missing_values, expected",
+    [
+        (None, 0, False),
+        ({"properties": {"label": {"type": "keyword"}}}, 0, False),
+        ({"type": "nested", "properties": {"label": {"type": "keyword"}}}, 3, False),
+        ({"type": "nested", "properties": {"label": {"type": "keyword"}}}, 0, True),
+    ],
+)
+def test_entity_label_counts_support(mocker, entities_mapping, missing_values, expected):
+    metrics_properties = {"entities": entities_mapping} if entities_mapping else {}
+    client = mocker.MagicMock()
+    client.query_builder = EsQueryBuilder()
+    client.get_index_schema.return_value = {
+        "mappings": {"properties": {"metrics": {"type": "object", "properties": metrics_properties}}}
+    }
+    client.search_docs.return_value = {"total": {"value": missing_values}, "docs": []}
+    engine = GenericElasticEngineBackend(client=client, metrics={**METRICS})
+
+    assert engine.is_metric_supported("dataset", "entity_label_counts", query=BaseRecordsQuery()) is expected
+
+    if entities_mapping and entities_mapping.get("type") == "nested":
+        search_query = client.search_docs.call_args.kwargs["query"].raw_query
+        assert search_query["bool"]["filter"][1] == METRICS["entity_label_counts"].missing_values_query()
+    else:
+        client.search_docs.assert_not_called()
@@ -19,6 +19,7 @@ from argilla.server.daos.backend.search.model import (
     SortableField,
     SortConfig,
     SortOrder,
+    VectorSearch,
 )
 from argilla.server.daos.backend.search.query_builder import EsQueryBuilder
 
@@ -113,3 +114,21 @@ def test_query_builder_with_query_range():
             }
         }
     }
+
+
+@pytest.mark.parametrize(
+    ["k", "num_candidates", "expected_num_candidates"],
+    [(5, None, 100), (50, None, 250), (100, None, 500), (5000, None, 10000), (10, 20, 20), (50, 20, 50)],
+)
+def test_query_builder_with_vector_search(k: int, num_candidates: int, expected_num_candidates: int):
+    es_query = EsQueryBuilder().map_2_es_query(
+        schema=None,
+        query=TextClassificationQuery(
+            vector=VectorSearch(name="vector", value=[1.0, 2.0], k=k, num_candidates=num_candidates)
+        ),
+    )
+
+    assert es_query["knn"]["field"] == "vectors.vector.value"
+    assert es_query["knn"]["k"] == k
+    assert es_query["knn"]["num_candidates"] == expected_num_candidates
+    assert "query" not in es_query
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import TYPE_CHECKING
+
 import pytest
 from argilla.server.commons.models import TaskType
 from argilla.server.daos.backend import GenericElasticEngineBackend
@@ -21,6 +23,9 @@ from argilla.server.daos.models.datasets import BaseDatasetDB
 from argilla.server.daos.records import DatasetRecordsDAO
 from argilla.server.errors import ClosedDatasetError
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 es_wrapper = GenericElasticEngineBackend.get_instance()
 records = DatasetRecordsDAO.get_instance(es_wrapper)
 dao = DatasetsDAO.get_instance(es_wrapper, records)
@@ -86,3 +91,25 @@ def test_close_dataset():
 
     dao.open(created)
     records.search_records(dataset=created)
+
+
+def test_find_by_name_with_cached_dataset_document(mocker: "MockerFixture"):
+    dataset = "test_find_by_name_with_cached_dataset_document"
+    created = dao.create_dataset(
+        BaseDatasetDB(name=dataset, workspace="other", task=TaskType.text_classification),
+    )
+    find_dataset_spy = mocker.spy(es_wrapper, "find_dataset")
+
+    assert dao.find_by_name(created.name, workspace=created.workspace) == created
+    assert dao.find_by_name(created.name, workspace=created.workspace) == created
+    assert find_dataset_spy.call_count == 1
+
+    created.tags = {"new": "tag"}
+    dao.update_dataset(created)
+
+    assert dao.find_by_name(created.name, workspace=created.workspace).tags == {"new": "tag"}
+    assert find_dataset_spy.call_count == 2
+
+    dao.delete_dataset(created)
+
+    assert dao.find_by_name(created.name, workspace=created.workspace) is None
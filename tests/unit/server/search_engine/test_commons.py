@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import random
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import pytest
 import pytest_asyncio
@@ -57,6 +57,9 @@ from tests.factories import (
     VectorSettingsFactory,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest_asyncio.fixture(scope="function")
 async def dataset_for_pagination(opensearch: OpenSearch):
@@ -292,6 +295,23 @@ class TestBaseElasticAndOpenSearchEngine:
         ):
             await search_engine._get_index_or_raise(dataset)
 
+    async def test_get_index_or_raise_with_known_index(
+        self, search_engine: BaseElasticAndOpenSearchEngine, mocker: "MockerFixture"
+    ):
+        dataset = await DatasetFactory.create()
+        index_exists_request = mocker.patch.object(search_engine, "_index_exists_request", return_value=True)
+        mocker.patch.object(search_engine, "_delete_index_request")
+
+        index_name = es_index_name_for_dataset(dataset)
+        assert await search_engine._get_index_or_raise(dataset) == index_name
+        assert await search_engine._get_index_or_raise(dataset) == index_name
+        index_exists_request.assert_called_once_with(index_name)
+
+        await search_engine.delete_index(dataset)
+        index_exists_request.return_value = False
+        with pytest.raises(ValueError):
+            await search_engine._get_index_or_raise(dataset)
+
     async def test_create_index_for_dataset(
         self, search_engine: BaseElasticAndOpenSearchEngine, db: "AsyncSession", opensearch: OpenSearch
     ):
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import TYPE_CHECKING, Optional
+
 import pytest
 from argilla.server.search_engine import ElasticSearchEngine
 from argilla.server.search_engine.commons import ALL_RESPONSES_STATUSES_FIELD, es_index_name_for_dataset
@@ -22,6 +24,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from tests.factories import DatasetFactory, VectorSettingsFactory
 from tests.unit.server.search_engine.test_commons import refresh_dataset
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 @pytest.mark.asyncio
 @pytest.mark.skipif(not settings.search_engine == "elasticsearch", reason="Running on elasticsearch engine")
@@ -96,3 +101,42 @@ class TestElasticSearchEngine:
 
         with pytest.raises(RequestError, match="resource_already_exists_exception"):
             await search_engine.create_index(dataset)
+
+    @pytest.mark.parametrize(
+        "max_results, num_candidates, expected_num_candidates",
+        [
+            (10, None, 100),
+            (50, None, 250),
+            (10, 50, 50),
+            (100, 20, 100),
+            (10, 20000, 10000),
+        ],
+    )
+    async def test_similarity_search_with_num_candidates(
+        self,
+        elasticsearch_engine: ElasticSearchEngine,
+        mocker: "MockerFixture",
+        max_results: int,
+        num_candidates: Optional[int],
+        expected_num_candidates: int,
+    ):
+        vector_settings = await VectorSettingsFactory.create(dimensions=3)
+        mocker.patch.object(elasticsearch_engine, "_get_index_or_raise", return_value="index")
+        search_mock = mocker.patch.object(
+            elasticsearch_engine.client,
+            "search",
+            new_callable=mocker.AsyncMock,
+            return_value={"hits": {"hits": [], "total": {"value": 0}}},
+        )
+
+        await elasticsearch_engine.similarity_search(
+            dataset=vector_settings.dataset,
+            vector_settings=vector_settings,
+            value=[1.0, 2.0, 3.0],
+            max_results=max_results,
+            num_candidates=num_candidates,
+        )
+
+        knn = search_mock.call_args.kwargs["knn"]
+        assert knn["k"] == max_results
+        assert knn["num_candidates"] == expected_num_candidates
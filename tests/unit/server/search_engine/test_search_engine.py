@@ -0,0 +1,42 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from argilla.server.search_engine import SearchEngine, close_search_engine, get_search_engine, open_search_engine
+
+
+@pytest.mark.asyncio
+class TestSearchEngine:
+    async def test_get_search_engine_with_open_search_engine(self, mocker):
+        engine = mocker.AsyncMock(SearchEngine)
+        new_instance_by_name = mocker.patch.object(SearchEngine, "new_instance_by_name", return_value=engine)
+
+        assert await open_search_engine() is engine
+        try:
+            assert [search_engine async for search_engine in get_search_engine()] == [engine]
+            assert [search_engine async for search_engine in get_search_engine()] == [engine]
+            new_instance_by_name.assert_called_once()
+            engine.close.assert_not_called()
+        finally:
+            await close_search_engine()
+
+        engine.close.assert_called_once()
+
+    async def test_get_search_engine_without_open_search_engine(self, mocker):
+        engine = mocker.AsyncMock(SearchEngine)
+        new_instance_by_name = mocker.patch.object(SearchEngine, "new_instance_by_name", return_value=engine)
+
+        assert [search_engine async for search_engine in get_search_engine()] == [engine]
+        new_instance_by_name.assert_called_once()
+        engine.close.assert_called_once()
@@ -16,11 +16,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 from argilla.server.constants import DEFAULT_API_KEY
+from argilla.server.contexts import accounts
+from argilla.server.errors import UnauthorizedError
 from argilla.server.security.auth_provider.db import DBAuthProvider
 from fastapi.security import SecurityScopes
 
 if TYPE_CHECKING:
     from argilla.server.models import User
+    from pytest_mock import MockerFixture
     from sqlalchemy.ext.asyncio import AsyncSession
 
 db_auth = DBAuthProvider.new_instance()
@@ -46,6 +49,53 @@ async def test_get_user_via_api_key(db: "AsyncSession", argilla_user: "User"):
     assert user.username == "argilla"
 
 
+@pytest.mark.asyncio
+async def test_get_user_via_api_key_with_cached_user(
+    db: "AsyncSession", argilla_user: "User", mocker: "MockerFixture"
+):
+    get_user_by_api_key_spy = mocker.spy(accounts, "get_user_by_api_key")
+
+    for _ in range(2):
+        user = await db_auth.get_current_user(
+            security_scopes=security_Scopes, request=None, db=db, api_key=DEFAULT_API_KEY, token=None
+        )
+        assert user.id == argilla_user.id
+
+    get_user_by_api_key_spy.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_user_via_api_key_with_cached_user_in_new_session(db: "AsyncSession", argilla_user: "User"):
+    user = await db_auth.get_current_user(
+        security_scopes=security_Scopes, request=None, db=db, api_key=DEFAULT_API_KEY, token=None
+    )
+    # Changes to the instance loaded by a previous request are not seen through the cache
+    db.expunge_all()
+    user.first_name = "Changed"
+
+    cached_user = await db_auth.get_current_user(
+        security_scopes=security_Scopes, request=None, db=db, api_key=DEFAULT_API_KEY, token=None
+    )
+
+    assert cached_user is not user
+    assert cached_user in db
+    assert cached_user.first_name == "Argilla"
+    assert [workspace.name for workspace in cached_user.workspaces] == ["argilla"]
+
+
+@pytest.mark.asyncio
+async def test_get_user_via_api_key_with_deleted_user(db: "AsyncSession", argilla_user: "User"):
+    await db_auth.get_current_user(
+        security_scopes=security_Scopes, request=None, db=db, api_key=DEFAULT_API_KEY, token=None
+    )
+    await accounts.delete_user(db, argilla_user)
+
+    with pytest.raises(UnauthorizedError):
+        await db_auth.get_current_user(
+            security_scopes=security_Scopes, request=None, db=db, api_key=DEFAULT_API_KEY, token=None
+        )
+
+
 # Test for function fetch token
 @pytest.mark.asyncio
 async def test_fetch_token_user(db: "AsyncSession", argilla_user: "User"):
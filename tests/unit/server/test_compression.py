@@ -0,0 +1,115 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gzip
+from typing import Optional
+
+import pytest
+from argilla.server import compression
+from argilla.server.compression import CompressionMiddleware
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from starlette.testclient import TestClient
+
+LARGE_CONTENT = {"items": [{"id": idx, "text": "This is a text"} for idx in range(1000)]}
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=512, quality=7)
+
+    @app.get("/small")
+    def small():
+        return {"id": 1}
+
+    @app.get("/large")
+    def large():
+        return LARGE_CONTENT
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((b"This is a text\n" * 100 for _ in range(10)), media_type="text/plain")
+
+    @app.get("/ndjson")
+    def ndjson():
+        return StreamingResponse((b'{"id": 1}\n' * 100 for _ in range(10)), media_type="application/x-ndjson")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(
+            gzip.compress(b"This is a text" * 100), media_type="text/plain", headers={"Content-Encoding": "gzip"}
+        )
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected_encoding",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("identity", None),
+    ],
+)
+def test_compress_large_response(client: TestClient, accept_encoding: str, expected_encoding: Optional[str]):
+    response = client.get("/large", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("Content-Encoding") == expected_encoding
+    assert response.json() == LARGE_CONTENT
+
+
+@pytest.mark.parametrize("accept_encoding", ["br", "gzip"])
+def test_compress_streaming_response(client: TestClient, accept_encoding: str):
+    response = client.get("/stream", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers["Content-Encoding"] == accept_encoding
+    assert response.text == "This is a text\n" * 1000
+
+
+@pytest.mark.parametrize(
+    "path, expected_quality, expected_thread_calls",
+    [
+        ("/large", 7, 0),
+        # Streamed chunks are smaller than `large_body_size`, but the whole stream is compressed as a large body
+        ("/stream", 4, 11),
+    ],
+)
+def test_compression_settings_by_response(
+    mocker, client: TestClient, path: str, expected_quality: int, expected_thread_calls: int
+):
+    compressor_mock = mocker.patch.object(compression, "_Compressor", wraps=compression._Compressor)
+    to_thread_mock = mocker.patch.object(compression, "to_thread")
+    to_thread_mock.run_sync = mocker.AsyncMock(side_effect=lambda func: func())
+
+    response = client.get(path, headers={"Accept-Encoding": "br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    compressor_mock.assert_called_once_with("br", quality=expected_quality)
+    assert to_thread_mock.run_sync.await_count == expected_thread_calls
+
+
+@pytest.mark.parametrize("path", ["/small", "/ndjson"])
+def test_do_not_compress_response(client: TestClient, path: str):
+    response = client.get(path, headers={"Accept-Encoding": "br"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_do_not_compress_encoded_response(client: TestClient):
+    response = client.get("/encoded", headers={"Accept-Encoding": "br"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.text == "This is a text" * 100
@@ -0,0 +1,43 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+import spacy
+from argilla.utils.spacy_utils import docbin_from_examples
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_docbin_from_examples(n_process: int):
+    nlp = spacy.blank("en")
+    examples = [
+        (
+            f"text number {idx}.",
+            {"user_data": {"id": idx}, "cats": {"a": idx % 2, "b": 1 - idx % 2}, "ents": [("NUM", 12, 13)]},
+        )
+        for idx in range(5)
+    ]
+
+    docs = list(docbin_from_examples(nlp, examples, n_process=n_process).get_docs(nlp.vocab))
+
+    assert [doc.text for doc in docs] == [text for text, _ in examples]
+    assert [doc.user_data for doc in docs] == [{"id": idx} for idx in range(5)]
+    assert [doc.cats for doc in docs] == [annotations["cats"] for _, annotations in examples]
+    assert [[(ent.label_, ent.text) for ent in doc.ents] for doc in docs] == [[("NUM", str(idx))] for idx in range(5)]
+
+
+def test_docbin_from_examples_with_misaligned_entities():
+    nlp = spacy.blank("en")
+
+    with pytest.raises(ValueError, match="The following annotation does not align with the tokens"):
+        docbin_from_examples(nlp, [("hello world", {"ents": [("X", 0, 3)]})])
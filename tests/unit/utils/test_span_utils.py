@@ -42,6 +42,37 @@ def test_init():
     assert span_utils._end_to_token_idx == {4: 0, 9: 1, 10: 2}
 
 
+def test_lookups_on_long_text():
+    tokens = ["The", "parties", "agree", ",", "hereby", "\n", "to", "the", "terms", "."] * 1000
+    text = " ".join(tokens)
+    span_utils = SpanUtils(text, tokens)
+
+    expected_token_to_char_idx, start = {}, 0
+    for idx, token in enumerate(tokens):
+        expected_token_to_char_idx[idx] = (start, start + len(token))
+        start += len(token) + 1
+
+    assert span_utils.token_to_char_idx == expected_token_to_char_idx
+    for char_idx in range(len(text)):
+        assert span_utils.char_to_token(char_idx) == span_utils.char_to_token_idx.get(char_idx)
+
+    spans = [
+        ("mock", expected_token_to_char_idx[idx][0], expected_token_to_char_idx[idx + 2][1])
+        for idx in range(0, len(tokens) - 2, 3)
+    ]
+    assert span_utils.validate(spans) is None
+    assert span_utils.from_tags(span_utils.to_tags(spans)) == spans
+
+
+def test_char_to_token():
+    span_utils = SpanUtils("test this.", ["test", "this", "."])
+
+    assert span_utils.char_to_token(0) == 0
+    assert span_utils.char_to_token(4) is None
+    assert span_utils.char_to_token(9) == 2
+    assert span_utils.char_to_token(10) is None
+
+
 def test_init_value_error():
     with pytest.raises(ValueError, match="Token 'ValueError' not found in text: test error"):
         SpanUtils(text="test error", tokens=["test", "ValueError"])